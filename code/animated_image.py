@@ -0,0 +1,187 @@
+"""
+Animated Image Player for Monster Hunter
+Compatible with Pygame CE 2.5.5 and Python 3.13.7
+Streams GIF frames from a decoder thread: frames are decoded and scaled just
+ahead of playback into a small cache instead of all at once up front
+"""
+
+from settings import *
+from frame_upload import FrameUploader
+from frame_cache import FrameCache, DecoderThread
+from collections import deque
+from pathlib import Path
+
+try:
+	from PIL import Image
+	PIL_AVAILABLE = True
+except ImportError:
+	PIL_AVAILABLE = False
+
+class AnimatedImage:
+	"""Plays an animated image at its own frame timing. Memory use depends on
+	cache_size, not on the number of frames in the file.
+
+	With disk_cache enabled the first pass also writes every scaled frame to a
+	raw file next to the image; later playback maps that file and skips decoding."""
+
+	def __init__(self, path, size=(WINDOW_WIDTH, WINDOW_HEIGHT), cache_size=4, disk_cache=False, alpha=False, default_duration=0.1):
+		"""
+		Open the image and start the decoder thread
+
+		Args:
+			path: Image file (GIF or any animated format PIL can read)
+			size: Playback size (width, height), frames are scaled once on decode
+			cache_size: Number of decoded frames kept ahead of playback
+			disk_cache: Persist the scaled frames to <image folder>/cache
+			alpha: Keep per-pixel alpha (RGBA) instead of opaque RGB frames
+			default_duration: Frame duration in seconds when the file has none
+		"""
+		self.path = Path(path)
+		self.size = tuple(size)
+		self.mode = 'RGBA' if alpha else 'RGB'
+		self.default_duration = default_duration
+		self.current_frame = None
+		self.current_duration = default_duration
+		self.frame_time = 0.0
+
+		# Decoder thread and the frames it prepared: (pixel bytes, duration)
+		self.cache_size = cache_size
+		self.ready_frames = deque()
+		self.decoder = DecoderThread(self.decode_loop, 'AnimatedImageDecoder')
+		self.uploader = FrameUploader(self.size, alpha)
+
+		# Pre-scaled frame cache on disk
+		cache_name = f'{self.path.stem}_{self.size[0]}x{self.size[1]}_{self.mode.lower()}'
+		self.frame_cache = FrameCache(self.path, self.path.parent / 'cache' / f'{cache_name}.raw',
+									  self.size, self.mode, 'Animated image')
+		self.cache_durations = []
+		self.mapped_durations = []
+		self.frame_index = 0
+
+		if disk_cache and self.frame_cache.valid():
+			self.open_frame_cache()
+		elif PIL_AVAILABLE and self.path.exists():
+			if disk_cache:
+				self.frame_cache.start_build()
+			self.decoder.start()
+		else:
+			print(f"Warning: Animated image not available at {self.path}")
+
+	def open_frame_cache(self):
+		"""Map the cache file for playback"""
+		self.mapped_durations = self.frame_cache.open()['durations']
+		self.frame_index = 0
+		self.current_duration = self.mapped_durations[0]
+		self.current_frame = self.frame_cache.frame(0)
+
+	def switch_to_frame_cache(self):
+		"""Stop decoding and continue playback from the finished cache"""
+		# Retried on the next update while the decoder is still finishing a frame
+		if not self.decoder.stop(timeout=0.1):
+			return
+		self.ready_frames.clear()
+		self.open_frame_cache()
+
+	def decode_loop(self):
+		"""Decoder thread: decode, scale and queue frames just ahead of playback"""
+		try:
+			image = Image.open(self.path)
+		except Exception as e:
+			print(f"Error opening animated image {self.path}: {e}")
+			return
+
+		with image:
+			while True:
+				with self.decoder.condition:
+					self.decoder.condition.wait_for(
+						lambda: len(self.ready_frames) < self.cache_size or not self.decoder.running)
+					if not self.decoder.running:
+						return
+
+				# Scale once here so playback only copies pixels
+				frame = image.convert(self.mode).resize(self.size, Image.Resampling.LANCZOS)
+				data = frame.tobytes()
+				duration = image.info.get('duration', 0) / 1000.0 or self.default_duration
+
+				if self.frame_cache.building:
+					self.frame_cache.write(data)
+					self.cache_durations.append(duration)
+
+				with self.decoder.condition:
+					self.ready_frames.append((data, duration))
+
+				# Next frame, looping back to the start at the end of the file
+				try:
+					image.seek(image.tell() + 1)
+				except EOFError:
+					if self.frame_cache.building:
+						self.frame_cache.finish_build(durations=self.cache_durations)
+					if image.tell() == 0:
+						return  # Single frame image - nothing more to decode
+					image.seek(0)
+
+	def update(self, dt):
+		"""
+		Advance playback and swap in the next frame when it is due
+
+		Args:
+			dt: Time since the last update in seconds
+
+		Returns:
+			The current frame surface, or None until the first frame is decoded
+		"""
+		if self.frame_cache.ready and not self.frame_cache.mapped:
+			self.switch_to_frame_cache()
+
+		if self.frame_cache.mapped:
+			self.frame_time += dt
+			advanced = False
+			while self.frame_time >= self.current_duration:
+				self.frame_time -= self.current_duration
+				self.frame_index = (self.frame_index + 1) % len(self.mapped_durations)
+				self.current_duration = self.mapped_durations[self.frame_index]
+				advanced = True
+			if advanced:
+				self.current_frame = self.frame_cache.frame(self.frame_index)
+			return self.current_frame
+
+		with self.decoder.condition:
+			# Show the first frame as soon as it exists
+			if self.current_frame is None:
+				if not self.ready_frames:
+					return None
+				frame = self.ready_frames.popleft()
+				self.frame_time = 0.0
+			else:
+				self.frame_time += dt
+				frame = None
+				# Skip frames we fell behind on and keep the newest due one
+				while self.ready_frames and self.frame_time >= self.current_duration:
+					self.frame_time -= self.current_duration
+					frame = self.ready_frames.popleft()
+					self.current_duration = frame[1]
+			if frame is not None:
+				self.decoder.condition.notify()
+
+		if frame is not None:
+			data, self.current_duration = frame
+			self.current_frame = self.uploader.upload_buffer(data, self.mode)
+		return self.current_frame
+
+	def draw(self, surface, pos=(0, 0)):
+		"""Draw the current frame if one is ready"""
+		if self.current_frame:
+			surface.blit(self.current_frame, pos)
+
+	def cleanup(self):
+		"""Stop the decoder thread and release the frame cache"""
+		if self.decoder.stop():
+			# Unfinished cache build - discard the partial file
+			self.frame_cache.discard_build()
+		else:
+			print("Warning: GIF decoder did not stop, leaving its cache file open")
+
+		# Surfaces pointing into the mapping must go before it can be closed
+		if self.frame_cache.mapped:
+			self.current_frame = None
+			self.frame_cache.close()
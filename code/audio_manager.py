@@ -0,0 +1,225 @@
+"""
+Audio Manager for Monster Hunter
+Compatible with Pygame CE 2.5.5 and Python 3.13.7
+Mixer channel management: per-sound voice limits, priority stealing,
+reserved jingle channels and non-blocking music fades
+"""
+
+from settings import *
+from time import perf_counter
+
+class ManagedSound:
+	"""Sound-like handle whose play() goes through the AudioManager"""
+
+	def __init__(self, manager, name, priority=0):
+		"""
+		Args:
+			manager (AudioManager): Manager that owns the channels
+			name: Sound name in the sound bank
+			priority: Voice priority used when channels run out
+		"""
+		self.manager = manager
+		self.name = name
+		self.priority = priority
+
+	def play(self):
+		"""Play through the voice limiter"""
+		return self.manager.play_sfx(self.name, self.priority)
+
+	def stop(self):
+		"""Stop every voice of this sound"""
+		self.manager.stop_sfx(self.name)
+
+class AudioManager:
+	"""Owns the mixer channels. Sound effects are limited to voice_limit
+	voices per sound; when no channel is free the oldest voice with a lower
+	or equal priority is stolen, otherwise the new sound is dropped."""
+
+	def __init__(self, bank, channels=16, reserved=2, voice_limit=3, fade_ms=500):
+		"""
+		Set up the mixer channels
+
+		Args:
+			bank (SoundBank): Sounds and music tracks
+			channels: Total mixer channels
+			reserved: Channels kept for jingles (never used by sound effects)
+			voice_limit: Simultaneous voices allowed per sound effect
+			fade_ms: Default music fade time in milliseconds
+		"""
+		self.bank = bank
+		self.voice_limit = voice_limit
+		self.fade_ms = fade_ms
+		self.handles = {}  # (name, priority): ManagedSound
+		self.voices = []  # [channel, sound name, sound, priority, start time]
+		self.dropped = 0
+
+		# Music state: the streamed track and the one waiting for the fade out to finish
+		self.music = None
+		self.pending_music = None
+
+		self.enabled = bool(pygame.mixer.get_init())
+		if self.enabled:
+			pygame.mixer.set_num_channels(channels)
+			pygame.mixer.set_reserved(reserved)
+			self.jingle_channels = [pygame.mixer.Channel(index) for index in range(reserved)]
+			# find_channel may still hand out reserved channels, so effects pick from their own list
+			self.sfx_channels = [pygame.mixer.Channel(index) for index in range(reserved, channels)]
+		else:
+			self.jingle_channels = []
+			self.sfx_channels = []
+
+	def __getitem__(self, name):
+		"""Managed handle for a sound (attack sounds keep the Sound-like play() call)"""
+		return self.handle(name)
+
+	def handle(self, name, priority=0):
+		"""Shared handle for a sound at a priority, one per (name, priority)"""
+		key = (name, priority)
+		if key not in self.handles:
+			self.handles[key] = ManagedSound(self, name, priority)
+		return self.handles[key]
+
+	def __contains__(self, name):
+		return name in self.bank
+
+	def get(self, name, default=None, priority=0):
+		"""
+		Managed handle for a sound
+
+		Args:
+			name: Sound name
+			default: Returned if the bank has no such sound
+			priority: Voice priority for the handle
+
+		Returns:
+			ManagedSound or default
+		"""
+		if name not in self.bank:
+			return default
+		return self.handle(name, priority)
+
+	def prune_voices(self):
+		"""Forget voices whose channel finished or moved on to another sound"""
+		self.voices = [voice for voice in self.voices
+					   if voice[0].get_busy() and voice[0].get_sound() is voice[2]]
+
+	def play_sfx(self, name, priority=0, volume=1.0):
+		"""
+		Play a sound effect within the voice and channel limits
+
+		Args:
+			name: Sound name in the bank
+			priority: Higher priorities may steal channels from lower ones
+			volume: Channel volume (0.0 - 1.0)
+
+		Returns:
+			pygame.Channel used, or None if the sound was dropped
+		"""
+		if not self.enabled:
+			return None
+		sound = self.bank.get(name)
+		if sound is None:
+			return None
+
+		self.prune_voices()
+
+		# Per-sound limit: restart the oldest voice of this sound instead of adding one
+		same_sound = [voice for voice in self.voices if voice[1] == name]
+		if len(same_sound) >= self.voice_limit:
+			channel = same_sound[0][0]
+			self.voices.remove(same_sound[0])
+		else:
+			channel = next((channel for channel in self.sfx_channels if not channel.get_busy()), None)
+
+		# No free channel: steal the oldest voice that is not more important
+		if channel is None:
+			candidates = [voice for voice in self.voices if voice[3] <= priority]
+			if not candidates:
+				self.dropped += 1
+				return None
+			victim = min(candidates, key=lambda voice: (voice[3], voice[4]))
+			self.voices.remove(victim)
+			channel = victim[0]
+
+		channel.stop()
+		channel.set_volume(volume)
+		channel.play(sound)
+		self.voices.append([channel, name, sound, priority, perf_counter()])
+		return channel
+
+	def stop_sfx(self, name):
+		"""Stop every voice of a sound effect"""
+		for voice in self.voices:
+			if voice[1] == name:
+				voice[0].stop()
+		self.prune_voices()
+
+	def play_jingle(self, name):
+		"""Play a one-shot jingle (e.g. evolution) on a reserved channel"""
+		sound = self.bank.get(name)
+		if sound is None or not self.jingle_channels:
+			return
+		channel = next((channel for channel in self.jingle_channels if not channel.get_busy()), self.jingle_channels[0])
+		channel.play(sound)
+
+	def stop_jingles(self, fade_ms=0):
+		"""Stop or fade out the reserved jingle channels"""
+		for channel in self.jingle_channels:
+			if fade_ms:
+				channel.fadeout(fade_ms)
+			else:
+				channel.stop()
+
+	def play_music(self, name, loops=-1, fade_ms=None):
+		"""
+		Switch the streamed music track. The current track fades out in the
+		mixer and the new one fades in once it has finished (see update).
+		Music streams through pygame.mixer.music, which plays one track at a
+		time, so tracks fade out then in instead of cross-fading. A real
+		cross-fade would need both tracks fully decoded as Sounds on channels
+		of their own, which is what streaming the music avoids
+
+		Args:
+			name: Music track name in the bank
+			loops: Loop count (-1 repeats forever)
+			fade_ms: Fade time, defaults to the manager's fade time
+		"""
+		track = self.bank.get(name)
+		if track is None or not self.enabled:
+			return
+		fade_ms = self.fade_ms if fade_ms is None else fade_ms
+
+		# Already playing (or about to) - keep it going instead of restarting
+		if self.pending_music and self.pending_music[0] is track:
+			return
+		if self.pending_music is None and self.music is track and pygame.mixer.music.get_busy():
+			return
+
+		if pygame.mixer.music.get_busy() and fade_ms:
+			pygame.mixer.music.fadeout(fade_ms)
+			self.pending_music = (track, loops, fade_ms)
+		else:
+			self.start_music(track, loops, fade_ms)
+
+	def start_music(self, track, loops, fade_ms):
+		"""Start a track with a mixer fade-in"""
+		self.pending_music = None
+		self.music = track
+		track.play(loops, fade_ms=fade_ms)
+
+	def stop_music(self, fade_ms=None):
+		"""Fade out the streamed music"""
+		self.pending_music = None
+		self.music = None
+		if not self.enabled:
+			return
+		fade_ms = self.fade_ms if fade_ms is None else fade_ms
+		if fade_ms and pygame.mixer.music.get_busy():
+			pygame.mixer.music.fadeout(fade_ms)
+		else:
+			pygame.mixer.music.stop()
+
+	def update(self):
+		"""Start the next track once the previous one has faded out"""
+		if self.pending_music and not pygame.mixer.music.get_busy():
+			self.start_music(*self.pending_music)
@@ -5,22 +5,34 @@ Handles turn-based combat between player and opponent monsters
 """
 
 from settings import * 
+from render_backend import get_render_queue
 from sprites import MonsterSprite, MonsterNameSprite, MonsterLevelSprite, MonsterStatsSprite, MonsterOutlineSprite, AttackSprite, TimedSprite
 from groups import BattleSprites
-from game_data import ATTACK_DATA
-from support import draw_bar
+from battle_menus import AttackMenu, SwitchMenu
+from battle_log import BattleLog
+from content_pack import ATTACK_DATA
 from timer import Timer
-from random import choice
+from rng import get_stream
+from random import Random
+
+# Keys the battle reacts to, by the name stored in battle logs
+BATTLE_KEYS = {
+	'up': pygame.K_UP,
+	'down': pygame.K_DOWN,
+	'space': pygame.K_SPACE,
+	'escape': pygame.K_ESCAPE,
+}
 
 class Battle:
 	"""Main battle system class"""
 	
-	def __init__(self, player_monsters, opponent_monsters, monster_frames, bg_surf, fonts, end_battle, character, sounds):
+	def __init__(self, player_monsters, opponent_monsters, monster_frames, bg_surf, fonts, end_battle, character, sounds,
+				 seed=None, input_source=None, game_over=None):
 		"""
 		Initialize battle
 		
 		Args:
-			player_monsters: Dictionary of player's monsters
+			player_monsters (MonsterParty): Player's monsters
 			opponent_monsters: Dictionary of opponent's monsters
 			monster_frames: Dictionary of monster sprite frames
 			bg_surf: Background surface for battle
@@ -28,21 +40,39 @@ class Battle:
 			end_battle: Callback when battle ends
 			character: Opponent character (None for wild battles)
 			sounds: Dictionary of sound effects
+			seed: Seed for the opponent AI, drawn from the 'ai' stream if None
+				(stored in the battle log)
+			input_source: Function frame -> set of BATTLE_KEYS names, replaces the
+				keyboard (used by battle replays)
+			game_over: Callback when the player loses, quits the game if None
 		"""
 		# general
-		self.display_surface = pygame.display.get_surface()
+		self.render_queue = get_render_queue()
 		self.bg_surf = bg_surf
 		self.monster_frames = monster_frames
 		self.fonts = fonts
 		self.monster_data = {'player': player_monsters, 'opponent': opponent_monsters}
+		self.party = player_monsters
 		self.battle_over = False
 		self.end_battle = end_battle
 		self.character = character
 		self.sounds = sounds
+		self.game_over = game_over
+		self.game_lost = False
+
+		# Battle clock - timers run on recorded frame times so replays can run at any speed
+		self.frame = 0
+		self.time = 0.0  # Milliseconds
+
+		# Recording
+		self.seed = seed if seed is not None else get_stream('ai').getrandbits(32)
+		self.rng = Random(self.seed)
+		self.input_source = input_source
+		self.log = BattleLog.start(self.seed, player_monsters, opponent_monsters, monster_frames)
 
 		# timers 
 		self.timers = {
-			'opponent delay': Timer(600, func=self.opponent_attack)
+			'opponent delay': Timer(600, func=self.opponent_attack, clock=self.clock)
 		}
 
 		# groups
@@ -63,13 +93,23 @@ class Battle:
 			'target': 0,
 		}
 		
-		# Available monsters for switching
+		# Available monsters for switching (collected when the switch menu opens)
 		self.available_monsters = {}
 
+		# Retained menus, rebuilt only when their selection changes (the gray
+		# icon variants come with the frames, see grayscale_icons)
+		self.attack_menu = AttackMenu(self.fonts['regular'])
+		self.switch_menu = SwitchMenu(self.fonts['regular'], self.monster_frames['icons'])
+
 		self.setup()
 
+	def clock(self):
+		"""Battle time in milliseconds (the clock of all battle timers)"""
+		return self.time
+
 	def setup(self):
 		"""Set up initial battle state with monsters"""
+		self.party.begin_battle()
 		for entity, monsters in self.monster_data.items():
 			# Only spawn first 3 monsters
 			for index, monster in {k: v for k, v in monsters.items() if k <= 2}.items():
@@ -95,6 +135,7 @@ class Battle:
 		outline_frames = self.monster_frames['outlines'][monster.name]
 		
 		if entity == 'player':
+			self.party.activate(monster)
 			pos = list(BATTLE_POSITIONS['left'].values())[pos_index]
 			groups = (self.battle_sprites, self.player_sprites)
 			# Flip frames for player side
@@ -108,8 +149,9 @@ class Battle:
 
 		monster_sprite = MonsterSprite(
 			pos, frames, groups, monster, index, pos_index, 
-			entity, self.apply_attack, self.create_monster
+			entity, self.apply_attack, self.create_monster, self.clock
 		)
+		self.log.event(self.frame, 'spawn', entity, index, pos_index, monster.name, monster.level)
 		MonsterOutlineSprite(monster_sprite, self.battle_sprites, outline_frames)
 
 		# UI elements
@@ -124,10 +166,25 @@ class Battle:
 			self.battle_sprites, self.fonts['small']
 		)
 
+	def read_keys(self):
+		"""
+		Keys pressed this frame, from the keyboard or the input source
+
+		Returns:
+			set: BATTLE_KEYS names
+		"""
+		if self.input_source:
+			keys = self.input_source(self.frame)
+		else:
+			pressed = pygame.key.get_just_pressed()
+			keys = {name for name, key in BATTLE_KEYS.items() if pressed[key]}
+		self.log.press(self.frame, keys)
+		return keys
+
 	def input(self):
 		"""Handle player input during battle"""
 		if self.selection_mode and self.current_monster:
-			keys = pygame.key.get_just_pressed()
+			keys = self.read_keys()
 
 			# Determine limiter for current selection mode
 			match self.selection_mode:
@@ -144,16 +201,18 @@ class Battle:
 					limiter = 1
 
 			# Navigation
-			if keys[pygame.K_DOWN]:
+			if 'down' in keys:
 				self.indexes[self.selection_mode] = (self.indexes[self.selection_mode] + 1) % limiter
-			if keys[pygame.K_UP]:
+			if 'up' in keys:
 				self.indexes[self.selection_mode] = (self.indexes[self.selection_mode] - 1) % limiter
 			
 			# Selection
-			if keys[pygame.K_SPACE]:
+			if 'space' in keys:
 				if self.selection_mode == 'switch':
 					index, new_monster = list(self.available_monsters.items())[self.indexes['switch']]
+					self.log.event(self.frame, 'switch', self.current_monster.pos_index, index)
 					self.current_monster.kill()
+					self.party.deactivate(self.current_monster.monster)
 					self.create_monster(new_monster, index, self.current_monster.pos_index, 'player')
 					self.selection_mode = None
 					self.update_all_monsters('resume')
@@ -166,19 +225,21 @@ class Battle:
 						monster_sprite = sprites[list(sprites.keys())[self.indexes['target']]]
 
 						if self.selected_attack:
-							self.current_monster.activate_attack(monster_sprite, self.selected_attack)
+							self.attack(self.current_monster, monster_sprite, self.selected_attack)
 							self.selected_attack, self.current_monster, self.selection_mode = None, None, None
 						else:
 							# Catching monster
-							if monster_sprite.monster.health < monster_sprite.monster.get_stat('max_health') * 0.9:
-								self.monster_data['player'][len(self.monster_data['player'])] = monster_sprite.monster
+							caught = monster_sprite.monster.health < monster_sprite.monster.get_stat('max_health') * 0.9
+							self.log.event(self.frame, 'catch', monster_sprite.pos_index, caught)
+							if caught:
+								self.party.add(monster_sprite.monster)
 								monster_sprite.delayed_kill(None)
 								self.update_all_monsters('resume')
 							else:
 								TimedSprite(
 									monster_sprite.rect.center, 
 									self.monster_frames['ui']['cross'], 
-									self.battle_sprites, 1000
+									self.battle_sprites, 1000, self.clock
 								)
 
 				elif self.selection_mode == 'attacks':
@@ -196,6 +257,7 @@ class Battle:
 						self.indexes['attacks'] = 0
 					
 					elif self.indexes['general'] == 1:  # Defend
+						self.log.event(self.frame, 'defend', self.current_monster.pos_index)
 						self.current_monster.monster.defending = True
 						self.update_all_monsters('resume')
 						self.current_monster, self.selection_mode = None, None
@@ -203,6 +265,7 @@ class Battle:
 					
 					elif self.indexes['general'] == 2:  # Switch
 						self.selection_mode = 'switch'
+						self.available_monsters = self.party.available_monsters()
 
 					elif self.indexes['general'] == 3:  # Catch
 						self.selection_mode = 'target'
@@ -211,7 +274,7 @@ class Battle:
 				self.indexes = {k: 0 for k in self.indexes}
 
 			# Cancel
-			if keys[pygame.K_ESCAPE]:
+			if 'escape' in keys:
 				if self.selection_mode in ('attacks', 'switch', 'target'):
 					self.selection_mode = 'general'
 
@@ -246,6 +309,19 @@ class Battle:
 		for monster_sprite in self.player_sprites.sprites() + self.opponent_sprites.sprites():
 			monster_sprite.monster.paused = (option == 'pause')
 
+	def attack(self, monster_sprite, target_sprite, ability):
+		"""
+		Start an attack chosen by the player or the AI
+
+		Args:
+			monster_sprite: Attacking monster sprite
+			target_sprite: Target monster sprite
+			ability: Attack name
+		"""
+		self.log.event(self.frame, 'attack', monster_sprite.entity, monster_sprite.pos_index,
+					   ability, target_sprite.entity, target_sprite.pos_index)
+		monster_sprite.activate_attack(target_sprite, ability)
+
 	def apply_attack(self, target_sprite, attack, amount):
 		"""
 		Apply attack damage to target
@@ -294,6 +370,7 @@ class Battle:
 		
 		# Apply damage
 		target_sprite.monster.health -= final_damage
+		self.log.event(self.frame, 'hit', target_sprite.entity, target_sprite.pos_index, attack, final_damage)
 		self.check_death()
 
 		# Resume battle
@@ -303,15 +380,18 @@ class Battle:
 		"""Check for defeated monsters and handle replacements"""
 		for monster_sprite in list(self.opponent_sprites.sprites() + self.player_sprites.sprites()):
 			if monster_sprite.monster.health <= 0:
+				# Already handled, waiting for its kill timer
+				if monster_sprite.timers['kill'].active:
+					break
+				self.log.event(self.frame, 'death', monster_sprite.entity, monster_sprite.pos_index,
+							   monster_sprite.monster.name)
+
 				if self.player_sprites in monster_sprite.groups():  # Player monster defeated
-					active_monsters = [(ms.index, ms.monster) 
-									   for ms in self.player_sprites.sprites()]
-					available_monsters = [(index, monster) for index, monster in self.monster_data['player'].items() 
-										  if monster.health > 0 and (index, monster) not in active_monsters]
-					
-					if available_monsters:
-						new_monster_data = (available_monsters[0][1], available_monsters[0][0], 
-											monster_sprite.pos_index, 'player')
+					self.party.deactivate(monster_sprite.monster)
+					replacement = self.party.first_available()
+					if replacement:
+						index, new_monster = replacement
+						new_monster_data = (new_monster, index, monster_sprite.pos_index, 'player')
 					else:
 						new_monster_data = None
 						
@@ -330,6 +410,7 @@ class Battle:
 					if len(self.player_sprites) > 0:
 						xp_amount = monster_sprite.monster.level * 100 / len(self.player_sprites)
 						for player_sprite in self.player_sprites:
+							self.log.event(self.frame, 'xp', player_sprite.pos_index, xp_amount)
 							player_sprite.monster.update_xp(xp_amount)
 
 				monster_sprite.delayed_kill(new_monster_data)
@@ -337,7 +418,7 @@ class Battle:
 
 	def opponent_attack(self):
 		"""AI-controlled opponent attack"""
-		ability = choice(self.current_monster.monster.get_abilities())
+		ability = self.rng.choice(self.current_monster.monster.get_abilities())
 		
 		# Choose target based on attack type
 		if ATTACK_DATA[ability]['target'] == 'player':
@@ -347,7 +428,7 @@ class Battle:
 			if not alive_targets:
 				self.update_all_monsters('resume')  # Resume battle even if no valid targets
 				return  # No valid targets, skip attack
-			random_target = choice(alive_targets)
+			random_target = self.rng.choice(alive_targets)
 		else:
 			# Filter out dead monsters (health <= 0)
 			alive_targets = [sprite for sprite in self.player_sprites.sprites() 
@@ -355,9 +436,9 @@ class Battle:
 			if not alive_targets:
 				self.update_all_monsters('resume')  # Resume battle even if no valid targets
 				return  # No valid targets, skip attack
-			random_target = choice(alive_targets)
+			random_target = self.rng.choice(alive_targets)
 		
-		self.current_monster.activate_attack(random_target, ability)
+		self.attack(self.current_monster, random_target, ability)
 
 
 	def check_end_battle(self):
@@ -365,14 +446,20 @@ class Battle:
 		# Opponents defeated - player wins
 		if len(self.opponent_sprites) == 0 and not self.battle_over:
 			self.battle_over = True
+			self.log.event(self.frame, 'end', 'win')
 			self.end_battle(self.character)
 			for monster in self.monster_data['player'].values():
 				monster.initiative = 0
 
 		# Player defeated - game over
-		if len(self.player_sprites) == 0:
-			pygame.quit()
-			exit()
+		if len(self.player_sprites) == 0 and not self.game_lost:
+			self.game_lost = True
+			self.log.event(self.frame, 'end', 'defeat')
+			if self.game_over:
+				self.game_over()
+			else:
+				pygame.quit()
+				exit()
 
 	# UI drawing
 	def draw_ui(self):
@@ -391,123 +478,52 @@ class Battle:
 			if index == self.indexes['general']:
 				surf = self.monster_frames['ui'][f"{data_dict['icon']}_highlight"]
 			else:
-				surf = pygame.transform.grayscale(self.monster_frames['ui'][data_dict['icon']])
+				surf = self.monster_frames['ui'][f"{data_dict['icon']}_gray"]
 			rect = surf.get_frect(center=self.current_monster.rect.midright + data_dict['pos'])
-			self.display_surface.blit(surf, rect)
+			self.render_queue.sprite(surf, rect)
 
 	def draw_attacks(self):
 		"""Draw attack selection menu"""
-		# data
 		abilities = self.current_monster.monster.get_abilities(all=False)
-		width, height = 150, 200
-		visible_attacks = 4
-		item_height = height / visible_attacks
-		v_offset = (0 if self.indexes['attacks'] < visible_attacks 
-					else -(self.indexes['attacks'] - visible_attacks + 1) * item_height)
-
-		# bg
-		bg_rect = pygame.FRect((0, 0), (width, height)).move_to(
-			midleft=self.current_monster.rect.midright + vector(20, 0)
-		)
-		pygame.draw.rect(self.display_surface, COLORS['white'], bg_rect, 0, 5)
-
-		for index, ability in enumerate(abilities):
-			selected = index == self.indexes['attacks']
-
-			# text 
-			if selected:
-				element = ATTACK_DATA[ability]['element']
-				text_color = COLORS[element] if element != 'normal' else COLORS['black']
-			else:
-				text_color = COLORS['light']
-			text_surf = self.fonts['regular'].render(ability, False, text_color)
-
-			# rect 
-			text_rect = text_surf.get_frect(
-				center=bg_rect.midtop + vector(0, item_height / 2 + index * item_height + v_offset)
-			)
-			text_bg_rect = pygame.FRect((0, 0), (width, item_height)).move_to(center=text_rect.center)
-
-			# draw
-			if bg_rect.collidepoint(text_rect.center):
-				if selected:
-					if text_bg_rect.collidepoint(bg_rect.topleft):
-						pygame.draw.rect(self.display_surface, COLORS['dark white'], text_bg_rect, 0, 0, 5, 5)
-					elif text_bg_rect.collidepoint(bg_rect.midbottom + vector(0, -1)):
-						pygame.draw.rect(self.display_surface, COLORS['dark white'], text_bg_rect, 0, 0, 0, 0, 5, 5)
-					else:
-						pygame.draw.rect(self.display_surface, COLORS['dark white'], text_bg_rect)
-
-				self.display_surface.blit(text_surf, text_rect)
+		surf = self.attack_menu.surface(abilities, self.indexes['attacks'])
+		rect = surf.get_frect(midleft=self.current_monster.rect.midright + vector(20, 0))
+		self.render_queue.sprite(surf, rect)
 
 	def draw_switch(self):
 		"""Draw monster switch menu"""
-		# data 
-		width, height = 300, 320
-		visible_monsters = 4
-		item_height = height / visible_monsters
-		v_offset = (0 if self.indexes['switch'] < visible_monsters 
-					else -(self.indexes['switch'] - visible_monsters + 1) * item_height)
-		bg_rect = pygame.FRect((0, 0), (width, height)).move_to(
-			midleft=self.current_monster.rect.midright + vector(20, 0)
-		)
-		pygame.draw.rect(self.display_surface, COLORS['white'], bg_rect, 0, 5)
-
-		# Get available monsters
-		active_monsters = [(monster_sprite.index, monster_sprite.monster) 
-						   for monster_sprite in self.player_sprites]
-		self.available_monsters = {
-			index: monster for index, monster in self.monster_data['player'].items() 
-			if (index, monster) not in active_monsters and monster.health > 0
-		}
+		surf = self.switch_menu.surface(self.available_monsters, self.indexes['switch'])
+		rect = surf.get_frect(midleft=self.current_monster.rect.midright + vector(20, 0))
+		self.render_queue.sprite(surf, rect)
 
-		for index, monster in enumerate(self.available_monsters.values()):
-			selected = index == self.indexes['switch']
-			item_bg_rect = pygame.FRect((0, 0), (width, item_height)).move_to(
-				midleft=(bg_rect.left, bg_rect.top + item_height / 2 + index * item_height + v_offset)
-			)
-
-			icon_surf = self.monster_frames['icons'][monster.name]
-			icon_rect = icon_surf.get_frect(
-				midleft=bg_rect.topleft + vector(10, item_height / 2 + index * item_height + v_offset)
-			)
-			text_surf = self.fonts['regular'].render(
-				f'{monster.name} ({monster.level})', 
-				False, COLORS['red'] if selected else COLORS['black']
-			)
-			text_rect = text_surf.get_frect(topleft=(bg_rect.left + 90, icon_rect.top))
-
-			# selection bg
-			if selected:
-				if item_bg_rect.collidepoint(bg_rect.topleft):
-					pygame.draw.rect(self.display_surface, COLORS['dark white'], item_bg_rect, 0, 0, 5, 5)
-				elif item_bg_rect.collidepoint(bg_rect.midbottom + vector(0, -1)):
-					pygame.draw.rect(self.display_surface, COLORS['dark white'], item_bg_rect, 0, 0, 0, 0, 5, 5)
-				else:
-					pygame.draw.rect(self.display_surface, COLORS['dark white'], item_bg_rect)
-
-			if bg_rect.collidepoint(item_bg_rect.center):
-				for surf, rect in ((icon_surf, icon_rect), (text_surf, text_rect)):
-					self.display_surface.blit(surf, rect)
-				health_rect = pygame.FRect((text_rect.bottomleft + vector(0, 4)), (100, 4))
-				energy_rect = pygame.FRect((health_rect.bottomleft + vector(0, 2)), (80, 4))
-				draw_bar(self.display_surface, health_rect, monster.health, 
-						 monster.get_stat('max_health'), COLORS['red'], COLORS['black'])
-				draw_bar(self.display_surface, energy_rect, monster.energy, 
-						 monster.get_stat('max_energy'), COLORS['blue'], COLORS['black'])
-
-	def update(self, dt):
-		"""Update battle state"""
+	def update(self, dt, draw=True):
+		"""
+		Update battle state
+
+		Args:
+			dt: Delta time in seconds
+			draw: False only updates the monsters and skips all display work
+				(headless replays)
+		"""
+		self.frame += 1
+		self.time += dt * 1000
+		self.log.frame(dt)
 		self.check_end_battle()
 		
 		# updates
 		self.input()
 		self.update_timers()
-		self.battle_sprites.update(dt)
+		if draw:
+			self.battle_sprites.update(dt)
+		else:
+			for sprite in self.battle_sprites.sprites():
+				if isinstance(sprite, MonsterSprite):
+					sprite.update(dt)
 		self.check_active()
+		if not draw:
+			return
 
 		# drawing
-		self.display_surface.blit(self.bg_surf, (0, 0))
+		self.render_queue.sprite(self.bg_surf, (0, 0))
 		self.battle_sprites.draw(
 			self.current_monster, self.selection_side, self.selection_mode, 
 			self.indexes['target'], self.player_sprites, self.opponent_sprites
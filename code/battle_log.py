@@ -0,0 +1,178 @@
+"""
+Battle Log for Monster Hunter
+Compatible with Pygame CE 2.5.5 and Python 3.13.7
+Compact record of one battle: the RNG seed, both sides as they entered the
+battle, every frame's delta time, the keys the player pressed and the events
+that happened (spawns, choices, attacks, deaths, XP). Together with
+battle_replay.py this re-runs a battle exactly, at any speed
+"""
+
+import json
+from pathlib import Path
+from monster import Monster
+
+LOG_VERSION = 1
+
+# Monster fields restored before a replay
+MONSTER_FIELDS = ('health', 'energy', 'xp', 'initiative', 'defending')
+
+def snapshot_monster(monster):
+	"""
+	Battle relevant state of a monster
+
+	Args:
+		monster: Monster instance
+
+	Returns:
+		dict: JSON compatible monster state
+	"""
+	data = {'name': monster.name, 'level': monster.level}
+	for field in MONSTER_FIELDS:
+		data[field] = getattr(monster, field)
+	return data
+
+def restore_monster(data):
+	"""
+	Recreate a monster from snapshot_monster data
+
+	Args:
+		data: Dictionary from snapshot_monster
+
+	Returns:
+		Monster: New monster in the recorded state
+	"""
+	monster = Monster(data['name'], data['level'])
+	for field in MONSTER_FIELDS:
+		setattr(monster, field, data[field])
+	monster.level_up = monster.level * 150
+	return monster
+
+class BattleLog:
+	"""Everything needed to replay a battle, recorded while it runs"""
+
+	def __init__(self, seed, player, opponent, frames):
+		"""
+		Initialize battle log
+
+		Args:
+			seed: Seed of the battle's random generator
+			player: Snapshots of the player's monsters in slot order
+			opponent: [slot, snapshot] pairs of the opponent's monsters
+			frames: {monster name: {state: frame count}}, the attack frame
+				count decides when an attack hits
+		"""
+		self.version = LOG_VERSION
+		self.seed = seed
+		self.player = player
+		self.opponent = opponent
+		self.frames = frames
+
+		self.dts = []  # [dt, count] runs of equal frame times
+		self.keys = []  # [frame, [key names]] for frames with input
+		self.events = []  # [frame, kind, *data]
+		self.frame_count = 0
+
+	@classmethod
+	def start(cls, seed, player_monsters, opponent_monsters, monster_frames):
+		"""
+		Log for a battle that is about to be set up
+
+		Args:
+			seed: Seed of the battle's random generator
+			player_monsters: Player's MonsterParty
+			opponent_monsters: Dictionary of the opponent's monsters
+			monster_frames: Battle's monster frames (only the frame counts are kept)
+
+		Returns:
+			BattleLog: Log without frames or events yet
+		"""
+		player = [snapshot_monster(monster) for monster in player_monsters.values()]
+		opponent = [[slot, snapshot_monster(monster)] for slot, monster in sorted(opponent_monsters.items())]
+		names = {data['name'] for data in player} | {data['name'] for _, data in opponent}
+		frames = {name: {state: len(state_frames) for state, state_frames in monster_frames['monsters'][name].items()}
+				  for name in sorted(names)}
+		return cls(seed, player, opponent, frames)
+
+	# Recording
+	def frame(self, dt):
+		"""Record the delta time of a new frame"""
+		self.frame_count += 1
+		if self.dts and self.dts[-1][0] == dt:
+			self.dts[-1][1] += 1
+		else:
+			self.dts.append([dt, 1])
+
+	def press(self, frame, names):
+		"""Record the keys pressed in a frame"""
+		if names:
+			self.keys.append([frame, sorted(names)])
+
+	def event(self, frame, kind, *data):
+		"""Record something that happened in a frame"""
+		self.events.append([frame, kind, *data])
+
+	# Playback
+	def frame_times(self):
+		"""Delta time of every recorded frame, in order"""
+		for dt, count in self.dts:
+			for _ in range(count):
+				yield dt
+
+	def keys_by_frame(self):
+		"""Pressed keys as {frame: set of key names}"""
+		return {frame: set(names) for frame, names in self.keys}
+
+	def player_monsters(self):
+		"""Fresh copies of the player's monsters in slot order"""
+		return [restore_monster(data) for data in self.player]
+
+	def opponent_monsters(self):
+		"""Fresh copies of the opponent's monsters as {slot: Monster}"""
+		return {slot: restore_monster(data) for slot, data in self.opponent}
+
+	# Files
+	def to_dict(self):
+		"""JSON compatible log data"""
+		return {
+			'version': self.version,
+			'seed': self.seed,
+			'player': self.player,
+			'opponent': self.opponent,
+			'frames': self.frames,
+			'frame_count': self.frame_count,
+			'dts': self.dts,
+			'keys': self.keys,
+			'events': self.events,
+		}
+
+	@classmethod
+	def from_dict(cls, data):
+		"""Log from to_dict data"""
+		if data.get('version') != LOG_VERSION:
+			raise ValueError(f"Unsupported battle log version: {data.get('version')}")
+		log = cls(data['seed'], data['player'], data['opponent'], data['frames'])
+		log.dts = data['dts']
+		log.keys = data['keys']
+		log.events = data['events']
+		log.frame_count = data['frame_count']
+		return log
+
+	def save(self, path):
+		"""
+		Write the log as JSON
+
+		Args:
+			path: Target file, parent folders are created
+
+		Returns:
+			Path: The written file
+		"""
+		path = Path(path)
+		path.parent.mkdir(parents=True, exist_ok=True)
+		path.write_text(json.dumps(self.to_dict(), separators=(',', ':')))
+		return path
+
+	@classmethod
+	def load(cls, path):
+		"""Read a log written by save"""
+		return cls.from_dict(json.loads(Path(path).read_text()))
@@ -0,0 +1,179 @@
+"""
+Battle Menus for Monster Hunter
+Compatible with Pygame CE 2.5.5 and Python 3.13.7
+Retained attack and switch menus: each menu is rendered into one surface
+when it opens or its selection changes and reused on every other frame
+"""
+
+from settings import *
+from support import draw_bar
+from content_pack import ATTACK_DATA
+
+def grayscale_icons(ui_frames):
+	"""
+	Add '<icon>_gray' variants of the battle menu icons (done once at import)
+
+	Args:
+		ui_frames: Dictionary of UI surfaces, updated in place
+	"""
+	for data in BATTLE_CHOICES['full'].values():
+		icon = data['icon']
+		if icon in ui_frames and f'{icon}_gray' not in ui_frames:
+			ui_frames[f'{icon}_gray'] = pygame.transform.grayscale(ui_frames[icon])
+
+class RetainedMenu:
+	"""Menu surface that is only rebuilt when its key changes"""
+
+	def __init__(self):
+		self.key = None
+		self.surf = None
+		self.builds = 0
+
+	def get(self, key, build):
+		"""
+		Cached menu surface
+
+		Args:
+			key: Everything the menu shows
+			build: Callable without arguments that renders the menu
+
+		Returns:
+			pygame.Surface: Menu surface
+		"""
+		if key != self.key:
+			self.surf = build()
+			self.key = key
+			self.builds += 1
+		return self.surf
+
+	def invalidate(self):
+		"""Force a rebuild on the next get"""
+		self.key = None
+
+def draw_selection_bg(surface, item_rect, bg_rect):
+	"""Highlight an entry, rounding the corners of the first and last one"""
+	if item_rect.collidepoint(bg_rect.topleft):
+		pygame.draw.rect(surface, COLORS['dark white'], item_rect, 0, 0, 5, 5)
+	elif item_rect.collidepoint(bg_rect.midbottom + vector(0, -1)):
+		pygame.draw.rect(surface, COLORS['dark white'], item_rect, 0, 0, 0, 0, 5, 5)
+	else:
+		pygame.draw.rect(surface, COLORS['dark white'], item_rect)
+
+class AttackMenu(RetainedMenu):
+	"""Scrolling list of a monster's usable attacks"""
+	WIDTH, HEIGHT = 150, 200
+	VISIBLE_ITEMS = 4
+
+	def __init__(self, font):
+		"""
+		Args:
+			font: Font for the attack names
+		"""
+		super().__init__()
+		self.font = font
+
+	def surface(self, abilities, index):
+		"""Menu for a list of abilities with one selected"""
+		return self.get((tuple(abilities), index), lambda: self.build(abilities, index))
+
+	def build(self, abilities, index):
+		"""Render the menu"""
+		surf = pygame.Surface((self.WIDTH, self.HEIGHT), pygame.SRCALPHA)
+		bg_rect = surf.get_frect()
+		pygame.draw.rect(surf, COLORS['white'], bg_rect, 0, 5)
+
+		item_height = self.HEIGHT / self.VISIBLE_ITEMS
+		v_offset = (0 if index < self.VISIBLE_ITEMS
+					else -(index - self.VISIBLE_ITEMS + 1) * item_height)
+
+		for item, ability in enumerate(abilities):
+			selected = item == index
+
+			# text
+			if selected:
+				element = ATTACK_DATA[ability]['element']
+				text_color = COLORS[element] if element != 'normal' else COLORS['black']
+			else:
+				text_color = COLORS['light']
+			text_surf = self.font.render(ability, False, text_color)
+
+			# rect
+			text_rect = text_surf.get_frect(
+				center=bg_rect.midtop + vector(0, item_height / 2 + item * item_height + v_offset)
+			)
+			text_bg_rect = pygame.FRect((0, 0), (self.WIDTH, item_height)).move_to(center=text_rect.center)
+
+			# draw
+			if bg_rect.collidepoint(text_rect.center):
+				if selected:
+					draw_selection_bg(surf, text_bg_rect, bg_rect)
+				surf.blit(text_surf, text_rect)
+		return surf
+
+class SwitchMenu(RetainedMenu):
+	"""Scrolling list of the monsters that can be switched in"""
+	WIDTH, HEIGHT = 300, 320
+	VISIBLE_ITEMS = 4
+
+	def __init__(self, font, icons):
+		"""
+		Args:
+			font: Font for the monster names
+			icons: Dictionary of monster icons
+		"""
+		super().__init__()
+		self.font = font
+		self.icons = icons
+
+	def surface(self, monsters, index):
+		"""
+		Menu for the available monsters with one selected
+
+		Args:
+			monsters: {slot: Monster} that can be switched in
+			index: Selected entry
+		"""
+		key = (tuple((monster, monster.name, monster.level, int(monster.health), int(monster.energy))
+					 for monster in monsters.values()), index)
+		return self.get(key, lambda: self.build(list(monsters.values()), index))
+
+	def build(self, monsters, index):
+		"""Render the menu"""
+		surf = pygame.Surface((self.WIDTH, self.HEIGHT), pygame.SRCALPHA)
+		bg_rect = surf.get_frect()
+		pygame.draw.rect(surf, COLORS['white'], bg_rect, 0, 5)
+
+		item_height = self.HEIGHT / self.VISIBLE_ITEMS
+		v_offset = (0 if index < self.VISIBLE_ITEMS
+					else -(index - self.VISIBLE_ITEMS + 1) * item_height)
+
+		for item, monster in enumerate(monsters):
+			selected = item == index
+			item_bg_rect = pygame.FRect((0, 0), (self.WIDTH, item_height)).move_to(
+				midleft=(bg_rect.left, bg_rect.top + item_height / 2 + item * item_height + v_offset)
+			)
+
+			icon_surf = self.icons[monster.name]
+			icon_rect = icon_surf.get_frect(
+				midleft=bg_rect.topleft + vector(10, item_height / 2 + item * item_height + v_offset)
+			)
+			text_surf = self.font.render(
+				f'{monster.name} ({monster.level})',
+				False, COLORS['red'] if selected else COLORS['black']
+			)
+			text_rect = text_surf.get_frect(topleft=(bg_rect.left + 90, icon_rect.top))
+
+			# selection bg
+			if selected:
+				draw_selection_bg(surf, item_bg_rect, bg_rect)
+
+			if bg_rect.collidepoint(item_bg_rect.center):
+				for entry_surf, entry_rect in ((icon_surf, icon_rect), (text_surf, text_rect)):
+					surf.blit(entry_surf, entry_rect)
+				health_rect = pygame.FRect((text_rect.bottomleft + vector(0, 4)), (100, 4))
+				energy_rect = pygame.FRect((health_rect.bottomleft + vector(0, 2)), (80, 4))
+				draw_bar(surf, health_rect, monster.health,
+						 monster.get_stat('max_health'), COLORS['red'], COLORS['black'])
+				draw_bar(surf, energy_rect, monster.energy,
+						 monster.get_stat('max_energy'), COLORS['blue'], COLORS['black'])
+		return surf
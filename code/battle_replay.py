@@ -0,0 +1,247 @@
+"""
+Battle Replay for Monster Hunter
+Compatible with Pygame CE 2.5.5 and Python 3.13.7
+Re-runs a recorded battle log. Headless replays only run the battle logic,
+with placeholder graphics, as fast as possible and check that the same
+events happen again; rendered replays show the battle at a chosen speed
+
+Usage:
+	python battle_replay.py replay.json              watch the battle at normal speed
+	python battle_replay.py replay.json --speed 4    watch it four times faster
+	python battle_replay.py replay.json --headless   verify it without a window
+
+Exits with status 1 when a headless replay diverges from the log.
+"""
+
+import os
+import argparse
+from pathlib import Path
+from time import perf_counter
+
+from settings import *
+from battle_log import BattleLog
+from party import MonsterParty
+
+class Placeholder(dict):
+	"""Dictionary that returns the same value for every missing key"""
+
+	def __init__(self, value):
+		super().__init__()
+		self.value = value
+
+	def __missing__(self, key):
+		return self.value
+
+class SilentSound:
+	"""Sound that does nothing when played"""
+
+	def play(self):
+		pass
+
+def load_battle_assets():
+	"""
+	Monster frames, background and fonts of the game for rendered replays
+
+	Returns:
+		tuple: (monster_frames, bg_surf, fonts), all None if the assets could not be loaded
+	"""
+	from support import import_folder_dict, monster_importer, attack_importer, outline_creator
+	from battle_menus import grayscale_icons
+
+	base_path = str(Path(__file__).parent.parent)
+	try:
+		monster_frames = {
+			'icons': import_folder_dict(base_path, 'graphics', 'icons'),
+			'monsters': monster_importer(4, 2, base_path, 'graphics', 'monsters'),
+			'ui': import_folder_dict(base_path, 'graphics', 'ui'),
+			'attacks': attack_importer(base_path, 'graphics', 'attacks')
+		}
+		if not monster_frames['monsters']:
+			raise FileNotFoundError('no monster graphics')
+		monster_frames['outlines'] = outline_creator(monster_frames['monsters'], 4)
+		grayscale_icons(monster_frames['ui'])
+		font_path = Path(base_path) / 'graphics' / 'fonts' / 'PixeloidSans.ttf'
+		fonts = {
+			'regular': pygame.font.Font(str(font_path), 18),
+			'small': pygame.font.Font(str(font_path), 14),
+		}
+		bg_surf = list(import_folder_dict(base_path, 'graphics', 'backgrounds').values())[0]
+	except Exception as e:
+		print(f"Warning: Could not load battle assets, using placeholders: {e}")
+		return None, None, None
+	return monster_frames, bg_surf, fonts
+
+class BattleReplay:
+	"""Battle rebuilt from a log and driven by its recorded frames and keys"""
+
+	def __init__(self, log):
+		"""
+		Initialize replay
+
+		Args:
+			log: BattleLog to replay
+		"""
+		self.log = log
+		self.keys = log.keys_by_frame()
+		self.battle = None
+		self.finished = False
+
+	def input_source(self, frame):
+		"""Recorded keys of a frame"""
+		return self.keys.get(frame, set())
+
+	def end(self, *_):
+		"""Battle won or lost"""
+		self.finished = True
+
+	def placeholder_frames(self):
+		"""
+		Monster frames with blank surfaces. Only the frame counts matter for
+		the battle logic, so they are taken from the log
+
+		Returns:
+			dict: Frames in the layout Battle expects
+		"""
+		surf = pygame.Surface((192, 192), pygame.SRCALPHA)
+		surf.fill((255, 255, 255, 255), surf.get_rect().inflate(-96, -96))
+		monsters = {name: {state: [surf] * count for state, count in states.items()}
+					for name, states in self.log.frames.items()}
+		return {
+			'monsters': monsters,
+			'outlines': monsters,
+			'icons': Placeholder(pygame.Surface((64, 64))),
+			'ui': Placeholder(pygame.Surface((64, 64))),
+			'attacks': Placeholder([pygame.Surface((64, 64))]),
+		}
+
+	def build(self, monster_frames=None, bg_surf=None, fonts=None):
+		"""
+		Set up the recorded battle
+
+		Args:
+			monster_frames: Real monster frames, placeholders if None
+			bg_surf: Battle background, blank if None
+			fonts: Dictionary of fonts, the default font if None
+
+		Returns:
+			Battle: Battle in its recorded starting state
+		"""
+		from battle import Battle
+
+		if not pygame.font.get_init():
+			pygame.font.init()
+		self.finished = False
+		self.battle = Battle(
+			player_monsters=MonsterParty(self.log.player_monsters()),
+			opponent_monsters=self.log.opponent_monsters(),
+			monster_frames=monster_frames or self.placeholder_frames(),
+			bg_surf=bg_surf or pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)),
+			fonts=fonts or {'regular': pygame.font.Font(None, 24), 'small': pygame.font.Font(None, 18)},
+			end_battle=self.end,
+			character=None,
+			sounds=Placeholder(SilentSound()),
+			seed=self.log.seed,
+			input_source=self.input_source,
+			game_over=self.end)
+		return self.battle
+
+	def compare(self):
+		"""
+		Compare the replayed events with the recorded ones
+
+		Returns:
+			tuple: (index, recorded, replayed) of the first difference, None if they match
+		"""
+		recorded, replayed = self.log.events, self.battle.log.events
+		for index in range(max(len(recorded), len(replayed))):
+			expected = recorded[index] if index < len(recorded) else None
+			actual = replayed[index] if index < len(replayed) else None
+			if expected != actual:
+				return index, expected, actual
+		return None
+
+	def run_headless(self):
+		"""
+		Replay the battle without drawing anything
+
+		Returns:
+			dict: Frame count, battle and real time, speedup and the first
+				event difference (None if the replay matches the log)
+		"""
+		battle = self.build()
+		start = perf_counter()
+		for dt in self.log.frame_times():
+			battle.update(dt, draw=False)
+			if self.finished:
+				break
+		elapsed = perf_counter() - start
+
+		battle_time = battle.time / 1000
+		return {
+			'frames': battle.frame,
+			'battle_time': round(battle_time, 3),
+			'real_time': round(elapsed, 3),
+			'speedup': round(battle_time / elapsed, 1) if elapsed > 0 else None,
+			'difference': self.compare(),
+		}
+
+	def play(self, speed=1.0, backend=None):
+		"""
+		Show the replay in a window
+
+		Args:
+			speed: Playback speed, 2 is twice as fast as recorded
+			backend: Render backend, the shared one if None
+
+		Returns:
+			tuple: First event difference or None, like compare
+		"""
+		from render_backend import get_backend
+
+		backend = backend or get_backend('Monster Hunter - Battle replay')
+		if not pygame.font.get_init():
+			pygame.font.init()
+		battle = self.build(*load_battle_assets())
+		clock = pygame.time.Clock()
+		for dt in self.log.frame_times():
+			for event in pygame.event.get():
+				if event.type == pygame.QUIT:
+					return self.compare()
+			backend.begin_frame()
+			battle.update(dt)
+			backend.present()
+			if self.finished:
+				break
+			clock.tick(speed / dt if dt > 0 else 0)
+		return self.compare()
+
+def main():
+	"""Command line entry point"""
+	parser = argparse.ArgumentParser(description='Replay a recorded Monster Hunter battle')
+	parser.add_argument('log', type=Path, help='battle log JSON')
+	parser.add_argument('--speed', type=float, default=1.0, help='playback speed of a rendered replay')
+	parser.add_argument('--headless', action='store_true', help='replay as fast as possible without a window')
+	args = parser.parse_args()
+
+	if args.headless:
+		os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+		os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+	replay = BattleReplay(BattleLog.load(args.log))
+
+	if args.headless:
+		result = replay.run_headless()
+		print(f"{result['frames']} frames, {result['battle_time']} s of battle in "
+			  f"{result['real_time']} s ({result['speedup']}x)")
+		difference = result['difference']
+	else:
+		difference = replay.play(args.speed)
+
+	if difference:
+		index, expected, actual = difference
+		print(f"Replay diverged at event {index}: expected {expected}, got {actual}")
+		return 1
+	print(f"Replay matches the log ({len(replay.log.events)} events)")
+	return 0
+
+if __name__ == '__main__':
+	exit(main())
@@ -0,0 +1,296 @@
+"""
+Headless Benchmark Suite for Monster Hunter
+Compatible with Pygame CE 2.5.5 and Python 3.13.7
+Times the render, update and load hot paths under the SDL dummy video driver
+
+Usage:
+	python benchmark.py                       run and print results as JSON
+	python benchmark.py --output out.json     also write results to a file
+	python benchmark.py --save-baseline       store results as the new baseline
+	python benchmark.py --scale 4             enlarge the synthetic map 4x4
+
+Exits with status 1 when a benchmark is slower than the stored baseline
+by more than the tolerance.
+"""
+
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import contextlib
+import json
+import platform
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from settings import *
+from render_backend import get_backend
+
+BASE_PATH = Path(__file__).parent.parent
+DEFAULT_BASELINE = BASE_PATH / 'benchmarks' / 'baseline.json'
+FRAME_DT = 1 / 60
+
+def measure(func, repeat=20, warmup=2):
+	"""
+	Time a function call
+
+	Args:
+		func: Callable without arguments
+		repeat: Number of timed calls
+		warmup: Number of untimed calls before timing
+
+	Returns:
+		Dictionary with min/median/mean/p95 in milliseconds
+	"""
+	for _ in range(warmup):
+		func()
+
+	times = []
+	for _ in range(repeat):
+		start = perf_counter()
+		func()
+		times.append((perf_counter() - start) * 1000.0)
+
+	times.sort()
+	return {
+		'min': round(times[0], 4),
+		'median': round(times[len(times) // 2], 4),
+		'mean': round(sum(times) / len(times), 4),
+		'p95': round(times[min(len(times) - 1, int(len(times) * 0.95))], 4),
+		'repeat': repeat,
+	}
+
+def find_spawn(tmx_map):
+	"""Return the first player spawn position name in a map"""
+	try:
+		for obj in tmx_map.get_layer_by_name('Entities'):
+			if obj.name == 'Player' and obj.properties.get('pos'):
+				return obj.properties['pos']
+	except Exception:
+		pass
+	return 'house'
+
+def enlarge_map(game, tmx_map, scale):
+	"""
+	Tile the currently loaded map scale x scale times to build a synthetic large map
+
+	Args:
+		game: Game instance with a map already set up
+		tmx_map: The map that was set up (used for its size)
+		scale: Number of copies per axis
+	"""
+	from sprites import Sprite, AnimatedSprite, CollidableSprite
+	from entities import Entity
+
+	map_width = tmx_map.width * TILE_SIZE
+	map_height = tmx_map.height * TILE_SIZE
+	base_sprites = [sprite for sprite in game.all_sprites if not isinstance(sprite, Entity)]
+	collidable = set(game.collision_sprites.sprites())
+
+	for col in range(scale):
+		for row in range(scale):
+			if col == 0 and row == 0:
+				continue
+			offset = vector(col * map_width, row * map_height)
+			for sprite in base_sprites:
+				pos = vector(sprite.rect.topleft) + offset
+				if sprite in collidable:
+					CollidableSprite(pos, sprite.image, (game.all_sprites, game.collision_sprites))
+				elif isinstance(sprite, AnimatedSprite):
+					AnimatedSprite(pos, sprite.frames, game.all_sprites, sprite.z)
+				else:
+					Sprite(pos, sprite.image, game.all_sprites, sprite.z)
+
+def bench_world(game, label, results, repeat):
+	"""Time drawing, updating, collisions and raycasts for the loaded world"""
+	player = game.player
+	def draw():
+		# Queue the world and execute it, as one frame would
+		game.all_sprites.draw(player)
+		game.backend.flush()
+	results[f'all_sprites.draw[{label}]'] = measure(draw, repeat)
+	results[f'all_sprites.update[{label}]'] = measure(lambda: game.all_sprites.update(FRAME_DT), repeat)
+
+	if player:
+		def collisions():
+			player.direction = vector(1, 1)
+			player.collisions('horizontal')
+			player.collisions('vertical')
+			player.direction = vector(0, 0)
+		results[f'player.collisions[{label}]'] = measure(collisions, repeat)
+
+	characters = game.character_sprites.sprites()
+	if characters:
+		def raycast():
+			for character in characters:
+				character.has_noticed = True  # keep raycast side-effect free
+				character.raycast()
+		results[f'character.raycast[{label}]'] = measure(raycast, repeat)
+
+	results[f'sprite_count[{label}]'] = {'value': len(game.all_sprites)}
+
+def bench_battle(game, results, repeat):
+	"""Time Battle.update with six monsters on the field"""
+	from battle import Battle
+	from monster import Monster
+	from party import MonsterParty
+
+	def new_battle():
+		player_monsters = MonsterParty([Monster(monster.name, monster.level)
+										for monster in game.player_monsters.values()])
+		opponent_monsters = {0: Monster('Finsta', 15), 1: Monster('Pouch', 13), 2: Monster('Larvea', 12)}
+		return Battle(
+			player_monsters=player_monsters,
+			opponent_monsters=opponent_monsters,
+			monster_frames=game.monster_frames,
+			bg_surf=list(game.bg_frames.values())[0],
+			fonts=game.fonts,
+			end_battle=lambda character: None,
+			character=None,
+			sounds=game.audio_manager)
+
+	battle = new_battle()
+	def update():
+		battle.update(FRAME_DT)
+		game.backend.flush()
+	results['battle.update[6 monsters]'] = measure(update, repeat)
+	results['battle.setup'] = measure(new_battle, max(1, repeat // 4))
+
+def bench_save_load(game, results, repeat):
+	"""Time saving and loading through the save system in a temporary directory"""
+	from save_system import SaveSystem, create_game_state_snapshot
+
+	save_dir = tempfile.mkdtemp(prefix='monster_hunter_bench_')
+	try:
+		save_system = SaveSystem(save_dir)
+		state = create_game_state_snapshot(game)
+		results['save_game'] = measure(lambda: save_system.save_game(state), repeat)
+		results['load_game'] = measure(save_system.load_game, repeat)
+		results['get_save_metadata'] = measure(save_system.get_save_metadata, repeat)
+	finally:
+		shutil.rmtree(save_dir, ignore_errors=True)
+
+def run_benchmarks(repeat=20, scale=3):
+	"""
+	Run the full benchmark suite
+
+	Args:
+		repeat: Timed iterations per benchmark
+		scale: Copies per axis for the synthetic enlarged map
+
+	Returns:
+		Results dictionary
+	"""
+	pygame.init()
+	backend = get_backend('Monster Hunter')
+
+	from main import Game
+
+	results = {}
+
+	# Asset import - first call is cold, the following calls are warm
+	loader = Game.__new__(Game)
+	loader.backend = backend
+	start = perf_counter()
+	loader.import_assets()
+	results['import_assets[cold]'] = {'median': round((perf_counter() - start) * 1000.0, 4), 'repeat': 1}
+	results['import_assets[warm]'] = measure(loader.import_assets, max(1, repeat // 10), warmup=0)
+
+	game = Game()
+
+	# Real maps
+	for map_name, tmx_map in game.tmx_maps.items():
+		spawn = find_spawn(tmx_map)
+		results[f'game.setup[{map_name}]'] = measure(lambda: game.setup(tmx_map, spawn), max(1, repeat // 4), warmup=1)
+		bench_world(game, map_name, results, repeat)
+
+	# Synthetic enlarged map built from the world map
+	if 'world' in game.tmx_maps and scale > 1:
+		game.setup(game.tmx_maps['world'], 'house')
+		enlarge_map(game, game.tmx_maps['world'], scale)
+		bench_world(game, f'world x{scale * scale}', results, repeat)
+
+	bench_battle(game, results, repeat)
+	bench_save_load(game, results, repeat)
+
+	return {
+		'meta': {
+			'python': platform.python_version(),
+			'pygame': pygame.version.ver,
+			'platform': platform.platform(),
+			'video_driver': os.environ.get('SDL_VIDEODRIVER'),
+			'repeat': repeat,
+			'scale': scale,
+		},
+		'results': results,
+	}
+
+def compare(results, baseline, tolerance):
+	"""
+	Compare results against a baseline
+
+	Args:
+		results: Results dictionary from run_benchmarks
+		baseline: Baseline dictionary in the same format
+		tolerance: Allowed slowdown as a fraction (0.15 = 15%)
+
+	Returns:
+		List of (name, baseline_ms, current_ms, ratio) for regressions
+	"""
+	regressions = []
+	for name, current in results['results'].items():
+		previous = baseline.get('results', {}).get(name)
+		if not previous or 'median' not in current or 'median' not in previous:
+			continue
+		if previous['median'] <= 0:
+			continue
+		ratio = current['median'] / previous['median']
+		if ratio > 1 + tolerance:
+			regressions.append((name, previous['median'], current['median'], ratio))
+	return regressions
+
+def main():
+	"""Command line entry point"""
+	parser = argparse.ArgumentParser(description='Headless Monster Hunter benchmarks')
+	parser.add_argument('--repeat', type=int, default=20, help='timed iterations per benchmark')
+	parser.add_argument('--scale', type=int, default=3, help='synthetic map copies per axis')
+	parser.add_argument('--output', type=Path, help='write results JSON to this file')
+	parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE, help='baseline JSON to compare against')
+	parser.add_argument('--save-baseline', action='store_true', help='store results as the new baseline')
+	parser.add_argument('--tolerance', type=float, default=0.15, help='allowed slowdown before failing')
+	args = parser.parse_args()
+
+	# Keep stdout machine-readable: asset loading messages go to stderr
+	with contextlib.redirect_stdout(sys.stderr):
+		results = run_benchmarks(args.repeat, args.scale)
+	output = json.dumps(results, indent=2)
+	print(output)
+
+	if args.output:
+		args.output.write_text(output)
+
+	if args.save_baseline:
+		args.baseline.parent.mkdir(parents=True, exist_ok=True)
+		args.baseline.write_text(output)
+		print(f"Baseline saved to {args.baseline}", file=sys.stderr)
+		return 0
+
+	if not args.baseline.exists():
+		print(f"No baseline at {args.baseline}, skipping comparison", file=sys.stderr)
+		return 0
+
+	regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+	for name, before, after, ratio in regressions:
+		print(f"REGRESSION {name}: {before:.3f} ms -> {after:.3f} ms ({ratio:.2f}x)", file=sys.stderr)
+	if regressions:
+		return 1
+
+	print("No regressions against baseline", file=sys.stderr)
+	return 0
+
+if __name__ == '__main__':
+	exit(main())
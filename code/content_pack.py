@@ -0,0 +1,285 @@
+"""
+Content Pack for Monster Hunter
+Compatible with Pygame CE 2.5.5 and Python 3.13.7
+Compiles the trainer, dialog, monster and attack tables from game_data.py
+into an indexed SQLite pack (integer ids, interned strings) and exposes them
+through read-only mappings that build records only when they are looked up
+
+Usage:
+	python content_pack.py        rebuild data/content_pack.db
+"""
+
+import json
+import sqlite3
+from collections.abc import Mapping
+from pathlib import Path
+
+BASE_PATH = Path(__file__).parent.parent
+PACK_PATH = BASE_PATH / 'data' / 'content_pack.db'
+SOURCE_PATH = Path(__file__).parent / 'game_data.py'
+PACK_VERSION = 1
+
+# Trainer keys with their own columns/tables - anything else is kept in 'extra'
+TRAINER_FIELDS = ('monsters', 'dialog', 'directions', 'look_around', 'defeated', 'biome')
+
+# Stat columns are untyped so ints and floats come back exactly as written
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE strings (id INTEGER PRIMARY KEY, value TEXT NOT NULL UNIQUE);
+CREATE TABLE attacks (
+	id INTEGER PRIMARY KEY, name INTEGER NOT NULL UNIQUE, target INTEGER, amount,
+	cost INTEGER, element INTEGER, animation INTEGER);
+CREATE TABLE monsters (
+	id INTEGER PRIMARY KEY, name INTEGER NOT NULL UNIQUE, element INTEGER, max_health,
+	max_energy, attack, defense, recovery, speed,
+	evolve_into INTEGER, evolve_level INTEGER);
+CREATE TABLE monster_abilities (monster INTEGER, level INTEGER, attack INTEGER);
+CREATE TABLE trainers (
+	id INTEGER PRIMARY KEY, name INTEGER NOT NULL UNIQUE, biome INTEGER,
+	look_around INTEGER, defeated INTEGER, directions TEXT, extra TEXT);
+CREATE TABLE trainer_monsters (trainer INTEGER, slot INTEGER, monster INTEGER, level INTEGER);
+CREATE TABLE dialog_lines (trainer INTEGER, state INTEGER, line INTEGER, text INTEGER);
+CREATE INDEX monster_abilities_monster ON monster_abilities (monster);
+CREATE INDEX trainer_monsters_trainer ON trainer_monsters (trainer);
+CREATE INDEX dialog_lines_trainer ON dialog_lines (trainer);
+"""
+
+def build_pack(path=PACK_PATH):
+	"""
+	Compile the game_data tables into a content pack
+
+	Args:
+		path: Target database file, or ':memory:'
+
+	Returns:
+		sqlite3.Connection: Connection to the finished pack
+	"""
+	from game_data import TRAINER_DATA, MONSTER_DATA, ATTACK_DATA
+
+	if path != ':memory:':
+		path = Path(path)
+		path.parent.mkdir(parents=True, exist_ok=True)
+		tmp_path = path.with_suffix('.tmp')
+		tmp_path.unlink(missing_ok=True)
+		connection = sqlite3.connect(tmp_path)
+	else:
+		connection = sqlite3.connect(path)
+	connection.executescript(SCHEMA)
+
+	# Interned strings - every name, element and dialog line is stored once
+	string_ids = {}
+	def intern(value):
+		if value is None:
+			return None
+		if value not in string_ids:
+			string_ids[value] = len(string_ids)
+			connection.execute("INSERT INTO strings VALUES (?, ?)", (string_ids[value], value))
+		return string_ids[value]
+
+	attack_ids = {name: index for index, name in enumerate(ATTACK_DATA)}
+	monster_ids = {name: index for index, name in enumerate(MONSTER_DATA)}
+
+	for name, data in ATTACK_DATA.items():
+		connection.execute("INSERT INTO attacks VALUES (?, ?, ?, ?, ?, ?, ?)", (
+			attack_ids[name], intern(name), intern(data['target']), data['amount'],
+			data['cost'], intern(data['element']), intern(data['animation'])))
+
+	for name, data in MONSTER_DATA.items():
+		stats = data['stats']
+		evolve = data['evolve']
+		connection.execute("INSERT INTO monsters VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", (
+			monster_ids[name], intern(name), intern(stats['element']), stats['max_health'],
+			stats['max_energy'], stats['attack'], stats['defense'], stats['recovery'], stats['speed'],
+			monster_ids[evolve[0]] if evolve else None, evolve[1] if evolve else None))
+		connection.executemany("INSERT INTO monster_abilities VALUES (?, ?, ?)",
+							   [(monster_ids[name], level, attack_ids[attack])
+								for level, attack in data['abilities'].items()])
+
+	for trainer_id, (key, data) in enumerate(TRAINER_DATA.items()):
+		# Rare per-trainer fields and dialog states without lines (e.g. None) stay as JSON
+		extra = {field: value for field, value in data.items() if field not in TRAINER_FIELDS or value is None}
+		dialog_extra = {state: lines for state, lines in data.get('dialog', {}).items() if not isinstance(lines, list)}
+		if dialog_extra:
+			extra['dialog'] = dialog_extra
+		connection.execute("INSERT INTO trainers VALUES (?, ?, ?, ?, ?, ?, ?)", (
+			trainer_id, intern(key), intern(data.get('biome')), int(data.get('look_around', False)),
+			int(data.get('defeated', False)), ','.join(data.get('directions', [])),
+			json.dumps(extra) if extra else None))
+		connection.executemany("INSERT INTO trainer_monsters VALUES (?, ?, ?, ?)",
+							   [(trainer_id, slot, monster_ids[name], level)
+								for slot, (name, level) in data.get('monsters', {}).items()])
+		for state, lines in data.get('dialog', {}).items():
+			if state in dialog_extra:
+				continue
+			connection.executemany("INSERT INTO dialog_lines VALUES (?, ?, ?, ?)",
+								   [(trainer_id, intern(state), line, intern(text))
+									for line, text in enumerate(lines)])
+
+	connection.execute("INSERT INTO meta VALUES ('version', ?)", (str(PACK_VERSION),))
+	connection.execute("INSERT INTO meta VALUES ('source_mtime', ?)", (repr(SOURCE_PATH.stat().st_mtime),))
+	connection.commit()
+
+	if path != ':memory:':
+		connection.close()
+		tmp_path.replace(path)
+		print(f"Content pack written to {path}")
+		connection = sqlite3.connect(path)
+	return connection
+
+def pack_current(connection):
+	"""Check that an opened pack was built from the current game_data.py"""
+	try:
+		meta = dict(connection.execute("SELECT key, value FROM meta"))
+		return (meta.get('version') == str(PACK_VERSION) and
+				meta.get('source_mtime') == repr(SOURCE_PATH.stat().st_mtime))
+	except (sqlite3.Error, OSError):
+		return False
+
+def open_pack(path=PACK_PATH):
+	"""
+	Open the content pack, rebuilding it when game_data.py changed
+
+	Returns:
+		sqlite3.Connection: Read connection to the pack
+	"""
+	if path.exists():
+		connection = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+		if pack_current(connection):
+			return connection
+		connection.close()
+	try:
+		return build_pack(path)
+	except (sqlite3.Error, OSError) as e:
+		print(f"Could not write content pack ({e}), building it in memory")
+		return build_pack(':memory:')
+
+class PackTable(Mapping):
+	"""Read-only dict-like view of one pack table. Keys are loaded up front;
+	a record is built on first lookup and then kept, so changes to it (e.g. a
+	trainer's 'defeated' flag) last for the session like with the old dicts."""
+
+	def __init__(self, pack, table, build_record):
+		"""
+		Args:
+			pack (ContentPack): Pack the table belongs to
+			table (str): Table with id and name columns
+			build_record: Function (pack, row id) -> record dictionary
+		"""
+		self.pack = pack
+		self.build_record = build_record
+		self.ids = dict(pack.connection.execute(
+			f"SELECT s.value, t.id FROM {table} t JOIN strings s ON s.id = t.name ORDER BY t.id"))
+		self.records = {}
+
+	def __getitem__(self, key):
+		record = self.records.get(key)
+		if record is None:
+			record = self.records[key] = self.build_record(self.pack, self.ids[key])
+		return record
+
+	def __contains__(self, key):
+		return key in self.ids
+
+	def __iter__(self):
+		return iter(self.ids)
+
+	def __len__(self):
+		return len(self.ids)
+
+def _build_attack(pack, attack_id):
+	"""Attack record in the ATTACK_DATA layout"""
+	target, amount, cost, element, animation = pack.connection.execute(
+		"SELECT target, amount, cost, element, animation FROM attacks WHERE id = ?", (attack_id,)).fetchone()
+	return {
+		'target': pack.string(target),
+		'amount': amount,
+		'cost': cost,
+		'element': pack.string(element),
+		'animation': pack.string(animation)
+	}
+
+def _build_monster(pack, monster_id):
+	"""Monster record in the MONSTER_DATA layout"""
+	row = pack.connection.execute(
+		"SELECT element, max_health, max_energy, attack, defense, recovery, speed, evolve_into, evolve_level "
+		"FROM monsters WHERE id = ?", (monster_id,)).fetchone()
+	element, max_health, max_energy, attack, defense, recovery, speed, evolve_into, evolve_level = row
+	abilities = pack.connection.execute(
+		"SELECT m.level, s.value FROM monster_abilities m JOIN attacks a ON a.id = m.attack "
+		"JOIN strings s ON s.id = a.name WHERE m.monster = ? ORDER BY m.rowid", (monster_id,))
+	evolve = None
+	if evolve_into is not None:
+		(evolve_name,) = pack.connection.execute(
+			"SELECT s.value FROM monsters m JOIN strings s ON s.id = m.name WHERE m.id = ?", (evolve_into,)).fetchone()
+		evolve = (evolve_name, evolve_level)
+	return {
+		'stats': {
+			'element': pack.string(element),
+			'max_health': max_health,
+			'max_energy': max_energy,
+			'attack': attack,
+			'defense': defense,
+			'recovery': recovery,
+			'speed': speed
+		},
+		'abilities': dict(abilities),
+		'evolve': evolve
+	}
+
+def _build_trainer(pack, trainer_id):
+	"""Trainer record in the TRAINER_DATA layout"""
+	biome, look_around, defeated, directions, extra = pack.connection.execute(
+		"SELECT biome, look_around, defeated, directions, extra FROM trainers WHERE id = ?", (trainer_id,)).fetchone()
+	extra = json.loads(extra) if extra else {}
+	monsters = pack.connection.execute(
+		"SELECT t.slot, s.value, t.level FROM trainer_monsters t JOIN monsters m ON m.id = t.monster "
+		"JOIN strings s ON s.id = m.name WHERE t.trainer = ? ORDER BY t.rowid", (trainer_id,))
+	dialog = {}
+	for state, text in pack.connection.execute(
+			"SELECT state, text FROM dialog_lines WHERE trainer = ? ORDER BY rowid", (trainer_id,)):
+		dialog.setdefault(pack.string(state), []).append(pack.string(text))
+	dialog.update(extra.pop('dialog', {}))
+	record = {
+		'monsters': {slot: (name, level) for slot, name, level in monsters},
+		'dialog': dialog,
+		'directions': directions.split(',') if directions else [],
+		'look_around': bool(look_around),
+		'defeated': bool(defeated)
+	}
+	if biome is not None:
+		record['biome'] = pack.string(biome)
+	record.update(extra)
+	return record
+
+class ContentPack:
+	"""Open content pack with TRAINER_DATA / MONSTER_DATA / ATTACK_DATA style tables"""
+
+	def __init__(self, path=PACK_PATH):
+		"""
+		Args:
+			path: Pack file, rebuilt from game_data.py when missing or outdated
+		"""
+		self.connection = open_pack(Path(path))
+		self.strings = {}
+		self.trainers = PackTable(self, 'trainers', _build_trainer)
+		self.monsters = PackTable(self, 'monsters', _build_monster)
+		self.attacks = PackTable(self, 'attacks', _build_attack)
+
+	def string(self, string_id):
+		"""Look up an interned string (cached after the first read)"""
+		if string_id is None:
+			return None
+		value = self.strings.get(string_id)
+		if value is None:
+			(value,) = self.connection.execute("SELECT value FROM strings WHERE id = ?", (string_id,)).fetchone()
+			self.strings[string_id] = value
+		return value
+
+content = ContentPack()
+TRAINER_DATA = content.trainers
+MONSTER_DATA = content.monsters
+ATTACK_DATA = content.attacks
+
+if __name__ == '__main__':
+	content.connection.close()
+	build_pack().close()
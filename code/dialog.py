@@ -6,6 +6,11 @@ Handles NPC dialog trees and speech bubbles
 
 from settings import * 
 from timer import Timer
+from text_layout import TextLayout, Typewriter
+from text_render import SurfaceCache
+
+# Panel templates (everything except the message), a few speakers at a time
+template_cache = SurfaceCache(16)
 
 class DialogTree:
 	"""Manages dialog sequences with NPCs"""
@@ -33,18 +38,19 @@ class DialogTree:
 		self.dialog_index = 0
 
 		# Get character name (defaults to "NPC" if not available)
-		character_name = getattr(character, 'name', None)
-		if not character_name:
-			character_name = "Nurse" if character.nurse else "Trainer"
+		self.character_name = getattr(character, 'name', None)
+		if not self.character_name:
+			self.character_name = "Nurse" if character.nurse else "Trainer"
 
-		# Create first dialog sprite
+		# Create first dialog sprite - its panel surface is reused for every later line
 		self.current_dialog = DialogSprite(
 			self.dialog[self.dialog_index], 
 			self.character, 
 			self.all_sprites, 
 			self.font,
-			character_name
+			self.character_name
 		)
+		self.panel = self.current_dialog.image
 		self.dialog_timer = Timer(500, autostart=True)
 
 	def input(self):
@@ -52,23 +58,24 @@ class DialogTree:
 		keys = pygame.key.get_just_pressed()
 		
 		if keys[pygame.K_SPACE] and not self.dialog_timer.active:
+			# Finish typing the page or turn to the next page of a long message
+			if self.current_dialog.advance():
+				self.dialog_timer.activate()
+				return
+			
 			# Remove current dialog sprite
 			self.current_dialog.kill()
 			self.dialog_index += 1
 			
 			# Create next dialog or end conversation
 			if self.dialog_index < self.dialog_num:
-				# Get character name (defaults to "NPC" if not available)
-				character_name = getattr(self.character, 'name', None)
-				if not character_name:
-					character_name = "Nurse" if self.character.nurse else "Trainer"
-				
 				self.current_dialog = DialogSprite(
 					self.dialog[self.dialog_index], 
 					self.character, 
 					self.all_sprites, 
 					self.font,
-					character_name
+					self.character_name,
+					self.panel
 				)
 				self.dialog_timer.activate()
 			else:
@@ -83,7 +90,22 @@ class DialogTree:
 class DialogSprite(pygame.sprite.Sprite):
 	"""Dialog box that appears at the bottom of the screen in classic RPG style"""
 	
-	def __init__(self, message, character, groups, font, character_name="NPC"):
+	# Dialog box dimensions (classic RPG style at bottom of screen)
+	BOX_WIDTH = WINDOW_WIDTH - 80  # Leave 40px margin on each side
+	BOX_HEIGHT = 140
+	PADDING = 20
+	NAME_HEIGHT = 35
+	NAME_OFFSET = 20  # How much the name box sticks out above dialog
+	PORTRAIT_SIZE = 100  # Size of character portrait
+	PORTRAIT_PADDING = 10
+	TEXT_TOP = NAME_OFFSET + PADDING + 10
+	TEXT_WIDTH = BOX_WIDTH - PORTRAIT_SIZE - PORTRAIT_PADDING * 3 - PADDING
+	TEXT_BOTTOM = NAME_OFFSET + BOX_HEIGHT - PADDING - 20  # Above the "Press SPACE" hint
+	CHARS_PER_SECOND = 45
+	
+	hint_font = None
+	
+	def __init__(self, message, character, groups, font, character_name="NPC", panel=None):
 		"""
 		Create a dialog sprite
 		
@@ -93,27 +115,100 @@ class DialogSprite(pygame.sprite.Sprite):
 			groups: Sprite groups to add to
 			font: Font for rendering text
 			character_name: Name of the character speaking
+			panel: Surface of a previous line of the same conversation to draw into
 		"""
 		super().__init__(groups)
 		self.z = WORLD_LAYERS['top']
 		self.is_ui = True  # Mark as UI element to skip camera offset
+		
+		self.template = self.get_template(character_name, self.portrait_frame(character), font)
+		if panel is None or panel.get_size() != self.template.get_size():
+			panel = self.template.copy()
+		
+		# Message wrapped to the text area and split into pages, typed out over time
+		max_lines = max(1, (self.TEXT_BOTTOM - self.TEXT_TOP) // (font.get_linesize() + 4))
+		self.layout = TextLayout(message, font, self.TEXT_WIDTH, max_lines, COLORS['white'])
+		self.typewriter = Typewriter(self.layout, self.CHARS_PER_SECOND)
 
-		# Dialog box dimensions (classic RPG style at bottom of screen)
-		box_width = WINDOW_WIDTH - 80  # Leave 40px margin on each side
-		box_height = 140
-		padding = 20
-		name_height = 35
-		name_offset = 20  # How much the name box sticks out above dialog
-		portrait_size = 100  # Size of character portrait
-		portrait_padding = 10
+		# Set sprite image and position at bottom of screen
+		self.image = panel
+		self.rect = self.image.get_frect(midbottom=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 30))
+		self.redraw()
+	
+	def redraw(self):
+		"""Compose the panel template and the revealed message text"""
+		# Panel is fully transparent after the fill, so MAX copies the template exactly
+		self.image.fill((0, 0, 0, 0))
+		self.image.blit(self.template, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+		self.typewriter.draw(self.image, (self.PADDING, self.TEXT_TOP))
+	
+	def advance(self):
+		"""
+		Handle a continue press inside this message
+		
+		Returns:
+			bool: True if the press was used (page revealed or turned),
+				False when the message is finished
+		"""
+		if not self.typewriter.page_complete:
+			self.typewriter.reveal_page()
+		elif not self.typewriter.next_page():
+			return False
+		self.redraw()
+		return True
+	
+	def update(self, dt):
+		"""Type out the message (the panel is only recomposed when text appears)"""
+		if self.typewriter.update(dt):
+			self.redraw()
+	
+	@classmethod
+	def get_hint_font(cls):
+		"""Font for the "Press SPACE" hint, loaded once"""
+		if cls.hint_font is None:
+			cls.hint_font = pygame.font.Font(None, 24)
+		return cls.hint_font
+	
+	@staticmethod
+	def portrait_frame(character):
+		"""Base frame of a character (facing down, idle) used for the portrait,
+		so the portrait and its template don't change with the animation frame"""
+		frames = getattr(character, 'frames', None)
+		if frames and frames.get('down_idle'):
+			return frames['down_idle'][0]
+		return character.image
+	
+	@classmethod
+	def get_template(cls, character_name, character_image, font):
+		"""
+		Get the dialog panel for a speaker, building it on first use
+		
+		Args:
+			character_name: Name shown in the name box
+			character_image: Character base frame used for the portrait
+			font: Font for the name
+		
+		Returns:
+			pygame.Surface: Panel with frame, name box, portrait and hint (shared, do not draw on it)
+		"""
+		key = (character_name, character_image, font, (cls.BOX_WIDTH, cls.BOX_HEIGHT))
+		return template_cache.get(key, lambda: cls.build_template(character_name, character_image, font))
+	
+	@classmethod
+	def build_template(cls, character_name, character_image, font):
+		"""Draw a dialog panel without its message"""
+		box_width = cls.BOX_WIDTH
+		box_height = cls.BOX_HEIGHT
+		padding = cls.PADDING
+		name_offset = cls.NAME_OFFSET
+		portrait_size = cls.PORTRAIT_SIZE
+		portrait_padding = cls.PORTRAIT_PADDING
 		
 		# Create main surface with extra height for name box
 		total_height = box_height + name_offset
 		surf = pygame.Surface((box_width, total_height), pygame.SRCALPHA)
 		surf.fill((0, 0, 0, 0))
 		
-		# Get character sprite image
-		character_image = character.image.copy()
 		# Scale character sprite to fit portrait area
 		portrait_surf = pygame.transform.scale(character_image, (portrait_size, portrait_size))
 		
@@ -144,7 +239,7 @@ class DialogSprite(pygame.sprite.Sprite):
 		# Draw character name box (now fully visible at top)
 		name_surf = font.render(character_name, False, COLORS['white'])
 		name_box_width = name_surf.get_width() + 30
-		name_box_rect = pygame.FRect(15, 0, name_box_width, name_height)
+		name_box_rect = pygame.FRect(15, 0, name_box_width, cls.NAME_HEIGHT)
 		
 		pygame.draw.rect(
 			surf, 
@@ -189,24 +284,14 @@ class DialogSprite(pygame.sprite.Sprite):
 		# Blit character portrait
 		surf.blit(portrait_surf, (portrait_x, portrait_y))
 		
-		# Render and wrap text for the message
-		text_surf = font.render(message, False, COLORS['white'])
-		
 		# Calculate text area width (leave space for portrait)
 		text_area_width = box_width - portrait_size - portrait_padding * 3
 		
-		# Blit message text (adjust for name offset)
-		text_rect = text_surf.get_frect(topleft=(padding, name_offset + padding + 10))
-		surf.blit(text_surf, text_rect)
-		
 		# Draw "Press SPACE" indicator in bottom right (but left of portrait)
-		small_font = pygame.font.Font(None, 24)
-		indicator_surf = small_font.render("Press SPACE", False, COLORS['light-gray'])
+		indicator_surf = cls.get_hint_font().render("Press SPACE", False, COLORS['light-gray'])
 		# Position to the left of the portrait area
 		indicator_x = text_area_width - indicator_surf.get_width()
 		indicator_rect = indicator_surf.get_frect(bottomleft=(indicator_x, total_height - padding + 5))
 		surf.blit(indicator_surf, indicator_rect)
-
-		# Set sprite image and position at bottom of screen
-		self.image = surf
-		self.rect = self.image.get_frect(midbottom=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 30))
+		
+		return surf
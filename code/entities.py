@@ -7,7 +7,7 @@ Handles player and NPC character behavior
 from settings import * 
 from support import check_connections
 from timer import Timer
-from random import choice
+from rng import get_stream
 from monster import Monster
 
 class Entity(pygame.sprite.Sprite):
@@ -105,7 +105,7 @@ class Character(Entity):
 	def random_view_direction(self):
 		"""Randomly change view direction if character can rotate"""
 		if self.can_rotate:
-			self.facing_direction = choice(self.view_directions)
+			self.facing_direction = get_stream('ai').choice(self.view_directions)
 
 	def get_dialog(self):
 		"""Get appropriate dialog based on character state"""
@@ -5,6 +5,7 @@ Displays evolution transformation animation
 """
 
 from settings import * 
+from render_backend import get_render_queue
 from timer import Timer
 
 class Evolution:
@@ -22,7 +23,7 @@ class Evolution:
 			end_evolution: Callback when animation completes
 			star_frames: List of star animation frames
 		"""
-		self.display_surface = pygame.display.get_surface()
+		self.render_queue = get_render_queue()
 		
 		# Monster sprites
 		self.start_monster_surf = pygame.transform.scale2x(frames[start_monster]['idle'][0])
@@ -38,10 +39,6 @@ class Evolution:
 		self.star_frames = [pygame.transform.scale2x(frame) for frame in star_frames]
 		self.frame_index = 0.0
 
-		# Screen tint
-		self.tint_surf = pygame.Surface(self.display_surface.get_size())
-		self.tint_surf.set_alpha(200)
-
 		# White tint for flash effect
 		self.start_monster_surf_white = pygame.mask.from_surface(self.start_monster_surf).to_surface()
 		self.start_monster_surf_white.set_colorkey('black')
@@ -64,7 +61,7 @@ class Evolution:
 		if self.frame_index < len(self.star_frames):
 			frame = self.star_frames[int(self.frame_index)]
 			rect = frame.get_frect(center=(WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2))
-			self.display_surface.blit(frame, rect)
+			self.render_queue.sprite(frame, rect)
 
 	def update(self, dt):
 		"""
@@ -79,39 +76,39 @@ class Evolution:
 
 		# Show animation after start timer completes
 		if not self.timers['start'].active:
-			self.display_surface.blit(self.tint_surf, (0, 0))
+			self.render_queue.tint(COLORS['black'], 200, layer=RENDER_LAYERS['ui'])
 			
 			# First phase: Show starting monster with white flash
 			if self.tint_amount < 255:
 				rect = self.start_monster_surf.get_frect(center=(WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2))
-				self.display_surface.blit(self.start_monster_surf, rect)
+				self.render_queue.sprite(self.start_monster_surf, rect)
 
 				# Fade in white overlay
 				self.tint_amount += self.tint_speed * dt
 				self.tint_amount = min(self.tint_amount, 255.0)
 				self.start_monster_surf_white.set_alpha(int(self.tint_amount))
-				self.display_surface.blit(self.start_monster_surf_white, rect)
+				self.render_queue.sprite(self.start_monster_surf_white, rect)
 
 				# Display "is evolving" text
 				text_rect = self.start_text_surf.get_frect(midtop=rect.midbottom + vector(0, 20))
-				pygame.draw.rect(
-					self.display_surface, COLORS['white'], 
+				self.render_queue.rect(
+					COLORS['white'], 
 					text_rect.inflate(20, 20), 0, 5
 				)
-				self.display_surface.blit(self.start_text_surf, text_rect)
+				self.render_queue.sprite(self.start_text_surf, text_rect)
 
 			# Second phase: Show evolved monster with stars
 			else:
 				rect = self.end_monster_surf.get_frect(center=(WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2))
-				self.display_surface.blit(self.end_monster_surf, rect)
+				self.render_queue.sprite(self.end_monster_surf, rect)
 				
 				# Display "evolved into" text
 				text_rect = self.end_text_surf.get_frect(midtop=rect.midbottom + vector(0, 20))
-				pygame.draw.rect(
-					self.display_surface, COLORS['white'], 
+				self.render_queue.rect(
+					COLORS['white'], 
 					text_rect.inflate(20, 20), 0, 5
 				)
-				self.display_surface.blit(self.end_text_surf, text_rect)
+				self.render_queue.sprite(self.end_text_surf, text_rect)
 				
 				# Show star animation
 				self.display_stars(dt)
@@ -0,0 +1,209 @@
+"""
+Frame Cache for Monster Hunter
+Compatible with Pygame CE 2.5.5 and Python 3.13.7
+Shared pieces of the streaming video and GIF players: a memory-mapped file of
+pre-scaled raw frames written during the first playback, and the decoder
+thread that feeds a player until the cache takes over
+"""
+
+from settings import *
+from pathlib import Path
+import json
+import mmap
+import os
+import threading
+
+class FrameCache:
+	"""Raw frames at playback size in one file, with a JSON info file next to
+	it. Built once by a decoder thread, then mapped and shown without copying"""
+
+	def __init__(self, source_path, cache_path, size, mode='RGB', label='Frame'):
+		"""
+		Initialize frame cache
+
+		Args:
+			source_path: Video or image the frames are decoded from
+			cache_path: Raw frame file, the info file uses the same name with .json
+			size: Frame size (width, height)
+			mode: Pixel format of the frames ('RGB' or 'RGBA')
+			label: Name used in log messages
+		"""
+		self.source_path = Path(source_path)
+		self.path = Path(cache_path)
+		self.info_path = self.path.with_suffix('.json')
+		self.temp_path = self.path.with_suffix('.tmp')
+		self.size = tuple(size)
+		self.mode = mode
+		self.label = label
+		self.frame_size = self.size[0] * self.size[1] * len(mode)
+
+		# Build state (written by the decoder thread)
+		self.writer = None
+		self.frames_written = 0
+		self.ready = False
+
+		# Playback state
+		self.info = None
+		self.frame_count = 0
+		self.file = None
+		self.map = None
+		self.view = None
+
+	@property
+	def building(self):
+		"""True while frames are being written"""
+		return self.writer is not None
+
+	@property
+	def mapped(self):
+		"""True once the cache is mapped for playback"""
+		return self.map is not None
+
+	def source_signature(self):
+		"""Size and modification time of the source file"""
+		stat = self.source_path.stat()
+		return {'source_size': stat.st_size, 'source_mtime': stat.st_mtime}
+
+	def valid(self):
+		"""Check that a finished cache exists for this source, size and mode"""
+		if not (self.path.exists() and self.info_path.exists() and self.source_path.exists()):
+			return False
+		try:
+			info = json.loads(self.info_path.read_text())
+			signature = self.source_signature()
+			return (info['width'] == self.size[0] and info['height'] == self.size[1] and
+					info['mode'] == self.mode and
+					info['source_size'] == signature['source_size'] and
+					info['source_mtime'] == signature['source_mtime'] and
+					self.path.stat().st_size == info['frame_count'] * self.frame_size)
+		except Exception as e:
+			print(f"Ignoring {self.label.lower()} cache: {e}")
+			return False
+
+	def start_build(self):
+		"""Start writing frames to a temporary cache file"""
+		try:
+			self.path.parent.mkdir(exist_ok=True)
+			self.writer = open(self.temp_path, 'wb')
+			self.frames_written = 0
+		except Exception as e:
+			print(f"Could not create {self.label.lower()} cache: {e}")
+			self.writer = None
+
+	def write(self, data):
+		"""Append one frame of raw pixels (bytes or a contiguous array)"""
+		self.writer.write(data)
+		self.frames_written += 1
+
+	def finish_build(self, **info):
+		"""
+		Finalize the cache after one full pass through the source (decoder thread)
+
+		Args:
+			**info: Player specific playback data stored in the info file (e.g. fps)
+		"""
+		try:
+			self.writer.close()
+			self.writer = None
+			if self.frames_written == 0:
+				return
+			info = {
+				'width': self.size[0],
+				'height': self.size[1],
+				'mode': self.mode,
+				'frame_count': self.frames_written,
+				**info,
+				**self.source_signature()
+			}
+			os.replace(self.temp_path, self.path)
+			self.info_path.write_text(json.dumps(info))
+			self.ready = True
+			print(f"{self.label} cache written: {self.frames_written} frames of {self.source_path.name}")
+		except Exception as e:
+			print(f"Could not finish {self.label.lower()} cache: {e}")
+			self.writer = None
+
+	def discard_build(self):
+		"""Close and delete an unfinished cache file (only once the decoder has exited)"""
+		if self.writer:
+			self.writer.close()
+			self.writer = None
+			self.temp_path.unlink(missing_ok=True)
+
+	def open(self):
+		"""
+		Map the cache file for playback
+
+		Returns:
+			dict: Contents of the info file
+		"""
+		self.info = json.loads(self.info_path.read_text())
+		self.frame_count = self.info['frame_count']
+		self.file = open(self.path, 'rb')
+		self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+		self.view = memoryview(self.map)
+		return self.info
+
+	def frame(self, index):
+		"""Surface that points directly at a frame inside the mapping (no copy)"""
+		offset = index * self.frame_size
+		return pygame.image.frombuffer(self.view[offset:offset + self.frame_size], self.size, self.mode)
+
+	def close(self):
+		"""Unmap the cache. Surfaces from frame must be released first"""
+		if self.map is not None:
+			self.view.release()
+			self.map.close()
+			self.file.close()
+			self.map = None
+			self.view = None
+
+class DecoderThread:
+	"""Background decoder thread. The target loops while running is True and
+	waits on condition for room in its player's frame buffer"""
+
+	def __init__(self, target, name):
+		"""
+		Initialize decoder thread
+
+		Args:
+			target: Decode loop to run on the thread
+			name: Thread name
+		"""
+		self.target = target
+		self.name = name
+		self.condition = threading.Condition()
+		self.running = False
+		self.thread = None
+
+	@property
+	def active(self):
+		"""True from start until the thread has been stopped"""
+		return self.thread is not None
+
+	def start(self):
+		"""Start the thread"""
+		self.running = True
+		self.thread = threading.Thread(target=self.target, name=self.name, daemon=True)
+		self.thread.start()
+
+	def stop(self, timeout=1.0):
+		"""
+		Stop the thread
+
+		Args:
+			timeout (float): Seconds to wait for the thread to exit
+
+		Returns:
+			bool: True once the thread has exited. A decoder still inside a read
+				keeps using its source and the cache writer, so they must stay open
+		"""
+		if self.thread:
+			with self.condition:
+				self.running = False
+				self.condition.notify()
+			self.thread.join(timeout)
+			if self.thread.is_alive():
+				return False
+			self.thread = None
+		return True
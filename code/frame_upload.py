@@ -0,0 +1,69 @@
+"""
+Frame Upload Helpers for Monster Hunter
+Compatible with Pygame CE 2.5.5 and Python 3.13.7
+Moves decoded pixel data (OpenCV/NumPy arrays, PIL image bytes) into pygame surfaces
+without per-frame surface allocation
+"""
+
+from settings import *
+import numpy as np
+
+class FrameUploader:
+	"""Writes decoded RGB frames into one persistent target surface"""
+
+	def __init__(self, size=(WINDOW_WIDTH, WINDOW_HEIGHT), alpha=False):
+		"""
+		Create the target surface
+
+		Args:
+			size: Frame size (width, height)
+			alpha: Keep a per-pixel alpha channel (for RGBA sources)
+		"""
+		self.size = tuple(size)
+		self.alpha = alpha
+		self.surface = pygame.Surface(self.size, pygame.SRCALPHA if alpha else 0)
+
+		# Display format makes the later blit to the screen a plain copy
+		if pygame.display.get_surface():
+			self.surface = self.surface.convert_alpha() if alpha else self.surface.convert()
+
+	def upload(self, pixels):
+		"""
+		Copy a frame into the target surface
+
+		Args:
+			pixels: uint8 array of shape (height, width, 3) in RGB order,
+				or (height, width, 4) RGBA when the uploader has alpha
+
+		Returns:
+			The persistent target surface
+		"""
+		# Surfarray is column-major (width, height) - swapaxes is a view, not a copy
+		pygame.surfarray.blit_array(self.surface, pixels[..., :3].swapaxes(0, 1))
+		if self.alpha and pixels.shape[2] == 4:
+			alpha_view = pygame.surfarray.pixels_alpha(self.surface)
+			np.copyto(alpha_view, pixels[..., 3].swapaxes(0, 1))
+			del alpha_view  # release the surface lock
+		return self.surface
+
+	def upload_buffer(self, data, mode='RGB'):
+		"""
+		Copy raw frame bytes (e.g. PIL Image.tobytes or a memory map slice)
+		into the target surface
+
+		Args:
+			data: Bytes-like object holding width * height pixels
+			mode: Pixel layout ('RGB' or 'RGBA')
+
+		Returns:
+			The persistent target surface
+		"""
+		if self.alpha:
+			# A blit would blend with the previous frame - copy the channels instead
+			pixels = np.frombuffer(data, np.uint8).reshape(self.size[1], self.size[0], len(mode))
+			return self.upload(pixels)
+
+		# frombuffer wraps the bytes without copying them
+		source = pygame.image.frombuffer(data, self.size, mode)
+		self.surface.blit(source, (0, 0))
+		return self.surface
@@ -7,13 +7,14 @@ Handles sprite rendering with camera offset and layering
 from settings import * 
 from support import import_image
 from entities import Entity
+from render_backend import get_render_queue
 
 class AllSprites(pygame.sprite.Group):
 	"""Sprite group for overworld rendering with camera offset"""
 	
 	def __init__(self):
 		super().__init__()
-		self.display_surface = pygame.display.get_surface()
+		self.render_queue = get_render_queue()
 		self.offset = vector(0, 0)
 		
 		# Load UI elements with correct path
@@ -41,7 +42,7 @@ class AllSprites(pygame.sprite.Group):
 		if player is None:
 			# Fallback: no camera offset
 			for sprite in self:
-				self.display_surface.blit(sprite.image, sprite.rect)
+				self.render_queue.sprite(sprite.image, sprite.rect.topleft, layer=RENDER_LAYERS['world'])
 			return
 		
 		# Calculate camera offset
@@ -56,6 +57,11 @@ class AllSprites(pygame.sprite.Group):
 		)
 		fg_sprites = [sprite for sprite in self if sprite.z > WORLD_LAYERS['main']]
 
+		# World sprites are queued on the world layer (textures on the GPU
+		# backend), UI sprites such as dialog boxes on the UI layer
+		queue = self.render_queue
+		world_layer = RENDER_LAYERS['world']
+
 		# Draw each layer
 		for layer in (bg_sprites, main_sprites, fg_sprites):
 			for sprite in layer:
@@ -66,22 +72,25 @@ class AllSprites(pygame.sprite.Group):
 				# Draw shadow for entities
 				if isinstance(sprite, Entity):
 					shadow_pos = sprite.rect.topleft + offset + vector(40, 110)
-					self.display_surface.blit(self.shadow_surf, shadow_pos)
+					queue.sprite(self.shadow_surf, shadow_pos, layer=world_layer)
 				
 				# Draw sprite
-				self.display_surface.blit(sprite.image, sprite.rect.topleft + offset)
+				if is_ui:
+					queue.sprite(sprite.image, sprite.rect.topleft, layer=RENDER_LAYERS['ui'])
+				else:
+					queue.sprite(sprite.image, sprite.rect.topleft + offset, layer=world_layer)
 				
 				# Draw notice indicator for player
 				if sprite == player and hasattr(player, 'noticed') and player.noticed:
 					rect = self.notice_surf.get_frect(midbottom=sprite.rect.midtop)
-					self.display_surface.blit(self.notice_surf, rect.topleft + offset)
+					queue.sprite(self.notice_surf, rect.topleft + offset, layer=world_layer)
 
 class BattleSprites(pygame.sprite.Group):
 	"""Sprite group for battle rendering with outline highlighting"""
 	
 	def __init__(self):
 		super().__init__()
-		self.display_surface = pygame.display.get_surface()
+		self.render_queue = get_render_queue()
 
 	def draw(self, current_monster_sprite, side, mode, target_index, player_sprites, opponent_sprites):
 		"""
@@ -125,7 +134,7 @@ class BattleSprites(pygame.sprite.Group):
 				)
 				
 				if show_current_outline or show_target_outline:
-					self.display_surface.blit(sprite.image, sprite.rect)
+					self.render_queue.sprite(sprite.image, sprite.rect.topleft)
 			else:
 				# Draw all other layers normally
-				self.display_surface.blit(sprite.image, sprite.rect)
+				self.render_queue.sprite(sprite.image, sprite.rect.topleft)
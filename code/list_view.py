@@ -0,0 +1,63 @@
+"""
+List View for Monster Hunter
+Compatible with Pygame CE 2.5.5 and Python 3.13.7
+Virtualized scrolling list: a cursor and a window of visible rows over a
+list of any length. Only the visible rows are ever looked at, so moving and
+drawing cost the same for six entries or thousands
+"""
+
+class ListView:
+	"""Cursor and scroll window over count items"""
+
+	def __init__(self, visible_items, item_height, count=0):
+		"""
+		Initialize list view
+
+		Args:
+			visible_items (int): Rows that fit in the view
+			item_height (float): Row height in pixels
+			count (int): Number of items
+		"""
+		self.visible_items = visible_items
+		self.item_height = item_height
+		self.count = 0
+		self.index = 0  # Cursor
+		self.top = 0  # First visible item
+		self.set_count(count)
+
+	def set_count(self, count):
+		"""Change the number of items, keeping the cursor in range and in view"""
+		self.count = max(0, count)
+		self.index = min(self.index, max(0, self.count - 1))
+		self.top = max(0, min(self.top, self.count - self.visible_items))
+		self.scroll_into_view()
+
+	def move(self, delta):
+		"""Move the cursor, wrapping around at both ends"""
+		if self.count:
+			self.index = (self.index + delta) % self.count
+			self.scroll_into_view()
+
+	def select(self, index):
+		"""Put the cursor on an item"""
+		self.index = max(0, min(index, self.count - 1))
+		self.scroll_into_view()
+
+	def scroll_into_view(self):
+		"""Scroll the least amount needed to show the cursor"""
+		if self.index < self.top:
+			self.top = self.index
+		elif self.index >= self.top + self.visible_items:
+			self.top = self.index - self.visible_items + 1
+
+	def visible_range(self):
+		"""Indexes of the visible items"""
+		return range(self.top, min(self.top + self.visible_items, self.count))
+
+	def row(self, index):
+		"""Position of an item in the view (0 is the top row)"""
+		return index - self.top
+
+	def offset(self, index):
+		"""Vertical pixel offset of an item from the top of the view"""
+		return (index - self.top) * self.item_height
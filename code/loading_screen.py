@@ -5,6 +5,8 @@ Shows animated loading screen with click-to-continue prompt
 import pygame
 from pathlib import Path
 from settings import *
+from animated_image import AnimatedImage
+from text_render import render_outlined_text
 
 # Try to import PIL for GIF support, but don't fail if not available
 try:
@@ -26,7 +28,8 @@ class LoadingScreen:
 		self.elapsed_time = 0.0
 		self.show_prompt_after = 3.0  # Show prompt after 3 seconds
 		
-		# GIF animation (background)
+		# GIF animation (background, streamed) and placeholder frames
+		self.player = None
 		self.gif_frames = []
 		self.current_frame_index = 0
 		self.frame_duration = 0.1  # 100ms per frame (10 FPS)
@@ -41,6 +44,16 @@ class LoadingScreen:
 		# Load custom font for prompt
 		self.prompt_font = self.load_custom_font('SVN-Determination Sans', 32)
 		
+		# Prompt is rendered once - copied because its alpha pulses every frame
+		self.prompt_surf = self.render_text_with_outline(
+			"Click anywhere to continue",
+			self.prompt_font,
+			(255, 255, 255),  # White
+			(0, 0, 0),        # Black outline
+			outline_width=3
+		).copy()
+		self.prompt_rect = self.prompt_surf.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 150))
+		
 		# Background
 		self.background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
 		self.background.fill((0, 0, 0))
@@ -58,39 +71,9 @@ class LoadingScreen:
 				return
 			
 			if gif_path.exists():
-				print(f"Loading GIF: {gif_path}")
-				
-				# Open GIF with PIL
-				gif = Image.open(str(gif_path))
-				
-			# Extract all frames
-			frame_count = 0
-			try:
-				while True:
-					# Convert PIL image to pygame surface
-					frame = gif.convert('RGBA')
-					
-					# Scale to full screen
-					frame = frame.resize((WINDOW_WIDTH, WINDOW_HEIGHT), Image.Resampling.LANCZOS)
-					
-					# Convert to pygame surface
-					mode = frame.mode
-					size = frame.size
-					data = frame.tobytes()
-					
-					py_image = pygame.image.fromstring(data, size, mode)
-					self.gif_frames.append(py_image)
-					
-					frame_count += 1
-					gif.seek(gif.tell() + 1)
-			except EOFError:
-				pass  # End of GIF frames
-				
-				print(f"Loaded {frame_count} frames from GIF")
-				
-				# Set frame duration based on GIF info
-				if hasattr(gif, 'info') and 'duration' in gif.info:
-					self.frame_duration = gif.info['duration'] / 1000.0  # Convert ms to seconds
+				# Frames are decoded on a worker just ahead of playback
+				print(f"Streaming GIF: {gif_path}")
+				self.player = AnimatedImage(gif_path, disk_cache=GIF_FRAME_CACHE)
 				
 			else:
 				print(f"Loading GIF not found at {gif_path}, using placeholder")
@@ -156,25 +139,8 @@ class LoadingScreen:
 			return pygame.font.Font(None, size)
 	
 	def render_text_with_outline(self, text, font, text_color, outline_color, outline_width=3):
-		"""Render text with outline effect"""
-		# Render the main text
-		text_surf = font.render(text, True, text_color)
-		w, h = text_surf.get_size()
-		
-		# Create a larger surface to hold text + outline
-		outline_surf = pygame.Surface((w + outline_width * 2, h + outline_width * 2), pygame.SRCALPHA)
-		
-		# Render outline by drawing text in all directions
-		for dx in range(-outline_width, outline_width + 1):
-			for dy in range(-outline_width, outline_width + 1):
-				if dx != 0 or dy != 0:
-					outline_text = font.render(text, True, outline_color)
-					outline_surf.blit(outline_text, (dx + outline_width, dy + outline_width))
-		
-		# Draw the main text on top
-		outline_surf.blit(text_surf, (outline_width, outline_width))
-		
-		return outline_surf
+		"""Render text with outline effect (shared surface from the text cache)"""
+		return render_outlined_text(text, font, text_color, outline_color, outline_width)
 	
 	def update(self, dt):
 		"""Update loading screen state"""
@@ -185,7 +151,9 @@ class LoadingScreen:
 		self.elapsed_time += dt
 		
 		# Update GIF animation
-		if self.gif_frames:
+		if self.player:
+			self.player.update(dt)
+		elif self.gif_frames:
 			self.frame_timer += dt
 			if self.frame_timer >= self.frame_duration:
 				self.frame_timer -= self.frame_duration
@@ -201,6 +169,7 @@ class LoadingScreen:
 				if not self.clicked:  # Only register once
 					self.clicked = True
 					self.active = False
+					self.cleanup()
 					return False  # Signal that loading is complete
 		
 		return True  # Still loading
@@ -208,7 +177,9 @@ class LoadingScreen:
 	def draw(self):
 		"""Draw loading screen"""
 		# Draw GIF as full-screen background
-		if self.gif_frames:
+		if self.player and self.player.current_frame:
+			self.player.draw(self.display_surface)
+		elif self.gif_frames:
 			current_frame = self.gif_frames[self.current_frame_index]
 			self.display_surface.blit(current_frame, (0, 0))
 		else:
@@ -224,23 +195,19 @@ class LoadingScreen:
 		
 		# Draw "Click anywhere to continue" after delay
 		if self.elapsed_time >= self.show_prompt_after:
-			prompt_text = "Click anywhere to continue"
-			prompt_surf = self.render_text_with_outline(
-				prompt_text,
-				self.prompt_font,
-				(255, 255, 255),  # White
-				(0, 0, 0),        # Black outline
-				outline_width=3
-			)
-			prompt_rect = prompt_surf.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 150))
-			
 			# Add subtle pulse effect
 			pulse = abs((self.elapsed_time * 2) % 2 - 1)  # 0 to 1 to 0
 			alpha = int(150 + 105 * pulse)  # Pulse between 150 and 255
-			prompt_surf.set_alpha(alpha)
+			self.prompt_surf.set_alpha(alpha)
 			
-			self.display_surface.blit(prompt_surf, prompt_rect)
+			self.display_surface.blit(self.prompt_surf, self.prompt_rect)
 	
 	def is_complete(self):
 		"""Check if loading is complete"""
 		return not self.active
+	
+	def cleanup(self):
+		"""Stop GIF decoding and release its frames"""
+		if self.player:
+			self.player.cleanup()
+			self.player = None
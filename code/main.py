@@ -1,8 +1,9 @@
 from settings import *
-from game_data import *
+from content_pack import TRAINER_DATA, ATTACK_DATA
 from pytmx.util_pygame import load_pygame
 from pathlib import Path
-from random import randint
+from datetime import datetime
+from rng import get_stream
 
 from sprites import Sprite, AnimatedSprite, MonsterPatchSprite, BorderSprite, CollidableSprite, TransitionSprite
 from entities import Player, Character
@@ -10,24 +11,32 @@ from groups import AllSprites
 from dialog import DialogTree
 from monster_index import MonsterIndex
 from battle import Battle
+from battle_menus import grayscale_icons
 from timer import Timer
 from evolution import Evolution
+from profiler import FrameProfiler
+from sound_bank import SoundBank
+from render_backend import get_backend
+from audio_manager import AudioManager
 
 from support import *
 from monster import Monster
+from party import MonsterParty
 
 class Game:
 	# general 
-	def __init__(self):
+	def __init__(self, profiler=None):
 		pygame.init()
-		self.display_surface = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-		pygame.display.set_caption('Monster Hunter')
+		self.backend = get_backend('Monster Hunter')
+		self.display_surface = self.backend.surface
+		self.render_queue = self.backend.queue
 		self.clock = pygame.Clock()
 		self.running = True
 		self.encounter_timer = Timer(2000, func=self.monster_encounter)
+		self.profiler = profiler if profiler else FrameProfiler()
 
 		# player monsters 
-		self.player_monsters = {
+		self.player_monsters = MonsterParty({
 			0: Monster('Ivieron', 32),
 			1: Monster('Atrox', 15),
 			2: Monster('Cindrill', 16),
@@ -35,9 +44,9 @@ class Game:
 			4: Monster('Sparchu', 11),
 			5: Monster('Gulfin', 9),
 			6: Monster('Jacana', 10),
-		}
+		})
 		for monster in self.player_monsters.values():
-			monster.xp += randint(0, monster.level * 100)
+			monster.xp += get_stream('encounters').randint(0, monster.level * 100)
 		
 		self.test_monsters = {
 			0: Monster('Finsta', 15),
@@ -54,7 +63,6 @@ class Game:
 
 		# transition / tint
 		self.transition_target = None
-		self.tint_surf = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
 		self.tint_mode = 'untint'
 		self.tint_progress = 0
 		self.tint_direction = -1
@@ -67,8 +75,7 @@ class Game:
 		self.setup(self.tmx_maps['world'], 'house')
 		
 		# Start overworld music if available
-		if 'overworld' in self.audio:
-			self.audio['overworld'].play(loops=-1)
+		self.audio_manager.play_music('overworld')
 
 		# overlays 
 		self.dialog_tree = None
@@ -95,6 +102,8 @@ class Game:
 				'coast': coast_importer(24, 12, str(base_path), 'graphics', 'tilesets', 'coast'),
 				'characters': all_character_import(str(base_path), 'graphics', 'characters')
 			}
+			# Upload the tile and character animations now (GPU backend) instead of on first draw
+			self.backend.preload(self.overworld_frames)
 
 			# Monster frames
 			self.monster_frames = {
@@ -104,6 +113,7 @@ class Game:
 				'attacks': attack_importer(str(base_path), 'graphics', 'attacks')
 			}
 			self.monster_frames['outlines'] = outline_creator(self.monster_frames['monsters'], 4)
+			grayscale_icons(self.monster_frames['ui'])
 
 			# Fonts - using Path for cross-platform compatibility
 			font_path = base_path / 'graphics' / 'fonts'
@@ -118,8 +128,12 @@ class Game:
 			self.bg_frames = import_folder_dict(str(base_path), 'graphics', 'backgrounds')
 			self.start_animation_frames = import_folder(str(base_path), 'graphics', 'other', 'star animation')
 		
-			# Audio
-			self.audio = audio_importer(str(base_path), 'audio')
+			# Audio - music is streamed, sound effects load on first use
+			self.audio = SoundBank(str(base_path), 'audio')
+			# Attack and notice sounds play mid-action, so they are loaded up front
+			self.audio.prewarm({data['animation'] for data in ATTACK_DATA.values()} | {'notice'})
+			# Channels, voice limits and music fades
+			self.audio_manager = AudioManager(self.audio)
 			
 		except FileNotFoundError as e:
 			print(f"Error: Could not find asset file - {e}")
@@ -255,7 +269,7 @@ class Game:
 								collision_sprites=self.collision_sprites,
 								radius=obj.properties.get('radius', 80),
 								nurse=character_id == 'Nurse',
-								notice_sound=self.audio.get('notice'))
+								notice_sound=self.audio_manager.get('notice', priority=1))
 
 		except Exception as e:
 			print(f"Error during map setup: {e}")
@@ -312,10 +326,7 @@ class Game:
 				
 		elif not character.character_data.get('defeated', False):
 			# Start battle
-			if 'overworld' in self.audio:
-				self.audio['overworld'].stop()
-			if 'battle' in self.audio:
-				self.audio['battle'].play(loops=-1)
+			self.audio_manager.play_music('battle')
 				
 			biome = character.character_data.get('biome', 'grass')
 			self.transition_target = Battle(
@@ -326,7 +337,8 @@ class Game:
 				fonts=self.fonts, 
 				end_battle=self.end_battle,
 				character=character, 
-				sounds=self.audio)
+				sounds=self.audio_manager,
+				game_over=self.game_over)
 			self.tint_mode = 'tint'
 		else:
 			if self.player:
@@ -370,13 +382,13 @@ class Game:
 				self.transition_target = None
 
 		self.tint_progress = max(0.0, min(self.tint_progress, 255.0))
-		self.tint_surf.set_alpha(int(self.tint_progress))
-		self.display_surface.blit(self.tint_surf, (0, 0))
+		if self.tint_progress > 0:
+			self.render_queue.tint(COLORS['black'], self.tint_progress)
 	
 	def end_battle(self, character):
 		"""End battle and return to overworld"""
-		if 'battle' in self.audio:
-			self.audio['battle'].stop()
+		self.save_battle_replay()
+		self.audio_manager.stop_music()
 			
 		self.transition_target = 'level'
 		self.tint_mode = 'tint'
@@ -396,8 +408,7 @@ class Game:
 			if monster.evolution:
 				if monster.level == monster.evolution[1]:
 					if not evolved:  # Only play sound once
-						if 'evolution' in self.audio:
-							self.audio['evolution'].play()
+						self.audio_manager.play_jingle('evolution')
 						if self.player:
 							self.player.block()
 					
@@ -413,20 +424,15 @@ class Game:
 					break  # Handle one evolution at a time
 					
 		if not self.evolution and not evolved:
-			if 'overworld' in self.audio:
-				self.audio['overworld'].stop()
-				self.audio['overworld'].play(loops=-1)
+			self.audio_manager.play_music('overworld')
 
 	def end_evolution(self):
 		"""End evolution animation"""
 		self.evolution = None
 		if self.player:
 			self.player.unblock()
-		if 'evolution' in self.audio:
-			self.audio['evolution'].stop()
-		if 'overworld' in self.audio:
-			self.audio['overworld'].stop()
-			self.audio['overworld'].play(loops=-1)
+		self.audio_manager.stop_jingles(fade_ms=300)
+		self.audio_manager.play_music('overworld')
 
 	# monster encounters 
 	def check_monster(self):
@@ -441,6 +447,23 @@ class Game:
 			if not self.encounter_timer.active:
 				self.encounter_timer.activate()
 
+	def game_over(self):
+		"""Player lost a battle - quit the game"""
+		self.save_battle_replay()
+		pygame.quit()
+		exit()
+
+	def save_battle_replay(self):
+		"""Write the running battle's log to replays/ (see battle_replay.py)"""
+		if not SAVE_BATTLE_REPLAYS or not self.battle:
+			return
+		path = Path(__file__).parent.parent / 'replays' / f"battle_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+		try:
+			self.battle.log.save(path)
+			print(f"Battle replay written to {path}")
+		except Exception as e:
+			print(f"Error writing battle replay: {e}")
+
 	def monster_encounter(self):
 		"""Trigger a random wild monster encounter"""
 		if not self.player:
@@ -450,68 +473,109 @@ class Game:
 				   if sprite.rect.colliderect(self.player.hitbox)]
 		
 		if sprites and self.player.direction:
-			self.encounter_timer.duration = randint(800, 2500)
+			self.encounter_timer.duration = get_stream('encounters').randint(800, 2500)
 			self.player.block()
 			
-			if 'overworld' in self.audio:
-				self.audio['overworld'].stop()
-			if 'battle' in self.audio:
-				self.audio['battle'].play(loops=-1)
+			self.audio_manager.play_music('battle')
 			
 			patch = sprites[0]
 			self.transition_target = Battle(
 				player_monsters=self.player_monsters, 
-				opponent_monsters={index: Monster(monster, patch.level + randint(-3, 3)) 
+				opponent_monsters={index: Monster(monster, patch.level + get_stream('encounters').randint(-3, 3)) 
 								   for index, monster in enumerate(patch.monsters)}, 
 				monster_frames=self.monster_frames, 
 				bg_surf=self.bg_frames.get(patch.biome, list(self.bg_frames.values())[0]), 
 				fonts=self.fonts, 
 				end_battle=self.end_battle,
 				character=None, 
-				sounds=self.audio)
+				sounds=self.audio_manager,
+				game_over=self.game_over)
 			self.tint_mode = 'tint'
 
-	def run(self):
-		"""Main game loop - Pygame CE 2.5.5 optimized"""
-		while self.running:
-			# Delta time (Pygame CE 2.5.5 - returns milliseconds)
-			dt = self.clock.tick(60) / 1000.0  # Convert to seconds, 60 FPS cap
-			self.display_surface.fill('black')
+	def run_frame(self, dt):
+		"""
+		Update and draw one frame of the overworld and its overlays
+		(event handling and the display flip are left to the caller)
 
-			# Event loop 
-			for event in pygame.event.get():
-				if event.type == pygame.QUIT:
-					self.running = False
-				elif event.type == pygame.KEYDOWN:
-					if event.key == pygame.K_ESCAPE:
-						self.running = False
+		Args:
+			dt: Delta time in seconds
+		"""
+		profiler = self.profiler
 
-			# Update 
+		# Update 
+		with profiler.section('input'):
 			self.encounter_timer.update()
 			self.input()
+		with profiler.section('transition_check'):
 			self.transition_check()
+		with profiler.section('all_sprites.update'):
 			self.all_sprites.update(dt)
+		with profiler.section('check_monster'):
 			self.check_monster()
-			
-			# Drawing
+		with profiler.section('audio'):
+			self.audio_manager.update()
+		
+		# Drawing
+		with profiler.section('all_sprites.draw'):
 			if self.player:
 				self.all_sprites.draw(self.player)
 			else:
 				# Fallback if player doesn't exist
 				self.all_sprites.draw(None)
-			
-			# Overlays 
-			if self.dialog_tree:
+		
+		# Overlays 
+		if self.dialog_tree:
+			with profiler.section('dialog_tree'):
 				self.dialog_tree.update()
-			if self.index_open:
+		if self.index_open:
+			with profiler.section('monster_index'):
 				self.monster_index.update(dt)
-			if self.battle:
+		if self.battle:
+			with profiler.section('battle'):
 				self.battle.update(dt)
-			if self.evolution:
+		if self.evolution:
+			with profiler.section('evolution'):
 				self.evolution.update(dt)
 
+		with profiler.section('tint_screen'):
 			self.tint_screen(dt)
-			pygame.display.flip()  # Pygame CE 2.5.5: flip() is optimized
+
+		# Sprite counts
+		profiler.set_count('all_sprites', len(self.all_sprites))
+		profiler.set_count('collision_sprites', len(self.collision_sprites))
+		if self.battle:
+			profiler.set_count('battle_sprites', len(self.battle.battle_sprites))
+
+	def run(self):
+		"""Main game loop - Pygame CE 2.5.5 optimized"""
+		while self.running:
+			# Delta time (Pygame CE 2.5.5 - returns milliseconds)
+			dt = self.clock.tick(60) / 1000.0  # Convert to seconds, 60 FPS cap
+			self.profiler.begin_frame()
+			self.backend.begin_frame()
+
+			# Event loop 
+			with self.profiler.section('input'):
+				for event in pygame.event.get():
+					if event.type == pygame.QUIT:
+						self.running = False
+					elif event.type == pygame.KEYDOWN:
+						if event.key == pygame.K_ESCAPE:
+							self.running = False
+					self.profiler.handle_event(event)
+
+			self.run_frame(dt)
+
+			# Execute the frame's draw commands (the profiler overlay draws on top)
+			with self.profiler.section('render_queue'):
+				draw_stats = self.backend.flush()
+			self.profiler.set_count('draw_commands', draw_stats['commands'])
+			self.profiler.set_count('draw_calls', draw_stats['draw_calls'])
+
+			self.profiler.draw(self.display_surface)
+			with self.profiler.section('flip'):
+				self.backend.present()
+			self.profiler.end_frame()
 
 		# Cleanup
 		pygame.quit()
@@ -6,16 +6,18 @@ import pygame
 from settings import *
 from menu_pokemon import PokemonMainMenu
 from main import Game
-from save_system import SaveSystem, create_game_state_snapshot, apply_game_state
+from save_system import SaveSystem, SaveWriter, create_game_state_snapshot, apply_game_state
 from loading_screen import LoadingScreen
 from splash_screen import SplashScreen
+from profiler import FrameProfiler
+from render_backend import get_backend
 
 class PokemonGame:
 	"""Main game wrapper with Pokemon-PK menu and save system"""
 	def __init__(self):
 		pygame.init()
-		self.display_surface = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-		pygame.display.set_caption('Pokemon-PK')
+		self.backend = get_backend('Pokemon-PK')
+		self.display_surface = self.backend.surface
 		self.clock = pygame.Clock()
 		self.running = True
 		
@@ -27,7 +29,9 @@ class PokemonGame:
 		self.loading_screen = None
 		self.game = None
 		self.game_to_start = None  # 'new', 'continue', or None
+		self.new_game_slot = None  # Save slot chosen for a new game
 		self.save_system = SaveSystem()
+		self.save_writer = SaveWriter(self.save_system)
 		
 		# Auto-save settings
 		self.auto_save_interval = 60.0  # Auto-save every 60 seconds
@@ -36,6 +40,9 @@ class PokemonGame:
 		# Track total playtime
 		self.total_play_time = 0.0
 		
+		# Frame profiler (F3 toggles the overlay, F4 writes a CSV trace)
+		self.profiler = FrameProfiler()
+		
 		# Load fonts early for menu
 		from pathlib import Path
 		code_dir = Path(__file__).parent
@@ -62,13 +69,19 @@ class PokemonGame:
 		# Main menu will be initialized after splash screen
 		self.main_menu = None
 	
-	def start_new_game(self):
-		"""Start a new game"""
+	def start_new_game(self, slot=None):
+		"""
+		Start a new game
+		
+		Args:
+			slot (str): Save slot for the new game (chosen by the menu), None for a free one
+		"""
 		print("Starting new game...")
 		
 		# Don't cleanup immediately - just mark for transition
 		# This prevents crash when button click is processed mid-frame
 		self.game_to_start = 'new'
+		self.new_game_slot = slot
 	
 	def continue_game(self):
 		"""Continue from saved game"""
@@ -82,8 +95,16 @@ class PokemonGame:
 		print("Exiting game...")
 		self.running = False
 	
-	def auto_save(self):
-		"""Perform auto-save"""
+	def auto_save(self, wait=False, slot=SaveSystem.AUTOSAVE):
+		"""
+		Perform auto-save. The snapshot is taken on the main thread and
+		written by the background save writer.
+		
+		Args:
+			wait (bool): Block until the save is on disk (used before leaving the game)
+			slot (str): Target slot, rotating autosave slots by default and
+				None for the slot the game was started in
+		"""
 		if self.game:
 			# Update playtime
 			if hasattr(self.game, 'total_play_time'):
@@ -93,24 +114,22 @@ class PokemonGame:
 			state = create_game_state_snapshot(self.game)
 			
 			# Save the game
-			if self.save_system.save_game(state):
-				print("Auto-save complete")
-			else:
-				print("Auto-save failed")
+			self.save_writer.submit(state, slot)
+			if wait:
+				self.save_writer.flush()
+				print("Auto-save complete" if self.save_writer.last_result else "Auto-save failed")
 	
 	def return_to_menu(self):
 		"""Return to main menu (auto-save first)"""
 		if self.game:
 			# Auto-save before returning to menu
 			print("Saving game before returning to menu...")
-			self.auto_save()
+			self.auto_save(wait=True, slot=None)
 			
 			# Stop music
-			if hasattr(self.game, 'audio'):
-				if 'overworld' in self.game.audio:
-					self.game.audio['overworld'].stop()
-				if 'battle' in self.game.audio:
-					self.game.audio['battle'].stop()
+			if hasattr(self.game, 'audio_manager'):
+				self.game.audio_manager.stop_music(fade_ms=0)
+				self.game.audio_manager.stop_jingles()
 		
 		# Recreate menu
 		self.in_menu = True
@@ -118,7 +137,8 @@ class PokemonGame:
 			self.start_new_game,
 			self.continue_game,
 			self.exit_game,
-			self.fonts
+			self.fonts,
+			self.save_system
 		)
 		self.game = None
 	
@@ -126,15 +146,19 @@ class PokemonGame:
 		"""Main game loop"""
 		while self.running:
 			dt = self.clock.tick(60) / 1000.0
-			self.display_surface.fill('black')
+			self.profiler.begin_frame()
+			self.backend.begin_frame()
 			
 			# Event handling
-			for event in pygame.event.get():
+			with self.profiler.section('input'):
+				events = pygame.event.get()
+			for event in events:
+				self.profiler.handle_event(event)
 				if event.type == pygame.QUIT:
 					# Auto-save before quitting
 					if self.game and not self.in_menu:
 						print("Saving game before exit...")
-						self.auto_save()
+						self.auto_save(wait=True, slot=None)
 					self.running = False
 					
 				elif event.type == pygame.KEYDOWN:
@@ -163,8 +187,9 @@ class PokemonGame:
 			# Update and draw
 			if self.in_splash and self.splash_screen:
 				# Show splash screen
-				still_showing = self.splash_screen.update(dt)
-				self.splash_screen.draw()
+				with self.profiler.section('splash'):
+					still_showing = self.splash_screen.update(dt)
+					self.splash_screen.draw()
 				
 				# Check if splash is complete
 				if not still_showing:
@@ -177,17 +202,20 @@ class PokemonGame:
 						self.start_new_game,
 						self.continue_game,
 						self.exit_game,
-						self.fonts
+						self.fonts,
+						self.save_system
 					)
 			
 			elif self.in_menu and self.main_menu:
-				self.main_menu.update(dt)
-				self.main_menu.draw(self.display_surface)
+				with self.profiler.section('menu'):
+					self.main_menu.update(dt)
+					self.main_menu.draw(self.display_surface)
 			
 			elif self.in_loading and self.loading_screen:
 				# Update loading screen
-				still_loading = self.loading_screen.update(dt)
-				self.loading_screen.draw()
+				with self.profiler.section('loading'):
+					still_loading = self.loading_screen.update(dt)
+					self.loading_screen.draw()
 				
 				# Check if loading is complete
 				if not still_loading:
@@ -196,8 +224,10 @@ class PokemonGame:
 					
 					# Now actually start the game
 					if self.game_to_start == 'new':
-						# Create new game
-						self.game = Game()
+						# Create new game in the slot the menu chose, else a free or the oldest slot
+						self.save_system.active_slot = (self.new_game_slot or self.save_system.free_slot()
+														or self.save_system.oldest_slot())
+						self.game = Game(self.profiler)
 						self.game.total_play_time = 0.0
 						self.game.current_map_name = 'world'
 						self.game.current_spawn_name = 'house'
@@ -205,18 +235,24 @@ class PokemonGame:
 						self.total_play_time = 0.0
 						
 					elif self.game_to_start == 'continue':
-						# Load saved game
+						# Load saved game (after any save still being written)
+						self.save_writer.flush()
 						save_data = self.save_system.load_game()
 						if save_data:
-							self.game = Game()
+							self.game = Game(self.profiler)
 							apply_game_state(self.game, save_data)
 							self.total_play_time = save_data.get('game_time', 0.0)
 							self.game.total_play_time = self.total_play_time
 							self.time_since_last_save = 0.0
 							print(f"Game loaded! Playtime: {self.total_play_time:.1f}s")
 						else:
-							# Load failed, start new game
-							self.game = Game()
+							# Load failed, start new game in a free slot, else the oldest one
+							slot = self.save_system.free_slot()
+							if slot is None:
+								slot = self.save_system.oldest_slot()
+								print(f"Warning: every save slot is taken, the new game will save over {slot}")
+							self.save_system.active_slot = slot
+							self.game = Game(self.profiler)
 							self.game.total_play_time = 0.0
 							self.game.current_map_name = 'world'
 							self.game.current_spawn_name = 'house'
@@ -236,29 +272,11 @@ class PokemonGame:
 					self.time_since_last_save = 0.0
 				
 				# Run one frame of the game
-				self.game.encounter_timer.update()
-				self.game.input()
-				self.game.transition_check()
-				self.game.all_sprites.update(dt)
-				self.game.check_monster()
-				
-				# Drawing
-				if self.game.player:
-					self.game.all_sprites.draw(self.game.player)
-				else:
-					self.game.all_sprites.draw(None)
-				
-				# Overlays
-				if self.game.dialog_tree:
-					self.game.dialog_tree.update()
-				if self.game.index_open:
-					self.game.monster_index.update(dt)
-				if self.game.battle:
-					self.game.battle.update(dt)
-				if self.game.evolution:
-					self.game.evolution.update(dt)
-				
-				self.game.tint_screen(dt)
+				self.game.run_frame(dt)
+				with self.profiler.section('render_queue'):
+					draw_stats = self.backend.flush()
+				self.profiler.set_count('draw_commands', draw_stats['commands'])
+				self.profiler.set_count('draw_calls', draw_stats['draw_calls'])
 				
 				# Draw auto-save indicator
 				if self.time_since_last_save < 1.0:  # Show for 1 second after save
@@ -266,7 +284,10 @@ class PokemonGame:
 					save_text = font.render('Auto-saved', True, (100, 255, 100))
 					self.display_surface.blit(save_text, (10, 10))
 			
-			pygame.display.flip()
+			self.profiler.draw(self.display_surface)
+			with self.profiler.section('flip'):
+				self.backend.present()
+			self.profiler.end_frame()
 		
 		# Cleanup
 		if self.main_menu:
@@ -275,7 +296,8 @@ class PokemonGame:
 		# Final auto-save on exit
 		if self.game and not self.in_menu:
 			print("Final save before exit...")
-			self.auto_save()
+			self.auto_save(wait=True, slot=None)
+		self.save_writer.close()
 		
 		pygame.quit()
 
@@ -4,13 +4,25 @@ Custom main menu with save/load functionality and outlined text
 """
 import pygame
 import cv2
+import numpy as np
+from collections import deque
 from pathlib import Path
 from settings import *
+from frame_upload import FrameUploader
+from frame_cache import FrameCache, DecoderThread
+from text_render import render_outlined_text
 from save_system import SaveSystem
+from sound_bank import MusicTrack
 
 class VideoBackground:
-	"""Handles video playback for menu background"""
-	def __init__(self, video_path):
+	"""Handles video playback for menu background. Frames are decoded, converted 
+	and scaled on a background thread into a small ring buffer; the menu loop 
+	only swaps in the newest ready frame.
+	
+	With frame_cache enabled the first playback also writes every scaled frame 
+	to a raw RGB file; later playback maps that file and shows frames straight 
+	from the mapping without decoding or copying."""
+	def __init__(self, video_path, buffer_size=4, frame_cache=False):
 		self.video_path = video_path
 		self.cap = None
 		self.current_frame = None
@@ -22,13 +34,43 @@ class VideoBackground:
 		self.frame_time = 0.0
 		self.time_per_frame = 1.0 / 30.0  # Default to 30 FPS
 		
+		# Decoder thread and ring buffer of ready frames. Frame arrays come from a 
+		# fixed pool and are uploaded into one persistent surface, so steady-state 
+		# playback allocates nothing.
+		self.buffer_size = buffer_size
+		self.ready_frames = deque()
+		self.free_buffers = deque()
+		self.raw_frame = None
+		self.scaled_frame = None
+		self.uploader = None
+		self.decoder = DecoderThread(self.decode_loop, 'VideoDecoder')
+		self.dropped_frames = 0
+		
+		# Pre-decoded frame cache (raw RGB at display resolution)
+		cache_name = f'{Path(video_path).stem}_{WINDOW_WIDTH}x{WINDOW_HEIGHT}'
+		self.frame_cache = FrameCache(video_path, Path(video_path).parent / 'cache' / f'{cache_name}.rgb',
+									  (WINDOW_WIDTH, WINDOW_HEIGHT), 'RGB', 'Menu video')
+		self.frame_index = 0
+		
 		# Try to load video
-		if Path(video_path).exists():
+		if frame_cache and self.frame_cache.valid():
+			self.open_frame_cache()
+		elif Path(video_path).exists():
+			if frame_cache:
+				self.frame_cache.start_build()
+				print("Building menu video frame cache during first playback")
 			self.cap = cv2.VideoCapture(str(video_path))
 			self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30
 			self.total_frames = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
 			self.time_per_frame = 1.0 / self.fps  # Calculate time per frame
 			print(f"Video loaded: {self.fps} FPS, {self.total_frames} frames")
+			
+			self.uploader = FrameUploader((WINDOW_WIDTH, WINDOW_HEIGHT))
+			self.free_buffers.extend(np.empty((WINDOW_HEIGHT, WINDOW_WIDTH, 3), np.uint8) 
+									 for _ in range(buffer_size))
+			self.scaled_frame = np.empty((WINDOW_HEIGHT, WINDOW_WIDTH, 3), np.uint8)
+			
+			self.decoder.start()
 		else:
 			print(f"Warning: Video file not found at {video_path}")
 			# Create a fallback gradient background
@@ -44,30 +86,114 @@ class VideoBackground:
 							(0, y), (WINDOW_WIDTH, y))
 		return surf
 	
+	def open_frame_cache(self):
+		"""Map the cache file for playback"""
+		self.fps = self.frame_cache.open()['fps']
+		self.time_per_frame = 1.0 / self.fps
+		self.frame_index = 0
+		self.current_frame = self.frame_cache.frame(0)
+		print(f"Video frame cache mapped: {self.frame_cache.frame_count} frames")
+	
+	def switch_to_frame_cache(self):
+		"""Stop decoding and continue playback from the finished cache"""
+		# Retried on the next update while the decoder is still finishing a read
+		if not self.decoder.stop(timeout=0.1):
+			return
+		if self.cap:
+			self.cap.release()
+			self.cap = None
+		self.ready_frames.clear()
+		self.free_buffers.clear()
+		self.open_frame_cache()
+	
+	def decode_frame(self, out):
+		"""
+		Read, scale and convert the next video frame (runs on the decoder thread)
+		
+		Args:
+			out: Pool array of shape (height, width, 3) that receives the RGB frame
+		
+		Returns:
+			bool: True if a frame was decoded
+		"""
+		ret, frame = self.cap.read(self.raw_frame)
+		
+		if not ret:
+			# First full pass done - the cache holds every frame now
+			if self.frame_cache.building:
+				self.frame_cache.finish_build(fps=self.fps)
+			
+			# Loop video
+			self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+			ret, frame = self.cap.read(self.raw_frame)
+		
+		if not ret:
+			return False
+		
+		# Reuse the capture buffer for the next read
+		self.raw_frame = frame
+		# Resize to window size, then convert from OpenCV BGR to Pygame RGB (into the pool array)
+		cv2.resize(frame, (WINDOW_WIDTH, WINDOW_HEIGHT), dst=self.scaled_frame)
+		cv2.cvtColor(self.scaled_frame, cv2.COLOR_BGR2RGB, dst=out)
+		# Store the scaled frame in the cache (row-major RGB, same layout as the mapping)
+		if self.frame_cache.building:
+			self.frame_cache.write(out)
+		return True
+	
+	def decode_loop(self):
+		"""Decoder thread: keep the ring buffer filled with ready frames"""
+		while True:
+			with self.decoder.condition:
+				self.decoder.condition.wait_for(lambda: self.free_buffers or not self.decoder.running)
+				if not self.decoder.running:
+					return
+				frame = self.free_buffers.popleft()
+			
+			if not self.decode_frame(frame):
+				print("Video decoding stopped: no frames could be read")
+				return
+			
+			with self.decoder.condition:
+				self.ready_frames.append(frame)
+	
 	def update(self, dt):
-		"""Read next frame from video at correct speed"""
-		if self.cap and self.cap.isOpened():
+		"""Swap in the newest decoded frame when the next one is due"""
+		if self.frame_cache.ready and not self.frame_cache.mapped:
+			self.switch_to_frame_cache()
+		
+		if self.frame_cache.mapped:
+			self.frame_time += dt
+			due = int(self.frame_time // self.time_per_frame)
+			if due:
+				self.frame_time -= due * self.time_per_frame
+				self.frame_index = (self.frame_index + due) % self.frame_cache.frame_count
+				self.current_frame = self.frame_cache.frame(self.frame_index)
+				self.dropped_frames += due - 1
+		
+		elif self.decoder.active:
 			# Accumulate time
 			self.frame_time += dt
 			
-			# Only read next frame when enough time has passed
-			if self.frame_time >= self.time_per_frame:
-				self.frame_time -= self.time_per_frame
-				
-				ret, frame = self.cap.read()
+			# Number of video frames that became due since the last swap
+			due = int(self.frame_time // self.time_per_frame)
+			if due:
+				self.frame_time -= due * self.time_per_frame
 				
-				if not ret:
-					# Loop video
-					self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-					ret, frame = self.cap.read()
+				frame = None
+				with self.decoder.condition:
+					# Skip frames we fell behind on and show the newest due one
+					taken = min(due, len(self.ready_frames))
+					for _ in range(taken):
+						if frame is not None:
+							self.free_buffers.append(frame)
+						frame = self.ready_frames.popleft()
 				
-				if ret:
-					# Convert from OpenCV BGR to Pygame RGB
-					frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-					# Resize to window size
-					frame = cv2.resize(frame, (WINDOW_WIDTH, WINDOW_HEIGHT))
-					# Convert to pygame surface
-					self.current_frame = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
+				if frame is not None:
+					self.current_frame = self.uploader.upload(frame)
+					self.dropped_frames += taken - 1
+					with self.decoder.condition:
+						self.free_buffers.append(frame)
+						self.decoder.condition.notify()
 		
 		return self.current_frame
 	
@@ -77,9 +203,21 @@ class VideoBackground:
 			surface.blit(self.current_frame, (0, 0))
 	
 	def cleanup(self):
-		"""Release video capture"""
-		if self.cap:
-			self.cap.release()
+		"""Stop the decoder thread and release video capture and frame cache"""
+		if self.decoder.stop():
+			if self.cap:
+				self.cap.release()
+				self.cap = None
+			
+			# Unfinished cache build - discard the partial file
+			self.frame_cache.discard_build()
+		else:
+			print("Warning: Video decoder did not stop, leaving its capture and cache file open")
+		
+		# Surfaces pointing into the mapping must go before it can be closed
+		if self.frame_cache.mapped:
+			self.current_frame = None
+			self.frame_cache.close()
 
 
 def render_text_with_outline(text, font, text_color, outline_color, outline_width=2):
@@ -94,30 +232,18 @@ def render_text_with_outline(text, font, text_color, outline_color, outline_widt
 		outline_width (int): Width of outline in pixels
 	
 	Returns:
-		pygame.Surface: Rendered text with outline
+		pygame.Surface: Rendered text with outline (shared, from the text cache)
 	"""
-	# Render the main text
-	text_surf = font.render(text, True, text_color)
-	w, h = text_surf.get_size()
-	
-	# Create a larger surface to hold text + outline
-	outline_surf = pygame.Surface((w + outline_width * 2, h + outline_width * 2), pygame.SRCALPHA)
-	
-	# Render outline by drawing text in all directions
-	for dx in range(-outline_width, outline_width + 1):
-		for dy in range(-outline_width, outline_width + 1):
-			if dx != 0 or dy != 0:
-				outline_text = font.render(text, True, outline_color)
-				outline_surf.blit(outline_text, (dx + outline_width, dy + outline_width))
-	
-	# Draw the main text on top
-	outline_surf.blit(text_surf, (outline_width, outline_width))
-	
-	return outline_surf
+	return render_outlined_text(text, font, text_color, outline_color, outline_width)
 
 
 class MenuButton:
-	"""Interactive menu button with outline text"""
+	"""Interactive menu button with outline text. The hover animation indexes 
+	into a strip of pre-scaled text surfaces (SCALE_STEPS quantized steps 
+	between 1.0 and HOVER_SCALE) that is filled lazily, one step at a time."""
+	HOVER_SCALE = 1.15
+	SCALE_STEPS = 8
+	
 	def __init__(self, pos, text, font, callback=None, text_color=(255, 255, 255), 
 				 outline_color=(0, 0, 0), outline_width=2):
 		self.pos = vector(pos)
@@ -141,6 +267,11 @@ class MenuButton:
 		padding = 20
 		self.hitbox = self.text_rect.inflate(padding * 2, padding)
 		
+		# Pre-scaled hover animation strip and highlight, built once per button
+		self.scale_strip = [self.text_surf] + [None] * (self.SCALE_STEPS - 1)
+		self.highlight_surf = pygame.Surface(self.hitbox.size, pygame.SRCALPHA)
+		self.highlight_surf.fill((255, 255, 255, 30))
+		
 		# Cooldown to prevent multiple clicks
 		self.click_cooldown = 0
 	
@@ -154,7 +285,7 @@ class MenuButton:
 		self.hovered = self.hitbox.collidepoint(mouse_pos)
 		
 		# Scale animation
-		self.target_scale = 1.15 if self.hovered else 1.0
+		self.target_scale = self.HOVER_SCALE if self.hovered else 1.0
 		self.scale += (self.target_scale - self.scale) * 10 * dt
 		
 		# Check for click
@@ -163,16 +294,23 @@ class MenuButton:
 				self.callback()
 				self.click_cooldown = 0.3  # 300ms cooldown
 	
+	def get_scaled_text(self):
+		"""Strip frame for the current scale (rendered the first time it is used)"""
+		progress = (self.scale - 1.0) / (self.HOVER_SCALE - 1.0)
+		step = max(0, min(self.SCALE_STEPS - 1, round(progress * (self.SCALE_STEPS - 1))))
+		if self.scale_strip[step] is None:
+			scale = 1.0 + (self.HOVER_SCALE - 1.0) * step / (self.SCALE_STEPS - 1)
+			self.scale_strip[step] = pygame.transform.scale_by(self.text_surf, scale)
+		return self.scale_strip[step]
+	
 	def draw(self, surface):
 		"""Draw button with hover effect"""
 		# Draw background highlight when hovered
 		if self.hovered:
-			highlight_surf = pygame.Surface(self.hitbox.size, pygame.SRCALPHA)
-			highlight_surf.fill((255, 255, 255, 30))
-			surface.blit(highlight_surf, self.hitbox)
+			surface.blit(self.highlight_surf, self.hitbox)
 		
 		# Draw text with scale
-		scaled_surf = pygame.transform.scale_by(self.text_surf, self.scale)
+		scaled_surf = self.get_scaled_text()
 		scaled_rect = scaled_surf.get_rect(center=self.text_rect.center)
 		surface.blit(scaled_surf, scaled_rect)
 		
@@ -189,19 +327,19 @@ class MenuButton:
 class PokemonMainMenu:
 	"""Main menu for Pokemon-PK with save/load functionality"""
 	def __init__(self, start_new_game_callback, continue_game_callback, 
-				 exit_game_callback, fonts):
+				 exit_game_callback, fonts, save_system=None):
 		self.fonts = fonts
 		self.start_new_game_callback = start_new_game_callback
 		self.continue_game_callback = continue_game_callback
 		self.exit_game_callback = exit_game_callback
 		self.active = True
 		
-		# Save system
-		self.save_system = SaveSystem()
+		# Save system (shared so the in-memory save catalog is reused)
+		self.save_system = save_system if save_system else SaveSystem()
 		
 		# Video background
 		video_path = Path(__file__).parent.parent / 'videos' / 'menu_background.mp4'
-		self.video_bg = VideoBackground(str(video_path))
+		self.video_bg = VideoBackground(str(video_path), frame_cache=MENU_VIDEO_FRAME_CACHE)
 		
 		# Overlay surface for darkening
 		self.overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
@@ -245,8 +383,19 @@ class PokemonMainMenu:
 			)
 			self.menu_buttons.append(button)
 		
-		# Show save info if available
+		# Overwrite confirmation for a new game when every save slot is taken
+		self.overwrite_slot = None
+		self.confirm_buttons = []
+		self.confirm_surf = None
+		
+		# Show save info if available (rendered once, drawn every frame)
 		self.save_metadata = self.save_system.get_save_metadata() if save_exists else None
+		self.save_info_surf = self.render_save_info()
+		
+		# Version info
+		version_font = self.fonts.get('small', pygame.font.Font(None, 14))
+		self.version_surf = version_font.render('v1.0', True, (128, 128, 128))
+		self.version_rect = self.version_surf.get_rect(bottomright=(WINDOW_WIDTH - 10, WINDOW_HEIGHT - 10))
 		# Menu music
 		self.menu_music = None
 		self.load_menu_music()
@@ -262,8 +411,8 @@ class PokemonMainMenu:
 				if music_path.exists():
 					print(f"Loading menu music: {music_file}")
 					try:
-						self.menu_music = pygame.mixer.Sound(str(music_path))
-						self.menu_music.set_volume(0.5)
+						# Streamed - the menu also decodes a video, so avoid holding the track in memory
+						self.menu_music = MusicTrack(music_path, volume=0.5)
 						self.menu_music.play(loops=-1)
 						print(f"Menu music '{music_file}' playing")
 						break
@@ -341,11 +490,73 @@ class PokemonMainMenu:
 			)
 			self.title_rect = self.title_surf.get_rect(center=(WINDOW_WIDTH // 2, 150))
 	
+	def render_save_info(self):
+		"""Render the continue preview from the save catalog"""
+		if not self.save_metadata:
+			return None
+		
+		info_font = self.fonts.get('small', pygame.font.Font(None, 16))
+		save_time = self.save_metadata.get('save_date', '')
+		try:
+			from datetime import datetime
+			dt = datetime.fromisoformat(save_time)
+			save_text = f"Last Save: {dt.strftime('%Y-%m-%d %H:%M')}"
+		except:
+			save_text = "Save file available"
+		
+		if 'player_level' in self.save_metadata:
+			save_text += (f"  |  {self.save_metadata.get('current_map', 'world')}"
+						  f"  |  Lvl {self.save_metadata['player_level']}"
+						  f"  |  {self.save_metadata.get('monster_count', 0)} monsters")
+		
+		return info_font.render(save_text, True, (200, 200, 200))
+	
 	def start_new_game(self):
-		"""Start a new game"""
+		"""Start a new game in a free slot, asking first if every slot is taken"""
+		slot = self.save_system.free_slot()
+		if slot is None:
+			self.ask_overwrite(self.save_system.oldest_slot())
+		else:
+			self.begin_new_game(slot)
+	
+	def begin_new_game(self, slot):
+		"""Leave the menu and start a new game saved in a slot"""
 		self.active = False
 		if self.start_new_game_callback:
-			self.start_new_game_callback()
+			self.start_new_game_callback(slot)
+	
+	def ask_overwrite(self, slot):
+		"""Show the overwrite confirmation for a slot instead of the menu buttons"""
+		self.overwrite_slot = slot
+		metadata = self.save_system.get_save_metadata(slot) or {}
+		self.confirm_surf = render_text_with_outline(
+			f"All save slots are full. Overwrite {slot} (Lvl {metadata.get('player_level', '?')})?",
+			self.fonts.get('regular', pygame.font.Font(None, 18)),
+			(255, 255, 255), (0, 0, 0), 2
+		)
+		menu_center_x = WINDOW_WIDTH // 2
+		self.confirm_buttons = [
+			MenuButton((menu_center_x, 430), 'Overwrite', self.button_font, self.confirm_overwrite),
+			MenuButton((menu_center_x, 500), 'Back', self.button_font, self.cancel_overwrite),
+		]
+		# The click that opened the prompt must not press a prompt button
+		for button in self.confirm_buttons:
+			button.click_cooldown = 0.3
+	
+	def confirm_overwrite(self):
+		"""Delete the chosen slot (with its autosaves) and start the new game there"""
+		slot = self.overwrite_slot
+		self.cancel_overwrite()
+		self.save_system.delete_save(slot)
+		self.begin_new_game(slot)
+	
+	def cancel_overwrite(self):
+		"""Close the overwrite confirmation"""
+		self.overwrite_slot = None
+		self.confirm_buttons = []
+		self.confirm_surf = None
+		for button in self.menu_buttons:
+			button.click_cooldown = 0.3
 	
 	def continue_game(self):
 		"""Continue from saved game"""
@@ -369,7 +580,7 @@ class PokemonMainMenu:
 		self.video_bg.update(dt)
 		
 		# Update buttons
-		for button in self.menu_buttons:
+		for button in self.confirm_buttons or self.menu_buttons:
 			button.update(dt)
 	
 	def draw(self, surface):
@@ -384,31 +595,18 @@ class PokemonMainMenu:
 		surface.blit(self.title_surf, self.title_rect)
 		
 		# Draw save info if available
-		if self.save_metadata:
-			info_font = self.fonts.get('small', pygame.font.Font(None, 16))
-			save_time = self.save_metadata.get('save_date', '')
-			if save_time:
-				# Format the datetime
-				from datetime import datetime
-				try:
-					dt = datetime.fromisoformat(save_time)
-					save_text = f"Last Save: {dt.strftime('%Y-%m-%d %H:%M')}"
-				except:
-					save_text = "Save file available"
-				
-				save_surf = info_font.render(save_text, True, (200, 200, 200))
-				save_rect = save_surf.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 50))  # Moved to bottom
-				surface.blit(save_surf, save_rect)
+		if self.save_info_surf:
+			save_rect = self.save_info_surf.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 50))  # Moved to bottom
+			surface.blit(self.save_info_surf, save_rect)
 		
-		# Draw menu buttons
-		for button in self.menu_buttons:
+		# Draw menu buttons, or the overwrite confirmation
+		if self.confirm_surf:
+			surface.blit(self.confirm_surf, self.confirm_surf.get_rect(center=(WINDOW_WIDTH // 2, 360)))
+		for button in self.confirm_buttons or self.menu_buttons:
 			button.draw(surface)
 		
 		# Draw version info
-		version_font = self.fonts.get('small', pygame.font.Font(None, 14))
-		version_surf = version_font.render('v1.0', True, (128, 128, 128))
-		version_rect = version_surf.get_rect(bottomright=(WINDOW_WIDTH - 10, WINDOW_HEIGHT - 10))
-		surface.blit(version_surf, version_rect)
+		surface.blit(self.version_surf, self.version_rect)
 	
 	def cleanup(self):
 		"""Cleanup resources"""
@@ -4,8 +4,7 @@ Compatible with Pygame CE 2.5.5 and Python 3.13.7
 Handles monster stats, abilities, and leveling
 """
 
-from game_data import MONSTER_DATA, ATTACK_DATA
-from random import randint
+from content_pack import MONSTER_DATA, ATTACK_DATA
 
 class Monster:
 	"""Represents a monster with stats, abilities, and experience"""
@@ -1,26 +1,33 @@
 """
 Monster Index UI for Monster Hunter
 Compatible with Pygame CE 2.5.5 and Python 3.13.7
-Displays monster stats and allows party management
+Displays monster stats and allows party management. The list panel and each
+monster's detail page are rendered once into cached surfaces; only the
+selection highlight and the animated monster are drawn every frame. Large
+collections are split into boxes and only the visible rows are touched
 """
 
 from settings import * 
+from render_backend import get_render_queue
+from text_render import SurfaceCache
 from support import draw_bar
-from game_data import MONSTER_DATA, ATTACK_DATA
+from list_view import ListView
+from content_pack import MONSTER_DATA, ATTACK_DATA
 
 class MonsterIndex:
 	"""Monster party management and stats display UI"""
+	BOX_SIZE = 30  # Monsters per box page
 	
 	def __init__(self, monsters, fonts, monster_frames):
 		"""
 		Initialize monster index
 		
 		Args:
-			monsters: Dictionary of player monsters
+			monsters (MonsterParty): Player monsters
 			fonts: Dictionary of fonts for rendering
 			monster_frames: Dictionary of monster sprite frames
 		"""
-		self.display_surface = pygame.display.get_surface()
+		self.render_queue = get_render_queue()
 		self.fonts = fonts
 		self.monsters = monsters
 		self.frame_index = 0
@@ -30,10 +37,6 @@ class MonsterIndex:
 		self.monster_frames = monster_frames['monsters']
 		self.ui_frames = monster_frames['ui']
 
-		# tint surf 
-		self.tint_surf = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-		self.tint_surf.set_alpha(200)
-
 		# dimensions 
 		self.main_rect = pygame.FRect(0, 0, WINDOW_WIDTH * 0.6, WINDOW_HEIGHT * 0.8).move_to(
 			center=(WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2)
@@ -43,8 +46,27 @@ class MonsterIndex:
 		self.visible_items = 6
 		self.list_width = self.main_rect.width * 0.3
 		self.item_height = self.main_rect.height / self.visible_items
-		self.index = 0
+		self.index = 0  # Monster under the cursor (key in self.monsters)
 		self.selected_index = None
+		self.page = 0  # Box page, LEFT/RIGHT switch pages
+		self.list_view = ListView(self.visible_items, self.item_height, self.page_count())
+
+		# list shadow
+		self.shadow_surf = pygame.Surface((4, self.main_rect.height))
+		self.shadow_surf.set_alpha(100)
+
+		# Retained surfaces: the list panel (rebuilt when the order, scroll or
+		# swap selection changes), highlight rows and one page per monster state
+		self.list_key = None
+		self.list_surf = None
+		self.row_cache = SurfaceCache(16)
+		self.page_cache = SurfaceCache(8)
+		self.page_rect = pygame.FRect(
+			self.main_rect.left + self.list_width, 
+			self.main_rect.top, 
+			self.main_rect.width - self.list_width, 
+			self.main_rect.height
+		)
 
 		# Calculate max values for stat bars
 		self.max_stats = {}
@@ -60,110 +82,173 @@ class MonsterIndex:
 		self.max_stats['health'] = self.max_stats.pop('max_health')
 		self.max_stats['energy'] = self.max_stats.pop('max_energy')
 
+	@property
+	def pages(self):
+		"""Number of box pages"""
+		return max(1, -(-len(self.monsters) // self.BOX_SIZE))
+
+	def page_count(self, page=None):
+		"""Number of monsters on a box page"""
+		page = self.page if page is None else page
+		return max(0, min(self.BOX_SIZE, len(self.monsters) - page * self.BOX_SIZE))
+
+	def swap(self, first, second):
+		"""Swap two monsters by slot - also works across boxes"""
+		self.monsters.swap(first, second)
+
+	def sync_list(self):
+		"""Keep the page and list view valid after the collection changed size"""
+		self.page = min(self.page, self.pages - 1)
+		if self.list_view.count != self.page_count():
+			self.list_view.set_count(self.page_count())
+		self.index = self.page * self.BOX_SIZE + self.list_view.index
+
 	def input(self):
 		"""Handle keyboard input for navigation and selection"""
 		keys = pygame.key.get_just_pressed()
 		
 		if keys[pygame.K_UP]:
-			self.index -= 1
+			self.list_view.move(-1)
 		if keys[pygame.K_DOWN]:
-			self.index += 1
+			self.list_view.move(1)
+		if (keys[pygame.K_LEFT] or keys[pygame.K_RIGHT]) and self.pages > 1:
+			# Next/previous box, keeping the cursor row where possible
+			self.page = (self.page + (1 if keys[pygame.K_RIGHT] else -1)) % self.pages
+			self.list_view.set_count(self.page_count())
+		self.index = self.page * self.BOX_SIZE + self.list_view.index
+
 		if keys[pygame.K_SPACE]:
 			if self.selected_index is not None:
 				# Swap monsters
-				selected_monster = self.monsters[self.selected_index]
-				current_monster = self.monsters[self.index]
-				self.monsters[self.index] = selected_monster
-				self.monsters[self.selected_index] = current_monster
+				self.swap(self.selected_index, self.index)
 				self.selected_index = None
 			else:
 				# Select monster for swapping
 				self.selected_index = self.index
 
-		self.index = self.index % len(self.monsters)
+	@staticmethod
+	def monster_signature(monster):
+		"""Everything the detail page shows - the cached page is rebuilt when it changes"""
+		return (monster.name, monster.level, monster.xp, monster.level_up, int(monster.health), int(monster.energy))
 
-	def display_list(self):
-		"""Display the scrollable monster list"""
-		bg_rect = pygame.FRect(self.main_rect.topleft, (self.list_width, self.main_rect.height))
-		pygame.draw.rect(self.display_surface, COLORS['gray'], bg_rect, 0, 0, 12, 0, 12, 0)
+	def draw_row(self, surface, item_rect, monster, highlighted, picked, corners=()):
+		"""
+		Draw one list entry
 
-		# Calculate vertical offset for scrolling
-		v_offset = 0 if self.index < self.visible_items else -(self.index - self.visible_items + 1) * self.item_height
-		
-		for index, monster in self.monsters.items():
-			# colors 
-			bg_color = COLORS['gray'] if self.index != index else COLORS['light']
-			text_color = COLORS['white'] if self.selected_index != index else COLORS['gold']
-
-			top = self.main_rect.top + index * self.item_height + v_offset
-			item_rect = pygame.FRect(self.main_rect.left, top, self.list_width, self.item_height)
-			
-			text_surf = self.fonts['regular'].render(monster.name, False, text_color)
-			text_rect = text_surf.get_frect(midleft=item_rect.midleft + vector(90, 0))
-
-			icon_surf = self.icon_frames[monster.name]
-			icon_rect = icon_surf.get_frect(center=item_rect.midleft + vector(45, 0))
-
-			if item_rect.colliderect(self.main_rect):
-				# Check corners for rounded edges
-				if item_rect.collidepoint(self.main_rect.topleft):
-					pygame.draw.rect(self.display_surface, bg_color, item_rect, 0, 0, 12)
-				elif item_rect.collidepoint(self.main_rect.bottomleft + vector(1, -1)):
-					pygame.draw.rect(self.display_surface, bg_color, item_rect, 0, 0, 0, 0, 12, 0)
-				else:
-					pygame.draw.rect(self.display_surface, bg_color, item_rect)
-				
-				self.display_surface.blit(text_surf, text_rect)
-				self.display_surface.blit(icon_surf, icon_rect)
+		Args:
+			surface: Target surface
+			item_rect: Entry area on the surface
+			monster: Monster shown in the entry
+			highlighted (bool): Entry under the cursor
+			picked (bool): Entry selected for swapping
+			corners: Corner radii (top left, top right, bottom left, bottom right) of the highlight
+		"""
+		if highlighted:
+			pygame.draw.rect(surface, COLORS['light'], item_rect, 0, 0, *corners)
+
+		text_color = COLORS['gold'] if picked else COLORS['white']
+		text_surf = self.render_queue.render_text(monster.name, self.fonts['regular'], text_color)
+		surface.blit(text_surf, text_surf.get_frect(midleft=item_rect.midleft + vector(90, 0)))
+
+		icon_surf = self.icon_frames[monster.name]
+		surface.blit(icon_surf, icon_surf.get_frect(center=item_rect.midleft + vector(45, 0)))
+
+	def build_list(self, visible):
+		"""
+		Render the list panel without the highlight
+
+		Args:
+			visible: (key, monster) pairs of the visible rows, top to bottom
+		"""
+		surf = pygame.Surface((self.list_width, self.main_rect.height), pygame.SRCALPHA)
+		bg_rect = surf.get_frect()
+		pygame.draw.rect(surf, COLORS['gray'], bg_rect, 0, 0, 12, 0, 12, 0)
+
+		for row, (index, monster) in enumerate(visible):
+			item_rect = pygame.FRect(0, row * self.item_height, self.list_width, self.item_height)
+			self.draw_row(surf, item_rect, monster, False, self.selected_index == index)
 
 		# lines 
-		for i in range(1, min(self.visible_items, len(self.monsters))):
-			y = self.main_rect.top + self.item_height * i
-			left = self.main_rect.left
-			right = self.main_rect.left + self.list_width
-			pygame.draw.line(self.display_surface, COLORS['light-gray'], (left, y), (right, y))
+		for i in range(1, min(self.visible_items, self.list_view.count)):
+			y = self.item_height * i
+			pygame.draw.line(surf, COLORS['light-gray'], (0, y), (self.list_width, y))
 
 		# shadow
-		shadow_surf = pygame.Surface((4, self.main_rect.height))
-		shadow_surf.set_alpha(100)
-		self.display_surface.blit(shadow_surf, (self.main_rect.left + self.list_width - 4, self.main_rect.top))
-	
-	def display_main(self, dt):
-		"""Display detailed monster information"""
-		# data 
+		surf.blit(self.shadow_surf, (self.list_width - 4, 0))
+		return surf
+
+	def build_row(self, monster, picked, corners):
+		"""Render the highlighted entry for a monster"""
+		surf = pygame.Surface((self.list_width, self.item_height), pygame.SRCALPHA)
+		self.draw_row(surf, surf.get_frect(), monster, True, picked, corners)
+		return surf
+
+	def display_list(self):
+		"""Display the visible window of the current box"""
+		start = self.page * self.BOX_SIZE
+		visible = [(start + row, self.monsters[start + row]) for row in self.list_view.visible_range()]
+
+		list_key = (tuple((monster, monster.name) for _, monster in visible), self.selected_index)
+		if list_key != self.list_key:
+			self.list_surf = self.build_list(visible)
+			self.list_key = list_key
+		self.render_queue.sprite(self.list_surf, self.main_rect.topleft)
+
+		# Box label
+		if self.pages > 1:
+			self.render_queue.text(f'Box {self.page + 1}/{self.pages}', self.fonts['small'], COLORS['white'],
+								   bottomleft=self.main_rect.topleft + vector(0, -6))
+
+		# Live highlight for the entry under the cursor
 		monster = self.monsters[self.index]
+		row = self.list_view.row(self.list_view.index)
+		item_rect = pygame.FRect(
+			self.main_rect.left, self.main_rect.top + self.list_view.offset(self.list_view.index), 
+			self.list_width, self.item_height
+		)
+		# Rounded edges for the first and last row of the panel
+		if row == 0:
+			corners = (12, 0, 0, 0)
+		elif row == self.visible_items - 1:
+			corners = (0, 0, 12, 0)
+		else:
+			corners = ()
+		picked = self.selected_index == self.index
+		row_surf = self.row_cache.get((monster.name, picked, corners),
+									  lambda: self.build_row(monster, picked, corners))
+		self.render_queue.sprite(row_surf, item_rect.topleft)
+
+	def build_page(self, monster):
+		"""
+		Render a monster's detail page without the animated monster
+
+		Args:
+			monster: Monster to describe
+
+		Returns:
+			pygame.Surface: Page the size of page_rect
+		"""
+		surf = pygame.Surface(self.page_rect.size, pygame.SRCALPHA)
 
 		# main bg
-		rect = pygame.FRect(
-			self.main_rect.left + self.list_width, 
-			self.main_rect.top, 
-			self.main_rect.width - self.list_width, 
-			self.main_rect.height
-		)
-		pygame.draw.rect(self.display_surface, COLORS['dark'], rect, 0, 12, 0, 12, 0)
+		rect = surf.get_frect()
+		pygame.draw.rect(surf, COLORS['dark'], rect, 0, 12, 0, 12, 0)
 
 		# monster display
 		top_rect = pygame.FRect(rect.topleft, (rect.width, rect.height * 0.4))
-		pygame.draw.rect(self.display_surface, COLORS[monster.element], top_rect, 0, 0, 0, 12)
-
-		# monster animation 
-		self.frame_index += ANIMATION_SPEED * dt
-		frames = self.monster_frames[monster.name]['idle']
-		monster_surf = frames[int(self.frame_index) % len(frames)]
-		monster_rect = monster_surf.get_frect(center=top_rect.center)
-		self.display_surface.blit(monster_surf, monster_rect)
+		pygame.draw.rect(surf, COLORS[monster.element], top_rect, 0, 0, 0, 12)
 
 		# name 
-		name_surf = self.fonts['bold'].render(monster.name, False, COLORS['white'])
+		name_surf = self.render_queue.render_text(monster.name, self.fonts['bold'], COLORS['white'])
 		name_rect = name_surf.get_frect(topleft=top_rect.topleft + vector(10, 10))
-		self.display_surface.blit(name_surf, name_rect)
+		surf.blit(name_surf, name_rect)
 
 		# level
-		level_surf = self.fonts['regular'].render(f'Lvl: {monster.level}', False, COLORS['white'])
+		level_surf = self.render_queue.render_text(f'Lvl: {monster.level}', self.fonts['regular'], COLORS['white'])
 		level_rect = level_surf.get_frect(bottomleft=top_rect.bottomleft + vector(10, -16))
-		self.display_surface.blit(level_surf, level_rect)
+		surf.blit(level_surf, level_rect)
 		draw_bar(
-			surface=self.display_surface, 
+			surface=surf, 
 			rect=pygame.FRect(level_rect.bottomleft, (100, 4)), 
 			value=monster.xp, 
 			max_value=monster.level_up, 
@@ -172,9 +257,9 @@ class MonsterIndex:
 		)
 
 		# element
-		element_surf = self.fonts['regular'].render(monster.element, False, COLORS['white'])
+		element_surf = self.render_queue.render_text(monster.element, self.fonts['regular'], COLORS['white'])
 		element_rect = element_surf.get_frect(bottomright=top_rect.bottomright + vector(-10, -10))
-		self.display_surface.blit(element_surf, element_rect)
+		surf.blit(element_surf, element_rect)
 
 		# health and energy
 		bar_data = {
@@ -189,29 +274,29 @@ class MonsterIndex:
 			midtop=(bar_data['left_side'], bar_data['top'])
 		)
 		draw_bar(
-			self.display_surface, healthbar_rect, monster.health, 
+			surf, healthbar_rect, monster.health, 
 			monster.get_stat('max_health'), COLORS['red'], COLORS['black'], 2
 		)
-		hp_text = self.fonts['regular'].render(
+		hp_text = self.render_queue.render_text(
 			f"HP: {int(monster.health)}/{int(monster.get_stat('max_health'))}", 
-			False, COLORS['white']
+			self.fonts['regular'], COLORS['white']
 		)
 		hp_rect = hp_text.get_frect(midleft=healthbar_rect.midleft + vector(10, 0))
-		self.display_surface.blit(hp_text, hp_rect)
+		surf.blit(hp_text, hp_rect)
 
 		energybar_rect = pygame.FRect((0, 0), (bar_data['width'], bar_data['height'])).move_to(
 			midtop=(bar_data['right_side'], bar_data['top'])
 		)
 		draw_bar(
-			self.display_surface, energybar_rect, monster.energy, 
+			surf, energybar_rect, monster.energy, 
 			monster.get_stat('max_energy'), COLORS['blue'], COLORS['black'], 2
 		)
-		ep_text = self.fonts['regular'].render(
+		ep_text = self.render_queue.render_text(
 			f"EP: {int(monster.energy)}/{int(monster.get_stat('max_energy'))}", 
-			False, COLORS['white']
+			self.fonts['regular'], COLORS['white']
 		)
 		ep_rect = ep_text.get_frect(midleft=energybar_rect.midleft + vector(10, 0))
-		self.display_surface.blit(ep_text, ep_rect)
+		surf.blit(ep_text, ep_rect)
 
 		# info 
 		sides = {'left': healthbar_rect.left, 'right': energybar_rect.left}
@@ -223,9 +308,9 @@ class MonsterIndex:
 			healthbar_rect.width, info_height
 		).inflate(0, -60).move(0, 15)
 		
-		stats_text_surf = self.fonts['regular'].render('Stats', False, COLORS['white'])
+		stats_text_surf = self.render_queue.render_text('Stats', self.fonts['regular'], COLORS['white'])
 		stats_text_rect = stats_text_surf.get_frect(bottomleft=stats_rect.topleft)
-		self.display_surface.blit(stats_text_surf, stats_text_rect)
+		surf.blit(stats_text_surf, stats_text_rect)
 
 		monster_stats = monster.get_stats()
 		stat_height = stats_rect.height / len(monster_stats)
@@ -241,12 +326,12 @@ class MonsterIndex:
 			# icon 
 			icon_surf = self.ui_frames[stat]
 			icon_rect = icon_surf.get_frect(midleft=single_stat_rect.midleft + vector(5, 0))
-			self.display_surface.blit(icon_surf, icon_rect)
+			surf.blit(icon_surf, icon_rect)
 
 			# text 
-			text_surf = self.fonts['regular'].render(stat, False, COLORS['white'])
+			text_surf = self.render_queue.render_text(stat, self.fonts['regular'], COLORS['white'])
 			text_rect = text_surf.get_frect(topleft=icon_rect.topleft + vector(30, -10))
-			self.display_surface.blit(text_surf, text_rect)
+			surf.blit(text_surf, text_rect)
 
 			# bar 
 			bar_rect = pygame.FRect(
@@ -254,30 +339,50 @@ class MonsterIndex:
 				(single_stat_rect.width - (text_rect.left - single_stat_rect.left), 4)
 			)
 			draw_bar(
-				self.display_surface, bar_rect, value, 
+				surf, bar_rect, value, 
 				self.max_stats[stat] * monster.level, 
 				COLORS['white'], COLORS['black']
 			)
 
 		# abilities 
 		ability_rect = stats_rect.copy().move_to(left=sides['right'])
-		ability_text_surf = self.fonts['regular'].render('Ability', False, COLORS['white'])
+		ability_text_surf = self.render_queue.render_text('Ability', self.fonts['regular'], COLORS['white'])
 		ability_text_rect = ability_text_surf.get_frect(bottomleft=ability_rect.topleft)
-		self.display_surface.blit(ability_text_surf, ability_text_rect)
+		surf.blit(ability_text_surf, ability_text_rect)
 
 		for index, ability in enumerate(monster.get_abilities()):
 			element = ATTACK_DATA[ability]['element']
 
-			text_surf = self.fonts['regular'].render(ability, False, COLORS['black'])
+			text_surf = self.render_queue.render_text(ability, self.fonts['regular'], COLORS['black'])
 			x = ability_rect.left + (index % 2) * ability_rect.width / 2
 			y = 20 + ability_rect.top + (index // 2) * (text_surf.get_height() + 20)
 			rect = text_surf.get_frect(topleft=(x, y))
-			pygame.draw.rect(self.display_surface, COLORS[element], rect.inflate(10, 10), 0, 4)
-			self.display_surface.blit(text_surf, rect)
+			pygame.draw.rect(surf, COLORS[element], rect.inflate(10, 10), 0, 4)
+			surf.blit(text_surf, rect)
+
+		return surf
+
+	def display_main(self, dt):
+		"""Display detailed monster information"""
+		# data 
+		monster = self.monsters[self.index]
+
+		# Cached page, rebuilt when the monster's level, xp, health or energy change
+		page_surf = self.page_cache.get((monster, self.monster_signature(monster)), lambda: self.build_page(monster))
+		self.render_queue.sprite(page_surf, self.page_rect.topleft)
+
+		# monster animation 
+		top_rect = pygame.FRect(self.page_rect.topleft, (self.page_rect.width, self.page_rect.height * 0.4))
+		self.frame_index += ANIMATION_SPEED * dt
+		frames = self.monster_frames[monster.name]['idle']
+		monster_surf = frames[int(self.frame_index) % len(frames)]
+		monster_rect = monster_surf.get_frect(center=top_rect.center)
+		self.render_queue.sprite(monster_surf, monster_rect)
 
 	def update(self, dt):
 		"""Update monster index state"""
+		self.sync_list()
 		self.input()
-		self.display_surface.blit(self.tint_surf, (0, 0))
+		self.render_queue.tint(COLORS['black'], 200, layer=RENDER_LAYERS['ui'])
 		self.display_list() 
 		self.display_main(dt)
\ No newline at end of file
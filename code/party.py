@@ -0,0 +1,152 @@
+"""
+Monster Party for Monster Hunter
+Compatible with Pygame CE 2.5.5 and Python 3.13.7
+Ordered party/box storage with stable monster ids. Behaves like the old
+int-keyed dict (slot -> Monster) and tracks which monsters are on the
+battlefield and which can be switched in, so battle lookups are O(1)
+"""
+
+from collections.abc import MutableMapping
+
+class MonsterParty(MutableMapping):
+	"""Monsters by slot (0 .. len - 1). Every monster gets an id that stays the
+	same while it is in the party, also when it is moved or evolves."""
+
+	def __init__(self, monsters=None):
+		"""
+		Args:
+			monsters: Dict of slot -> Monster (added in slot order) or an iterable of Monsters
+		"""
+		self.order = []  # slot -> id
+		self.monsters = {}  # id -> Monster
+		self.ids = {}  # Monster -> id
+		self.slots = {}  # id -> slot
+		self.next_id = 0
+
+		# Battle state
+		self.active = set()  # ids on the battlefield
+		self.available = set()  # ids that can be switched in
+
+		if isinstance(monsters, dict):
+			monsters = [monsters[slot] for slot in sorted(monsters)]
+		for monster in monsters or ():
+			self.add(monster)
+
+	# Mapping interface
+	def __getitem__(self, slot):
+		if not 0 <= slot < len(self.order):
+			raise KeyError(slot)
+		return self.monsters[self.order[slot]]
+
+	def __setitem__(self, slot, monster):
+		"""Replace the monster in a slot (keeping its id), or append at slot == len"""
+		if slot == len(self.order):
+			self.add(monster)
+			return
+		monster_id = self.order[slot]
+		del self.ids[self.monsters[monster_id]]
+		self.monsters[monster_id] = monster
+		self.ids[monster] = monster_id
+
+	def __delitem__(self, slot):
+		"""Remove a monster; the slots after it move up by one"""
+		monster_id = self.order.pop(slot)
+		del self.ids[self.monsters.pop(monster_id)]
+		del self.slots[monster_id]
+		self.active.discard(monster_id)
+		self.available.discard(monster_id)
+		for index in range(slot, len(self.order)):
+			self.slots[self.order[index]] = index
+
+	def __contains__(self, slot):
+		return isinstance(slot, int) and 0 <= slot < len(self.order)
+
+	def __iter__(self):
+		return iter(range(len(self.order)))
+
+	def __len__(self):
+		return len(self.order)
+
+	def __repr__(self):
+		return f'MonsterParty({list(self.values())})'
+
+	# Storage
+	def add(self, monster):
+		"""
+		Append a monster (e.g. a caught one)
+
+		Returns:
+			int: The monster's id
+		"""
+		monster_id = self.next_id
+		self.next_id += 1
+		self.slots[monster_id] = len(self.order)
+		self.order.append(monster_id)
+		self.monsters[monster_id] = monster
+		self.ids[monster] = monster_id
+		if monster.health > 0:
+			self.available.add(monster_id)
+		return monster_id
+
+	def swap(self, first, second):
+		"""Exchange the monsters in two slots"""
+		order = self.order
+		order[first], order[second] = order[second], order[first]
+		self.slots[order[first]] = first
+		self.slots[order[second]] = second
+
+	def id_of(self, monster):
+		"""Stable id of a monster in the party"""
+		return self.ids[monster]
+
+	def slot_of(self, monster):
+		"""Current slot of a monster in the party"""
+		return self.slots[self.ids[monster]]
+
+	def get_by_id(self, monster_id):
+		"""Monster with an id, or None"""
+		return self.monsters.get(monster_id)
+
+	# Battle tracking
+	def begin_battle(self):
+		"""Reset the battle state: nobody active, every healthy monster available"""
+		self.active.clear()
+		self.available = {monster_id for monster_id in self.order if self.monsters[monster_id].health > 0}
+
+	def activate(self, monster):
+		"""A monster entered the battlefield"""
+		monster_id = self.ids.get(monster)
+		if monster_id is not None:
+			self.active.add(monster_id)
+			self.available.discard(monster_id)
+
+	def deactivate(self, monster):
+		"""A monster left the battlefield (switched out or fainted)"""
+		monster_id = self.ids.get(monster)
+		if monster_id is not None:
+			self.active.discard(monster_id)
+			if monster.health > 0:
+				self.available.add(monster_id)
+			else:
+				self.available.discard(monster_id)
+
+	def is_active(self, monster):
+		"""True if the monster is on the battlefield"""
+		return self.ids.get(monster) in self.active
+
+	def first_available(self):
+		"""
+		Replacement for a fainted monster: the available one in the lowest slot
+
+		Returns:
+			tuple: (slot, Monster) or None if nobody can be switched in
+		"""
+		if not self.available:
+			return None
+		monster_id = min(self.available, key=self.slots.__getitem__)
+		return self.slots[monster_id], self.monsters[monster_id]
+
+	def available_monsters(self):
+		"""Monsters that can be switched in, as {slot: Monster} in slot order"""
+		return {self.slots[monster_id]: self.monsters[monster_id]
+				for monster_id in sorted(self.available, key=self.slots.__getitem__)}
@@ -0,0 +1,211 @@
+"""
+Frame Profiler for Monster Hunter
+Compatible with Pygame CE 2.5.5 and Python 3.13.7
+Scoped per-subsystem frame timers with a toggleable overlay and CSV trace
+"""
+
+from settings import *
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from math import ceil
+import csv
+
+class FrameProfiler:
+	"""Collects per-section frame timings and draws them as an overlay"""
+
+	def __init__(self, window=300, trace_length=3600, overlay_refresh=15):
+		"""
+		Initialize profiler
+
+		Args:
+			window: Number of frames used for the rolling percentiles
+			trace_length: Number of frames kept for the CSV trace
+			overlay_refresh: Rebuild the overlay text every N frames
+		"""
+		self.window = window
+		self.overlay_visible = False
+		self.overlay_refresh = overlay_refresh
+		self.overlay_surf = None
+		self.font = None
+
+		# timing data
+		self.samples = {}  # section name -> deque of ms per frame
+		self.frame_samples = deque(maxlen=window)
+		self.current = {}  # section name -> ms spent in the running frame
+		self.counts = {}  # counter name -> value for the running frame
+		self.trace = deque(maxlen=trace_length)
+		self.frame_number = 0
+		self.frame_start = None
+
+		# trace output
+		self.trace_dir = Path(__file__).parent.parent / 'profiles'
+
+	@contextmanager
+	def section(self, name):
+		"""
+		Time a block of code and add it to the running frame
+
+		Args:
+			name: Section name shown in the overlay and trace
+		"""
+		start = perf_counter()
+		try:
+			yield
+		finally:
+			elapsed = (perf_counter() - start) * 1000.0
+			self.current[name] = self.current.get(name, 0.0) + elapsed
+
+	def begin_frame(self):
+		"""Start timing a new frame"""
+		self.current = {}
+		self.counts = {}
+		self.frame_start = perf_counter()
+
+	def end_frame(self):
+		"""Finish the running frame and store its samples"""
+		if self.frame_start is None:
+			return
+
+		total = (perf_counter() - self.frame_start) * 1000.0
+		self.frame_samples.append(total)
+
+		for name, value in self.current.items():
+			if name not in self.samples:
+				self.samples[name] = deque(maxlen=self.window)
+			self.samples[name].append(value)
+
+		row = {'frame': self.frame_number, 'total': round(total, 4)}
+		row.update({name: round(value, 4) for name, value in self.current.items()})
+		row.update(self.counts)
+		self.trace.append(row)
+
+		self.frame_number += 1
+		self.frame_start = None
+
+		if self.overlay_visible and self.frame_number % self.overlay_refresh == 0:
+			self.overlay_surf = None
+
+	def set_count(self, name, value):
+		"""
+		Record a counter (e.g. sprite count) for the running frame
+
+		Args:
+			name: Counter name
+			value: Counter value
+		"""
+		self.counts[name] = value
+
+	@staticmethod
+	def percentile(values, percent):
+		"""Nearest-rank percentile of a sequence of values"""
+		if not values:
+			return 0.0
+		ordered = sorted(values)
+		rank = max(0, min(len(ordered), ceil(percent / 100 * len(ordered))) - 1)
+		return ordered[rank]
+
+	def get_percentiles(self, name=None):
+		"""
+		Get rolling p50, p95 and p99 for a section
+
+		Args:
+			name: Section name, or None for the whole frame
+
+		Returns:
+			Tuple of (p50, p95, p99) in milliseconds
+		"""
+		values = self.frame_samples if name is None else self.samples.get(name, ())
+		return tuple(self.percentile(values, percent) for percent in (50, 95, 99))
+
+	def toggle_overlay(self):
+		"""Show or hide the overlay"""
+		self.overlay_visible = not self.overlay_visible
+		self.overlay_surf = None
+
+	def write_trace(self, path=None):
+		"""
+		Write the recorded frames to a CSV file
+
+		Args:
+			path: Target file, defaults to profiles/frame_trace_<timestamp>.csv
+
+		Returns:
+			Path of the written file or None if writing failed
+		"""
+		if path is None:
+			self.trace_dir.mkdir(exist_ok=True)
+			path = self.trace_dir / f"frame_trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+
+		# Columns: fixed first, then every section/counter seen in the trace
+		columns = ['frame', 'total']
+		for row in self.trace:
+			for key in row:
+				if key not in columns:
+					columns.append(key)
+
+		try:
+			with open(path, 'w', newline='') as f:
+				writer = csv.DictWriter(f, fieldnames=columns, restval=0)
+				writer.writeheader()
+				writer.writerows(self.trace)
+			print(f"Frame trace written to {path}")
+			return Path(path)
+		except Exception as e:
+			print(f"Error writing frame trace: {e}")
+			return None
+
+	def handle_event(self, event):
+		"""
+		Handle profiler hotkeys (F3 toggles the overlay, F4 writes a trace)
+
+		Args:
+			event: Pygame event
+		"""
+		if event.type == pygame.KEYDOWN:
+			if event.key == pygame.K_F3:
+				self.toggle_overlay()
+			elif event.key == pygame.K_F4:
+				self.write_trace()
+
+	def build_overlay(self):
+		"""Render the overlay text into a cached surface"""
+		if self.font is None:
+			self.font = pygame.font.SysFont('monospace', 15)
+
+		lines = [f"{'section (ms)':<20}{'p50':>7}{'p95':>8}{'p99':>8}"]
+		p50, p95, p99 = self.get_percentiles()
+		lines.append(f"{'frame':<20}{p50:>7.2f}{p95:>8.2f}{p99:>8.2f}")
+		for name in self.samples:
+			p50, p95, p99 = self.get_percentiles(name)
+			lines.append(f"{name[:20]:<20}{p50:>7.2f}{p95:>8.2f}{p99:>8.2f}")
+		for name, value in self.counts.items():
+			lines.append(f"{name}: {value}")
+
+		line_surfs = [self.font.render(line, True, COLORS['pure white']) for line in lines]
+		width = max(surf.get_width() for surf in line_surfs) + 20
+		height = sum(surf.get_height() for surf in line_surfs) + 20
+
+		surf = pygame.Surface((width, height), pygame.SRCALPHA)
+		surf.fill((0, 0, 0, 180))
+		y = 10
+		for line_surf in line_surfs:
+			surf.blit(line_surf, (10, y))
+			y += line_surf.get_height()
+		self.overlay_surf = surf
+
+	def draw(self, surface):
+		"""
+		Draw the overlay in the top right corner if it is visible
+
+		Args:
+			surface: Surface to draw on
+		"""
+		if not self.overlay_visible:
+			return
+		if self.overlay_surf is None:
+			self.build_overlay()
+		rect = self.overlay_surf.get_rect(topright=(surface.get_width() - 10, 10))
+		surface.blit(self.overlay_surf, rect)
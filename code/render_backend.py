@@ -0,0 +1,183 @@
+"""
+Render Backends for Monster Hunter
+Compatible with Pygame CE 2.5.5 and Python 3.13.7
+Software backend (display surface + flip) and an optional GPU backend built
+on pygame._sdl2.video that draws world sprites as textures. Both execute
+the frame's render queue (see render_queue.py)
+
+With the GPU backend the world layer is drawn by the renderer; everything
+else (UI, battle, menus) is still drawn in software onto a transparent
+canvas that is uploaded as one texture on top of the world each frame.
+"""
+
+from settings import *
+from render_queue import RenderQueue
+from weakref import WeakKeyDictionary
+import os
+
+# Drivers without a real GPU - the GPU backend is never attempted on these
+HEADLESS_DRIVERS = ('dummy', 'offscreen')
+
+backend = None  # Active backend, created by get_backend
+
+class SoftwareBackend:
+	"""Draws everything with Surface.blit onto the display surface"""
+	name = 'software'
+	uses_textures = False
+
+	def __init__(self, size, title):
+		self.surface = pygame.display.set_mode(size)
+		pygame.display.set_caption(title)
+		self.queue = RenderQueue()
+
+	def set_title(self, title):
+		"""Change the window title"""
+		pygame.display.set_caption(title)
+
+	def begin_frame(self):
+		"""Clear the frame"""
+		self.surface.fill('black')
+
+	def blit_world(self, image, pos):
+		"""Draw a world sprite image at a screen position"""
+		self.surface.blit(image, pos)
+
+	def preload(self, frames):
+		"""Nothing to upload for software rendering"""
+
+	def flush(self):
+		"""Draw the queued commands"""
+		return self.queue.flush(self.surface)
+
+	def present(self):
+		"""Draw anything still queued and show the frame"""
+		self.flush()
+		pygame.display.flip()
+
+class GPUBackend:
+	"""Draws world sprites as cached textures through an SDL renderer"""
+	name = 'gpu'
+	uses_textures = True
+
+	def __init__(self, size, title):
+		"""
+		Create the window and an accelerated renderer
+
+		Raises:
+			pygame.error: If no hardware renderer is available
+		"""
+		from pygame._sdl2.video import Window, Renderer, Texture
+		self.Texture = Texture
+
+		# convert()/convert_alpha() need a pixel format from some window surface;
+		# the game window itself must not have one because it uses a renderer
+		self.format_window = Window('format', (1, 1), hidden=True)
+		self.format_window.get_surface()
+
+		self.window = Window(title, size)
+		try:
+			self.renderer = Renderer(self.window, accelerated=1, vsync=False)
+		except Exception:
+			self.window.destroy()
+			self.format_window.destroy()
+			raise
+		self.renderer.draw_color = (0, 0, 0, 255)
+
+		# Software canvas for UI and screens that still blit
+		self.surface = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+		self.canvas_texture = Texture(self.renderer, size, streaming=True)
+		self.canvas_texture.blend_mode = 1  # SDL_BLENDMODE_BLEND
+
+		# Surface -> Texture, dropped automatically when a surface is freed
+		self.textures = WeakKeyDictionary()
+		self.queue = RenderQueue()
+
+	def set_title(self, title):
+		"""Change the window title"""
+		self.window.title = title
+
+	def texture(self, image):
+		"""Texture for a surface, uploaded the first time it is drawn"""
+		texture = self.textures.get(image)
+		if texture is None:
+			texture = self.textures[image] = self.Texture.from_surface(self.renderer, image)
+			alpha = image.get_alpha()
+			if alpha is not None and alpha < 255:
+				texture.alpha = alpha
+		return texture
+
+	def preload(self, frames):
+		"""
+		Upload every surface in a (nested) frame dict or list
+
+		Args:
+			frames: Surface, list or dict of frames as produced by support.py
+		"""
+		if isinstance(frames, pygame.Surface):
+			self.texture(frames)
+		elif isinstance(frames, dict):
+			for value in frames.values():
+				self.preload(value)
+		elif isinstance(frames, (list, tuple)):
+			for value in frames:
+				self.preload(value)
+
+	def begin_frame(self):
+		"""Clear the renderer and make the canvas transparent"""
+		self.renderer.clear()
+		self.surface.fill((0, 0, 0, 0))
+
+	def blit_world(self, image, pos):
+		"""Draw a world sprite image at a screen position"""
+		self.texture(image).draw(dstrect=(pos[0], pos[1], image.get_width(), image.get_height()))
+
+	def flush(self):
+		"""Draw the queued commands - world sprites as textures, the rest onto the canvas"""
+		return self.queue.flush(self.surface, self.blit_world)
+
+	def present(self):
+		"""Put the software canvas over the world and show the frame"""
+		self.flush()
+		self.canvas_texture.update(self.surface)
+		self.canvas_texture.draw()
+		self.renderer.present()
+
+def create_backend(size=(WINDOW_WIDTH, WINDOW_HEIGHT), title='Monster Hunter', preferred=None):
+	"""
+	Create the render backend
+
+	Args:
+		size: Window size
+		title: Window title
+		preferred: 'gpu' or 'software', defaults to RENDER_BACKEND
+
+	Returns:
+		SoftwareBackend or GPUBackend
+	"""
+	preferred = preferred or RENDER_BACKEND
+	driver = os.environ.get('SDL_VIDEODRIVER', '').lower()
+	if preferred == 'gpu' and driver not in HEADLESS_DRIVERS:
+		try:
+			gpu_backend = GPUBackend(size, title)
+			print("Using GPU render backend")
+			return gpu_backend
+		except Exception as e:
+			print(f"GPU render backend unavailable ({e}), using software rendering")
+	return SoftwareBackend(size, title)
+
+def get_backend(title=None):
+	"""Active backend, created on first use"""
+	global backend
+	if backend is None:
+		backend = create_backend(title=title or 'Monster Hunter')
+	elif title:
+		backend.set_title(title)
+	return backend
+
+def get_render_queue():
+	"""Render queue of the active backend"""
+	return get_backend().queue
+
+def get_display_surface():
+	"""Surface that screens draw on (the display or the GPU backend's canvas)"""
+	return backend.surface if backend else pygame.display.get_surface()
@@ -0,0 +1,236 @@
+"""
+Render Queue for Monster Hunter
+Compatible with Pygame CE 2.5.5 and Python 3.13.7
+Game code submits draw commands (sprite, rect, text, fill, tint) instead of
+blitting to the display. The render backend sorts them by layer, batches
+runs of sprites into single blits calls and executes them once per frame.
+Tints are the screen-effects stage: invisible ones are skipped, stacked ones
+are folded into one pass and opaque targets are tinted with blend fills
+"""
+
+from settings import *
+from text_render import SurfaceCache
+
+# Command kinds
+SPRITE, RECT, FILL, TINT = 'sprite', 'rect', 'fill', 'tint'
+
+text_cache = SurfaceCache(512)
+overlays = {}  # size -> per-pixel alpha overlay for tints on per-pixel alpha targets
+
+def fold_tints(tints):
+	"""
+	Combine overlays drawn on top of each other into one equivalent overlay
+
+	Args:
+		tints: (color, alpha) pairs in drawing order
+
+	Returns:
+		tuple: (pygame.Color, alpha), alpha is 0 if nothing is visible
+	"""
+	red = green = blue = coverage = 0.0  # premultiplied result
+	for color, alpha in tints:
+		color = pygame.Color(color)
+		opacity = max(0.0, min(alpha, 255.0)) / 255.0
+		red = color.r * opacity + red * (1 - opacity)
+		green = color.g * opacity + green * (1 - opacity)
+		blue = color.b * opacity + blue * (1 - opacity)
+		coverage = opacity + coverage * (1 - opacity)
+	if coverage <= 0:
+		return pygame.Color(0, 0, 0), 0
+	return pygame.Color(round(red / coverage), round(green / coverage), round(blue / coverage)), round(coverage * 255)
+
+def apply_tint(surface, color, alpha, rect=None):
+	"""
+	Tint a surface (or part of it) with a translucent color
+
+	Opaque targets such as the display are tinted with a BLEND_MULT fill (plus
+	a BLEND_ADD fill for non-black colors) instead of blitting an alpha
+	overlay. Per-pixel alpha targets (the GPU backend's canvas) still get an
+	overlay blit, which also darkens the world textures showing through.
+
+	Args:
+		surface: Target surface
+		color: Tint color
+		alpha: Tint opacity (0 - 255)
+		rect: Tinted area, None for the whole surface
+
+	Returns:
+		int: Number of draw calls used
+	"""
+	alpha = int(alpha)
+	if alpha <= 0:
+		return 0
+	color = pygame.Color(color)
+	if alpha >= 255:
+		surface.fill(color, rect)
+		return 1
+
+	if surface.get_flags() & pygame.SRCALPHA:
+		rect = pygame.Rect(rect) if rect else surface.get_rect()
+		overlay = overlays.get(rect.size)
+		if overlay is None:
+			overlay = overlays[rect.size] = pygame.Surface(rect.size, pygame.SRCALPHA)
+		overlay.fill((color.r, color.g, color.b, alpha))
+		surface.blit(overlay, rect)
+		return 1
+
+	# dst * (1 - alpha) + color * alpha
+	keep = 255 - alpha
+	surface.fill((keep, keep, keep), rect, pygame.BLEND_MULT)
+	if color.r or color.g or color.b:
+		surface.fill((color.r * alpha // 255, color.g * alpha // 255, color.b * alpha // 255), rect, pygame.BLEND_ADD)
+		return 2
+	return 1
+
+class RenderQueue:
+	"""Per-frame list of draw commands with draw call statistics"""
+
+	def __init__(self):
+		self.commands = []  # (layer, kind, args) in submission order
+		self.stats = {'commands': 0, 'draw_calls': 0}  # Last flushed frame
+
+	def __len__(self):
+		return len(self.commands)
+
+	# Submission
+	def sprite(self, image, pos, area=None, flags=0, layer=RENDER_LAYERS['ui']):
+		"""
+		Queue a surface blit
+
+		Args:
+			image: Surface to draw
+			pos: Top left position (or rect)
+			area: Part of the image to draw, None for all of it
+			flags: Blend flags
+			layer: RENDER_LAYERS value, lower layers are drawn first
+		"""
+		self.commands.append((layer, SPRITE, (image, pos, area, flags)))
+
+	def rect(self, color, rect, width=0, *radii, layer=RENDER_LAYERS['ui']):
+		"""
+		Queue a rectangle (same arguments as pygame.draw.rect)
+
+		Args:
+			color: Fill or outline color
+			rect: Rectangle
+			width: Outline width, 0 fills the rectangle
+			*radii: border_radius and optional per-corner radii
+			layer: RENDER_LAYERS value
+		"""
+		self.commands.append((layer, RECT, (color, rect, width) + radii))
+
+	def bar(self, rect, value, max_value, color, bg_color, radius=1, layer=RENDER_LAYERS['ui']):
+		"""Queue a progress bar (see support.draw_bar)"""
+		ratio = rect.width / max_value if max_value > 0 else 0
+		progress = max(0.0, min(rect.width, value * ratio))
+		self.rect(bg_color, rect.copy(), 0, radius, layer=layer)
+		self.rect(color, pygame.FRect(rect.topleft, (progress, rect.height)), 0, radius, layer=layer)
+
+	def render_text(self, text, font, color, antialias=False):
+		"""
+		Rendered text surface, cached across frames
+
+		Returns:
+			pygame.Surface: Text surface (shared, do not modify)
+		"""
+		color = pygame.Color(color)
+		return text_cache.get((text, font, tuple(color), antialias),
+							  lambda: font.render(text, antialias, color))
+
+	def text(self, text, font, color, antialias=False, layer=RENDER_LAYERS['ui'], **anchor):
+		"""
+		Queue text positioned by a rect anchor (e.g. center=(x, y))
+
+		Returns:
+			pygame.FRect: Where the text is drawn
+		"""
+		surf = self.render_text(text, font, color, antialias)
+		rect = surf.get_frect(**anchor)
+		self.sprite(surf, rect, layer=layer)
+		return rect
+
+	def fill(self, color, rect=None, flags=0, layer=RENDER_LAYERS['ui']):
+		"""Queue a solid fill of the target or part of it"""
+		self.commands.append((layer, FILL, (color, rect, flags)))
+
+	def tint(self, color, alpha, rect=None, layer=RENDER_LAYERS['transition']):
+		"""
+		Queue a translucent color overlay. Invisible tints are not queued
+
+		Args:
+			color: Overlay color
+			alpha: Overlay opacity (0 - 255)
+			rect: Covered area, None for the whole target
+			layer: RENDER_LAYERS value
+		"""
+		if alpha > 0:
+			self.commands.append((layer, TINT, (color, alpha, rect)))
+
+	# Execution
+
+	def flush(self, surface, blit_world=None):
+		"""
+		Execute and clear the queued commands
+
+		Args:
+			surface: Target surface
+			blit_world: Optional function (image, pos) for world layer sprites,
+				used by backends that draw the world themselves
+
+		Returns:
+			dict: Command and draw call counts for the frame
+		"""
+		# Stable sort - submission order is kept within a layer
+		commands = self.commands
+		commands.sort(key=lambda command: command[0])
+		self.commands = []
+		draw_calls = 0
+
+		index = 0
+		while index < len(commands):
+			layer, kind, args = commands[index]
+
+			if kind == SPRITE:
+				# Batch the run of sprite commands that follows on the same layer
+				end = index + 1
+				while end < len(commands) and commands[end][1] == SPRITE and commands[end][0] == layer:
+					end += 1
+				batch = [command[2] for command in commands[index:end]]
+				if blit_world and layer == RENDER_LAYERS['world']:
+					for image, pos, area, flags in batch:
+						blit_world(image, pos)
+					draw_calls += len(batch)
+				elif all(area is None and not flags for _, _, area, flags in batch):
+					surface.fblits([(image, pos) for image, pos, _, _ in batch])
+					draw_calls += 1
+				else:
+					surface.blits(batch, doreturn=False)
+					draw_calls += 1
+				index = end
+				continue
+
+			if kind == TINT:
+				# Fold directly stacked tints over the same area into one pass
+				end = index + 1
+				while end < len(commands) and commands[end][1] == TINT and commands[end][2][2] == args[2]:
+					end += 1
+				color, alpha = fold_tints([(color, alpha) for color, alpha, _ in
+										   (command[2] for command in commands[index:end])])
+				draw_calls += apply_tint(surface, color, alpha, args[2])
+				index = end
+				continue
+
+			if kind == RECT:
+				pygame.draw.rect(surface, *args)
+			elif kind == FILL:
+				color, rect, flags = args
+				surface.fill(color, rect, flags)
+			draw_calls += 1
+			index += 1
+
+		self.stats = {'commands': len(commands), 'draw_calls': draw_calls}
+		return self.stats
+
+	def clear(self):
+		"""Drop queued commands without drawing them"""
+		self.commands.clear()
@@ -0,0 +1,94 @@
+"""
+Random Numbers for Monster Hunter
+Compatible with Pygame CE 2.5.5 and Python 3.13.7
+One independently seeded random stream per subsystem, so that e.g. drawing
+more cosmetic random numbers never changes which monsters appear. All
+streams follow from one master seed and can be snapshotted and restored
+"""
+
+from random import Random, getrandbits
+from settings import RNG_SEED
+
+# Subsystems with their own stream
+STREAMS = (
+	'encounters',  # wild monster encounters and starting party rolls
+	'ai',  # opponent decisions and NPC behaviour, battle seeds
+	'cosmetics',  # visual variation only, never affects the game state
+)
+
+class RNGService:
+	"""Named random streams derived from one master seed"""
+
+	def __init__(self, seed=None):
+		"""
+		Initialize random streams
+
+		Args:
+			seed: Master seed (int or str), random if None
+		"""
+		self.reseed(seed)
+
+	def reseed(self, seed=None):
+		"""Restart every stream from a new master seed"""
+		self.seed = seed if seed is not None else getrandbits(64)
+		self.streams = {}
+
+	def stream(self, name):
+		"""
+		Random generator of a subsystem, created on first use
+
+		Args:
+			name: Subsystem name from STREAMS
+
+		Returns:
+			random.Random: The subsystem's generator
+		"""
+		stream = self.streams.get(name)
+		if stream is None:
+			if name not in STREAMS:
+				raise KeyError(f"Unknown random stream '{name}'")
+			# String seeds are hashed with SHA-512, so streams don't depend on PYTHONHASHSEED
+			stream = self.streams[name] = Random(f'{self.seed}/{name}')
+		return stream
+
+	__getitem__ = stream
+
+	def spawn(self, name):
+		"""
+		Independent service seeded from one of the streams (e.g. for a
+		parallel headless simulation)
+
+		Returns:
+			RNGService: New service
+		"""
+		return RNGService(self.stream(name).getrandbits(64))
+
+	def snapshot(self):
+		"""
+		Current position of every stream
+
+		Returns:
+			dict: JSON compatible state for restore
+		"""
+		streams = {}
+		for name, stream in self.streams.items():
+			version, internal, gauss_next = stream.getstate()
+			streams[name] = [version, list(internal), gauss_next]
+		return {'seed': self.seed, 'streams': streams}
+
+	def restore(self, snapshot):
+		"""
+		Return every stream to a snapshotted position
+
+		Args:
+			snapshot: Dictionary from snapshot
+		"""
+		self.reseed(snapshot['seed'])
+		for name, (version, internal, gauss_next) in snapshot['streams'].items():
+			self.stream(name).setstate((version, tuple(internal), gauss_next))
+
+rng = RNGService(RNG_SEED)  # Shared by the game
+
+def get_stream(name):
+	"""Random generator of a subsystem from the shared service"""
+	return rng.stream(name)
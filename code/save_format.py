@@ -0,0 +1,252 @@
+"""
+Binary Save Format for Monster Hunter
+Compatible with Pygame CE 2.5.5 and Python 3.13.7
+Schema-versioned compact save files: a fixed header, an interned string
+table and one fixed-size record per monster
+
+Layout (little endian):
+	header        HEADER struct (magic, version, summary fields, counts)
+	string table  string_count length-prefixed UTF-8 strings
+	              (0 = current map, 1 = current spawn, then monster names)
+	records       monster_count RECORD structs
+"""
+
+import pickle
+import struct
+from collections import namedtuple
+from datetime import datetime
+
+MAGIC = b'PKSV'
+SCHEMA_VERSION = 1
+
+# magic, version, header size, save time, game time, player x, player y,
+# monster count, party level sum, string count, string table bytes
+HEADER = struct.Struct('<4sHHddiiIIII')
+
+# slot key, name string index, level, health, energy, xp
+RECORD = struct.Struct('<IHHfff')
+
+STRING_LENGTH = struct.Struct('<H')
+
+# Plain monster data - cheap to snapshot, independent of the Monster class
+MonsterRecord = namedtuple('MonsterRecord', 'name level health energy xp')
+
+# from_version -> function(save_dict) -> save_dict at from_version + 1
+MIGRATIONS = {}
+
+class SaveFormatError(Exception):
+	"""Raised when a save file cannot be decoded"""
+
+
+def register_migration(from_version):
+	"""
+	Register a function that upgrades a decoded save from one schema version to the next
+
+	Args:
+		from_version (int): Schema version the function accepts
+	"""
+	def decorator(func):
+		MIGRATIONS[from_version] = func
+		return func
+	return decorator
+
+
+def monster_to_record(monster):
+	"""Convert a Monster (or an existing record) to a MonsterRecord"""
+	if isinstance(monster, MonsterRecord):
+		return monster
+	return MonsterRecord(monster.name, monster.level, monster.health, monster.energy, monster.xp)
+
+
+def record_to_monster(record):
+	"""Build a Monster from a MonsterRecord"""
+	from monster import Monster
+
+	monster = Monster(record.name, record.level)
+	monster.health = record.health
+	monster.energy = record.energy
+	monster.xp = record.xp
+	return monster
+
+
+def encode_save(game_state, save_time=None):
+	"""
+	Encode a game state into the binary save format
+
+	Args:
+		game_state (dict): State from create_game_state_snapshot
+		save_time (float): Unix timestamp, defaults to now
+
+	Returns:
+		bytes: Encoded save
+	"""
+	monsters = {key: monster_to_record(monster) for key, monster in game_state.get('player_monsters', {}).items()}
+	position = game_state.get('player_position', (0, 0))
+
+	# String table with interned monster names
+	strings = [game_state.get('current_map', 'world'), game_state.get('current_spawn', 'house')]
+	string_ids = {}
+	records = bytearray()
+	for key, record in monsters.items():
+		if record.name not in string_ids:
+			string_ids[record.name] = len(strings)
+			strings.append(record.name)
+		records += RECORD.pack(int(key), string_ids[record.name], int(record.level),
+							   float(record.health), float(record.energy), float(record.xp))
+
+	string_table = bytearray()
+	for string in strings:
+		data = string.encode('utf-8')
+		string_table += STRING_LENGTH.pack(len(data)) + data
+
+	header = HEADER.pack(
+		MAGIC, SCHEMA_VERSION, HEADER.size,
+		save_time if save_time is not None else datetime.now().timestamp(),
+		float(game_state.get('game_time', 0.0)),
+		int(position[0]), int(position[1]),
+		len(monsters),
+		sum(int(record.level) for record in monsters.values()),
+		len(strings), len(string_table)
+	)
+	return header + bytes(string_table) + bytes(records)
+
+
+def _decode_strings(data, count):
+	"""Decode a length-prefixed string table"""
+	strings = []
+	offset = 0
+	for _ in range(count):
+		(length,) = STRING_LENGTH.unpack_from(data, offset)
+		offset += STRING_LENGTH.size
+		strings.append(bytes(data[offset:offset + length]).decode('utf-8'))
+		offset += length
+	return strings
+
+
+def _decode_header(data):
+	"""Decode the header fields into a dictionary"""
+	if len(data) < HEADER.size:
+		raise SaveFormatError("Save file is truncated")
+
+	(magic, version, header_size, save_time, game_time, player_x, player_y,
+	 monster_count, level_sum, string_count, string_bytes) = HEADER.unpack_from(data)
+	if magic != MAGIC:
+		raise SaveFormatError("Not a Monster Hunter save file")
+	if version > SCHEMA_VERSION:
+		raise SaveFormatError(f"Save version {version} is newer than supported version {SCHEMA_VERSION}")
+
+	return {
+		'version': version,
+		'header_size': header_size,
+		'save_time': save_time,
+		'game_time': game_time,
+		'player_position': (player_x, player_y),
+		'monster_count': monster_count,
+		'level_sum': level_sum,
+		'string_count': string_count,
+		'string_bytes': string_bytes,
+	}
+
+
+def read_summary(path):
+	"""
+	Read only the header and string table of a save file
+	(size does not depend on how many monsters are stored)
+
+	Args:
+		path (Path): Save file
+
+	Returns:
+		dict: Summary with save time, playtime, map and party info
+	"""
+	with open(path, 'rb') as f:
+		header = _decode_header(f.read(HEADER.size))
+		f.seek(header['header_size'])
+		strings = _decode_strings(f.read(header['string_bytes']), header['string_count'])
+
+	header['current_map'] = strings[0]
+	header['current_spawn'] = strings[1]
+	return header
+
+
+def decode_save(data):
+	"""
+	Decode a save into plain data (no Monster objects are created)
+
+	Args:
+		data (bytes): Encoded save
+
+	Returns:
+		dict: Save data at the current schema version with monster records
+	"""
+	header = _decode_header(data)
+	offset = header['header_size']
+	strings = _decode_strings(memoryview(data)[offset:offset + header['string_bytes']], header['string_count'])
+	offset += header['string_bytes']
+
+	if len(data) < offset + header['monster_count'] * RECORD.size:
+		raise SaveFormatError("Save file is truncated")
+
+	monsters = {}
+	for key, name_id, level, health, energy, xp in RECORD.iter_unpack(
+			memoryview(data)[offset:offset + header['monster_count'] * RECORD.size]):
+		monsters[key] = MonsterRecord(strings[name_id], level, health, energy, xp)
+
+	save = {
+		'version': header['version'],
+		'save_time': header['save_time'],
+		'game_time': header['game_time'],
+		'player_position': header['player_position'],
+		'current_map': strings[0],
+		'current_spawn': strings[1],
+		'player_monsters': monsters,
+	}
+	return migrate(save)
+
+
+def decode_legacy_pickle(data):
+	"""
+	Decode a pickle save written before the binary format existed
+
+	Args:
+		data (bytes): Pickled game state
+
+	Returns:
+		dict: Save data migrated to the current schema version
+	"""
+	state = pickle.loads(data)
+	save = dict(state)
+	save['version'] = 0
+	return migrate(save)
+
+
+def migrate(save):
+	"""
+	Run registered migrations until the save reaches SCHEMA_VERSION
+
+	Args:
+		save (dict): Decoded save with a 'version' key
+
+	Returns:
+		dict: Save data at the current schema version
+	"""
+	while save['version'] < SCHEMA_VERSION:
+		migration = MIGRATIONS.get(save['version'])
+		if migration is None:
+			raise SaveFormatError(f"No migration from save version {save['version']}")
+		save = migration(save)
+	return save
+
+
+@register_migration(0)
+def _migrate_pickle_to_v1(save):
+	"""Version 0 (pickled Monster objects) -> version 1 (monster records)"""
+	save['player_monsters'] = {key: monster_to_record(monster)
+							   for key, monster in save.get('player_monsters', {}).items()}
+	save.setdefault('save_time', None)
+	save.setdefault('game_time', 0.0)
+	save.setdefault('player_position', (0, 0))
+	save.setdefault('current_map', 'world')
+	save.setdefault('current_spawn', 'house')
+	save['version'] = 1
+	return save
@@ -3,12 +3,21 @@ Save/Load system for game state persistence
 Handles saving and loading player progress, monsters, and game state
 """
 import json
-import pickle
+import os
+import threading
 from pathlib import Path
 from datetime import datetime
+from save_format import (encode_save, decode_save, decode_legacy_pickle, read_summary,
+						 monster_to_record, record_to_monster)
+from party import MonsterParty
 
 class SaveSystem:
-	"""Manages game save and load operations"""
+	"""Manages game save and load operations across multiple save slots"""
+	
+	# Manual slots, each with its own rotating autosave slots (see autosave_slots)
+	SLOTS = ('slot1', 'slot2', 'slot3')
+	AUTOSAVES_PER_SLOT = 3
+	AUTOSAVE = 'auto'  # Pseudo slot: resolves to the active slot's next rotating autosave slot
 	
 	def __init__(self, save_dir='saves'):
 		"""Initialize save system"""
@@ -18,45 +27,102 @@ class SaveSystem:
 		self.save_dir = base_path / save_dir
 		self.save_dir.mkdir(exist_ok=True)
 		
-		self.save_file = self.save_dir / 'save_data.pkl'
+		# Slot the game is currently played in (manual saves and its autosaves),
+		# None when the game has no slot and implicit saves are refused
+		self.active_slot = self.SLOTS[0]
+		
+		# Catalog of slot metadata, kept in memory and rewritten on every save
+		self.catalog_file = self.save_dir / 'catalog.json'
+		self.catalog_lock = threading.Lock()
+		self.catalog_write_lock = threading.Lock()
+		self.catalog = self._load_catalog()
+		
+		# Saves from before multi-slot support
+		self.single_save_file = self.save_dir / 'save_data.sav'
+		self.legacy_save_file = self.save_dir / 'save_data.pkl'
 		self.metadata_file = self.save_dir / 'save_metadata.json'
+		self._migrate_single_save()
+	
+	def slot_path(self, slot):
+		"""Get the save file path for a slot"""
+		return self.save_dir / f'{slot}.sav'
+	
+	def autosave_slots(self, owner):
+		"""Get the rotating autosave slots of a manual slot"""
+		return tuple(f'{owner}_auto{number}' for number in range(1, self.AUTOSAVES_PER_SLOT + 1))
+	
+	def all_slots(self):
+		"""Get every slot name: manual slots, then their autosaves"""
+		slots = list(self.SLOTS)
+		for owner in self.SLOTS:
+			slots.extend(self.autosave_slots(owner))
+		return tuple(slots)
+	
+	def slot_owner(self, slot):
+		"""
+		Get the manual slot a save belongs to
+		
+		Args:
+			slot (str): Manual or autosave slot
+		
+		Returns:
+			str: Owning manual slot, or None if the name is no known slot
+		"""
+		with self.catalog_lock:
+			entry = self.catalog['slots'].get(slot)
+		return self._entry_owner(slot, entry)
 	
-	def save_exists(self):
-		"""Check if a save file exists"""
-		return self.save_file.exists()
+	def save_exists(self, slot=None):
+		"""
+		Check if a save exists
+		
+		Args:
+			slot (str): Slot to check, None checks every slot
+		"""
+		with self.catalog_lock:
+			if slot is None:
+				return bool(self.catalog['slots'])
+			return slot in self.catalog['slots']
 	
-	def save_game(self, game_state):
+	def save_game(self, game_state, slot=None):
 		"""
 		Save the current game state
 		
 		Args:
 			game_state (dict): Dictionary containing game state data
 				Expected keys:
-				- player_monsters: dict of Monster objects
+				- player_monsters: dict of Monster objects or MonsterRecords
 				- player_position: tuple (x, y)
 				- current_map: str (map name)
 				- current_spawn: str (spawn position)
 				- game_time: float (total play time)
+			slot (str): Target slot, None uses the active slot and
+				SaveSystem.AUTOSAVE picks the active slot's next autosave slot
 		"""
 		try:
-			# Save the main game data
-			with open(self.save_file, 'wb') as f:
-				pickle.dump(game_state, f)
+			slot = self._resolve_slot(slot)
+			if slot is None:
+				print("Game not saved: no save slot belongs to this game")
+				return False
+			save_time = datetime.now().timestamp()
 			
-			# Save metadata (human-readable)
-			metadata = {
-				'save_date': datetime.now().isoformat(),
+			# Save the game data (encoded fully before touching the file)
+			self._write_atomic(self.slot_path(slot), encode_save(game_state, save_time))
+			
+			# Update the catalog entry for this slot only
+			monsters = game_state.get('player_monsters', {})
+			self._update_catalog(slot, {
+				'save_date': datetime.fromtimestamp(save_time).isoformat(),
+				'timestamp': save_time,
 				'game_version': '1.0',
-				'player_level': self._calculate_party_level(game_state.get('player_monsters', {})),
-				'monster_count': len(game_state.get('player_monsters', {})),
+				'player_level': self._calculate_party_level(monsters),
+				'monster_count': len(monsters),
 				'current_map': game_state.get('current_map', 'world'),
-				'playtime': game_state.get('game_time', 0.0)
-			}
-			
-			with open(self.metadata_file, 'w') as f:
-				json.dump(metadata, f, indent=2)
+				'playtime': game_state.get('game_time', 0.0),
+				'owner': self._owner_from_name(slot)
+			})
 			
-			print(f"Game saved successfully at {datetime.now().strftime('%H:%M:%S')}")
+			print(f"Game saved to {slot} at {datetime.now().strftime('%H:%M:%S')}")
 			return True
 			
 		except Exception as e:
@@ -65,22 +131,29 @@ class SaveSystem:
 			traceback.print_exc()
 			return False
 	
-	def load_game(self):
+	def load_game(self, slot=None):
 		"""
 		Load saved game state
 		
+		Args:
+			slot (str): Slot to load, None loads the most recent save
+		
 		Returns:
 			dict: Game state dictionary or None if load fails
 		"""
-		if not self.save_exists():
-			print("No save file found")
+		slot = slot or self.latest_slot()
+		game_state = self.load_save_data(slot)
+		if game_state is None:
 			return None
 		
 		try:
-			with open(self.save_file, 'rb') as f:
-				game_state = pickle.load(f)
+			game_state['player_monsters'] = {index: record_to_monster(record) 
+											 for index, record in game_state['player_monsters'].items()}
 			
-			print(f"Game loaded successfully")
+			# Keep saving into the slot the loaded game belongs to
+			self.active_slot = self.slot_owner(slot)
+			
+			print(f"Game loaded successfully from {slot}")
 			return game_state
 			
 		except Exception as e:
@@ -89,36 +162,239 @@ class SaveSystem:
 			traceback.print_exc()
 			return None
 	
-	def get_save_metadata(self):
+	def load_save_data(self, slot=None):
 		"""
-		Get save file metadata without loading the full save
+		Load saved game state as plain data, with monsters as MonsterRecords
+		
+		Args:
+			slot (str): Slot to load, None loads the most recent save
 		
 		Returns:
-			dict: Metadata or None if not available
+			dict: Game state dictionary or None if load fails
 		"""
-		if not self.metadata_file.exists():
+		slot = slot or self.latest_slot()
+		if slot is None or not self.save_exists(slot):
+			print("No save file found")
 			return None
 		
 		try:
-			with open(self.metadata_file, 'r') as f:
-				return json.load(f)
+			return decode_save(self.slot_path(slot).read_bytes())
+			
 		except Exception as e:
-			print(f"Error reading metadata: {e}")
+			print(f"Error loading game: {e}")
+			import traceback
+			traceback.print_exc()
 			return None
 	
-	def delete_save(self):
-		"""Delete the save file"""
+	def get_save_metadata(self, slot=None):
+		"""
+		Get save metadata from the in-memory catalog (no file is opened)
+		
+		Args:
+			slot (str): Slot to describe, None describes the most recent save
+		
+		Returns:
+			dict: Metadata or None if not available
+		"""
+		slot = slot or self.latest_slot()
+		with self.catalog_lock:
+			entry = self.catalog['slots'].get(slot)
+			return dict(entry) if entry else None
+	
+	def list_saves(self):
+		"""
+		Get quick previews of every slot from the catalog
+		
+		Returns:
+			list: (slot, metadata or None) for every slot in all_slots order
+		"""
+		with self.catalog_lock:
+			return [(slot, dict(self.catalog['slots'][slot]) if slot in self.catalog['slots'] else None) 
+					for slot in self.all_slots()]
+	
+	def free_slot(self):
+		"""
+		Get the first manual slot that holds no save and no autosave
+		
+		Returns:
+			str: Free slot, or None if every slot is taken (ask before overwriting one)
+		"""
+		with self.catalog_lock:
+			used = {self._entry_owner(slot, entry) for slot, entry in self.catalog['slots'].items()}
+		for slot in self.SLOTS:
+			if slot not in used:
+				return slot
+		return None
+	
+	def oldest_slot(self):
+		"""Get the least recently saved manual slot (the one offered for overwriting)"""
+		with self.catalog_lock:
+			slots = self.catalog['slots']
+			return min(self.SLOTS, key=lambda slot: slots[slot].get('timestamp', 0) if slot in slots else 0)
+	
+	def latest_slot(self):
+		"""Get the slot with the most recent save, or None"""
+		with self.catalog_lock:
+			slots = self.catalog['slots']
+			if not slots:
+				return None
+			return max(slots, key=lambda slot: slots[slot].get('timestamp', 0))
+	
+	def delete_save(self, slot=None):
+		"""
+		Delete a save
+		
+		Args:
+			slot (str): Slot to delete, None deletes every slot. Deleting a
+				manual slot also deletes its autosaves
+		"""
 		try:
-			if self.save_file.exists():
-				self.save_file.unlink()
-			if self.metadata_file.exists():
-				self.metadata_file.unlink()
+			if slot is None:
+				slots = list(self.all_slots())
+			elif slot in self.SLOTS:
+				with self.catalog_lock:
+					owned = [name for name, entry in self.catalog['slots'].items()
+							 if self._entry_owner(name, entry) == slot]
+					self.catalog['next_autosave'].pop(slot, None)
+				slots = [slot] + [name for name in owned if name != slot]
+			else:
+				slots = [slot]
+			for name in slots:
+				path = self.slot_path(name)
+				if path.exists():
+					path.unlink()
+				with self.catalog_lock:
+					self.catalog['slots'].pop(name, None)
+			self._write_catalog()
 			print("Save file deleted")
 			return True
 		except Exception as e:
 			print(f"Error deleting save: {e}")
 			return False
 	
+	def _resolve_slot(self, slot):
+		"""Turn None / AUTOSAVE into a concrete slot name"""
+		if slot is None:
+			return self.active_slot
+		if slot == self.AUTOSAVE:
+			# Rotate through the active slot's own autosaves only
+			owner = self.active_slot
+			if owner is None:
+				return None
+			slots = self.autosave_slots(owner)
+			with self.catalog_lock:
+				index = self.catalog['next_autosave'].get(owner, 0) % len(slots)
+				self.catalog['next_autosave'][owner] = (index + 1) % len(slots)
+			return slots[index]
+		return slot
+	
+	def _owner_from_name(self, slot):
+		"""Manual slot encoded in a slot name ('slot2' and 'slot2_auto1' -> 'slot2')"""
+		owner = slot.partition('_auto')[0]
+		return owner if owner in self.SLOTS else None
+	
+	def _entry_owner(self, slot, entry):
+		"""Owning manual slot of a catalog entry, falling back to the slot name"""
+		if entry and entry.get('owner') in self.SLOTS:
+			return entry['owner']
+		return self._owner_from_name(slot)
+	
+	def _load_catalog(self):
+		"""Read the catalog, rebuilding it from save headers if it is missing or broken"""
+		if self.catalog_file.exists():
+			try:
+				with open(self.catalog_file, 'r') as f:
+					catalog = json.load(f)
+				catalog.setdefault('slots', {})
+				catalog.setdefault('next_autosave', {})
+				return catalog
+			except Exception as e:
+				print(f"Error reading save catalog, rebuilding: {e}")
+		
+		catalog = {'version': 1, 'next_autosave': {}, 'slots': {}}
+		for slot in self.all_slots():
+			path = self.slot_path(slot)
+			if path.exists():
+				try:
+					catalog['slots'][slot] = self._summary_entry(path, slot)
+				except Exception as e:
+					print(f"Skipping unreadable save {path.name}: {e}")
+		return catalog
+	
+	def _summary_entry(self, path, slot):
+		"""Build a catalog entry for a slot from its save file header"""
+		summary = read_summary(path)
+		count = summary['monster_count']
+		return {
+			'save_date': datetime.fromtimestamp(summary['save_time']).isoformat(),
+			'timestamp': summary['save_time'],
+			'game_version': '1.0',
+			'player_level': summary['level_sum'] // count if count else 0,
+			'monster_count': count,
+			'current_map': summary['current_map'],
+			'playtime': summary['game_time'],
+			'owner': self._owner_from_name(slot)
+		}
+	
+	def _update_catalog(self, slot, entry):
+		"""Replace one slot entry and persist the catalog"""
+		with self.catalog_lock:
+			self.catalog['slots'][slot] = entry
+		self._write_catalog()
+	
+	def _write_catalog(self):
+		"""Persist the in-memory catalog"""
+		with self.catalog_write_lock:
+			with self.catalog_lock:
+				data = json.dumps(self.catalog, indent=2).encode('utf-8')
+			self._write_atomic(self.catalog_file, data)
+	
+	def _migrate_single_save(self):
+		"""Move a single-file save from before multi-slot support into the first slot"""
+		slot = self.SLOTS[0]
+		if self.save_exists(slot):
+			return
+		
+		try:
+			if self.single_save_file.exists():
+				os.replace(self.single_save_file, self.slot_path(slot))
+			elif self.legacy_save_file.exists():
+				state = decode_legacy_pickle(self.legacy_save_file.read_bytes())
+				self._write_atomic(self.slot_path(slot), encode_save(state, state.get('save_time')))
+				self.legacy_save_file.unlink()
+			else:
+				return
+			
+			if self.metadata_file.exists():
+				self.metadata_file.unlink()
+			self._update_catalog(slot, self._summary_entry(self.slot_path(slot), slot))
+			print(f"Migrated existing save to {slot}")
+		except Exception as e:
+			print(f"Error migrating existing save: {e}")
+	
+	def _write_atomic(self, path, data):
+		"""
+		Write bytes to a file so that it is either fully replaced or left untouched
+		
+		Args:
+			path (Path): Target file
+			data (bytes): File contents
+		"""
+		temp_path = path.with_name(path.name + '.tmp')
+		with open(temp_path, 'wb') as f:
+			f.write(data)
+			f.flush()
+			os.fsync(f.fileno())
+		os.replace(temp_path, path)
+		
+		# Persist the rename itself (not supported on Windows)
+		if hasattr(os, 'O_DIRECTORY'):
+			dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+			try:
+				os.fsync(dir_fd)
+			finally:
+				os.close(dir_fd)
+	
 	def _calculate_party_level(self, monsters):
 		"""Calculate average party level"""
 		if not monsters:
@@ -126,13 +402,13 @@ class SaveSystem:
 		total = sum(monster.level for monster in monsters.values())
 		return total // len(monsters)
 	
-	def export_to_json(self, filename='save_export.json'):
+	def export_to_json(self, filename='save_export.json', slot=None):
 		"""Export save data to JSON format (for debugging/backup)"""
-		if not self.save_exists():
+		if not self.save_exists(slot):
 			return False
 		
 		try:
-			game_state = self.load_game()
+			game_state = self.load_save_data(slot)
 			
 			# Convert to JSON-serializable format
 			exportable = {
@@ -143,7 +419,7 @@ class SaveSystem:
 				'monsters': {}
 			}
 			
-			# Export monster data
+			# Export monster data (records, no Monster objects are built)
 			for idx, monster in game_state.get('player_monsters', {}).items():
 				exportable['monsters'][idx] = {
 					'name': monster.name,
@@ -165,9 +441,83 @@ class SaveSystem:
 			return False
 
 
+class SaveWriter:
+	"""Writes saves on a background thread so saving never blocks a frame"""
+	
+	def __init__(self, save_system):
+		"""
+		Start the writer thread
+		
+		Args:
+			save_system (SaveSystem): Save system used to write the files
+		"""
+		self.save_system = save_system
+		self.pending = None  # Latest snapshot waiting to be written
+		self.busy = False
+		self.running = True
+		self.last_result = None
+		self.condition = threading.Condition()
+		
+		self.thread = threading.Thread(target=self._worker, name='SaveWriter', daemon=True)
+		self.thread.start()
+	
+	def submit(self, game_state, slot=None):
+		"""
+		Queue a snapshot for writing. A snapshot that has not been written yet
+		is replaced, so only the newest state ever reaches the disk.
+		
+		Args:
+			game_state (dict): Snapshot from create_game_state_snapshot
+			slot (str): Target slot (see SaveSystem.save_game)
+		"""
+		with self.condition:
+			self.pending = (game_state, slot)
+			self.condition.notify_all()
+	
+	def flush(self, timeout=None):
+		"""
+		Wait until every submitted snapshot has been written
+		
+		Args:
+			timeout (float): Maximum seconds to wait, None waits forever
+		
+		Returns:
+			bool: True if the writer is idle
+		"""
+		with self.condition:
+			return self.condition.wait_for(lambda: self.pending is None and not self.busy, timeout)
+	
+	def close(self):
+		"""Write any pending snapshot and stop the thread"""
+		self.flush()
+		with self.condition:
+			self.running = False
+			self.condition.notify_all()
+		self.thread.join()
+	
+	def _worker(self):
+		"""Thread loop: serialize, fsync and atomically replace the save"""
+		while True:
+			with self.condition:
+				self.condition.wait_for(lambda: self.pending is not None or not self.running)
+				if self.pending is None:
+					return
+				(game_state, slot), self.pending = self.pending, None
+				self.busy = True
+			
+			result = self.save_system.save_game(game_state, slot)
+			
+			with self.condition:
+				self.last_result = result
+				self.busy = False
+				self.condition.notify_all()
+
+
 def create_game_state_snapshot(game):
 	"""
-	Create a snapshot of the current game state for saving
+	Create a snapshot of the current game state for saving.
+	Monsters are captured as immutable MonsterRecords so the snapshot is
+	detached from the live game and can be encoded on another thread.
 	
 	Args:
 		game: The Game instance
@@ -176,7 +526,7 @@ def create_game_state_snapshot(game):
 		dict: Game state snapshot
 	"""
 	state = {
-		'player_monsters': game.player_monsters,
+		'player_monsters': {index: monster_to_record(monster) for index, monster in game.player_monsters.items()},
 		'current_map': 'world',  # Will be updated when map tracking is added
 		'current_spawn': 'house',  # Will be updated when position tracking is added
 		'game_time': 0.0,  # Will track total playtime
@@ -214,7 +564,7 @@ def apply_game_state(game, state):
 	try:
 		# Restore player monsters
 		if 'player_monsters' in state:
-			game.player_monsters = state['player_monsters']
+			game.player_monsters = MonsterParty(state['player_monsters'])
 		
 		# Restore map and position
 		current_map = state.get('current_map', 'world')
@@ -10,6 +10,24 @@ TILE_SIZE = 64
 ANIMATION_SPEED = 6
 BATTLE_OUTLINE_WIDTH = 4
 
+# Pre-decode the menu video once into videos/cache (about 2.7 MB per frame at 1280x720)
+MENU_VIDEO_FRAME_CACHE = False
+# Keep pre-scaled splash/loading GIF frames in graphics/cache for instant later starts
+GIF_FRAME_CACHE = False
+# 'gpu' draws world sprites as textures when a hardware renderer exists, else 'software'
+RENDER_BACKEND = 'software'
+# Write a battle log to replays/ after every battle (play it back with battle_replay.py)
+SAVE_BATTLE_REPLAYS = False
+# Master seed of the random streams in rng.py (None picks a new one every start)
+RNG_SEED = None
+
+# Render queue layers - drawn in this order, submission order within a layer
+RENDER_LAYERS = {
+	'world': 0,
+	'ui': 1,
+	'transition': 2
+}
+
 # Color Palette - Using tuples for better performance in Pygame CE 2.5.5
 COLORS = {
 	'white': '#f4fefa', 
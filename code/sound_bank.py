@@ -0,0 +1,149 @@
+"""
+Sound Bank for Monster Hunter
+Compatible with Pygame CE 2.5.5 and Python 3.13.7
+Streams music tracks through pygame.mixer.music and loads sound effects on
+first use into a small LRU cache, with pinned entries for hot sounds
+"""
+
+from settings import *
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+from os import walk
+
+# Long looping tracks - streamed from disk instead of decoded into memory
+MUSIC_TRACKS = ('overworld', 'battle', 'menu', 'menu_music')
+AUDIO_EXTENSIONS = ('.wav', '.mp3', '.ogg')
+
+class MusicTrack:
+	"""Sound-like handle for a track streamed through pygame.mixer.music.
+	Only one track streams at a time; playing a track replaces the current one."""
+	playing = None  # Track currently loaded into the music stream
+
+	def __init__(self, path, volume=1.0):
+		"""
+		Args:
+			path: Audio file
+			volume: Track volume (0.0 - 1.0)
+		"""
+		self.path = Path(path)
+		self.volume = volume
+
+	def play(self, loops=0, fade_ms=0):
+		"""Start streaming the track (loops=-1 repeats forever)"""
+		try:
+			pygame.mixer.music.load(str(self.path))
+			pygame.mixer.music.set_volume(self.volume)
+			pygame.mixer.music.play(loops, fade_ms=fade_ms)
+			MusicTrack.playing = self
+		except pygame.error as e:
+			print(f"Error streaming music {self.path.name}: {e}")
+
+	def stop(self):
+		"""Stop the track if it is the one streaming"""
+		if MusicTrack.playing is self:
+			pygame.mixer.music.stop()
+			pygame.mixer.music.unload()
+			MusicTrack.playing = None
+
+	def set_volume(self, volume):
+		"""Set the track volume (applied immediately while it streams)"""
+		self.volume = volume
+		if MusicTrack.playing is self:
+			pygame.mixer.music.set_volume(volume)
+
+	def get_volume(self):
+		"""Track volume"""
+		return self.volume
+
+	def get_busy(self):
+		"""True while this track is streaming"""
+		return MusicTrack.playing is self and pygame.mixer.music.get_busy()
+
+class SoundBank(Mapping):
+	"""Dict-like audio lookup by file name without extension. Only file paths
+	are collected up front; sounds are decoded when first requested."""
+
+	def __init__(self, *path, cache_size=24, music=MUSIC_TRACKS):
+		"""
+		Scan an audio folder
+
+		Args:
+			*path: Folder path parts
+			cache_size: Number of unpinned sound effects kept loaded
+			music: Names that are streamed as MusicTrack instead of loaded
+		"""
+		self.paths = {}
+		self.tracks = {}
+		self.cache_size = cache_size
+		self.sounds = OrderedDict()  # LRU of loaded sound effects
+		self.pinned = {}  # Pre-warmed sound effects, never evicted
+
+		folder_path = Path(*path)
+		if not folder_path.exists():
+			print(f"Warning: Folder not found: {folder_path}")
+			return
+
+		for root, _, file_names in walk(str(folder_path)):
+			for file_name in file_names:
+				# Skip hidden files (like .DS_Store on macOS)
+				if file_name.startswith('.') or not file_name.endswith(AUDIO_EXTENSIONS):
+					continue
+				name = file_name.split('.')[0]
+				self.paths[name] = Path(root) / file_name
+				if name in music:
+					self.tracks[name] = MusicTrack(self.paths[name])
+
+	def load(self, name):
+		"""Decode a sound effect"""
+		return pygame.mixer.Sound(str(self.paths[name]))
+
+	def __getitem__(self, name):
+		if name in self.tracks:
+			return self.tracks[name]
+		if name in self.pinned:
+			return self.pinned[name]
+
+		sound = self.sounds.get(name)
+		if sound is not None:
+			self.sounds.move_to_end(name)
+			return sound
+
+		sound = self.load(name)
+		self.sounds[name] = sound
+		if len(self.sounds) > self.cache_size:
+			self.sounds.popitem(last=False)
+		return sound
+
+	def get(self, name, default=None):
+		"""Sound for a name, or default if it is missing or fails to load"""
+		if name not in self.paths:
+			return default
+		try:
+			return self[name]
+		except pygame.error as e:
+			print(f"Error loading audio {name}: {e}")
+			return default
+
+	def __contains__(self, name):
+		return name in self.paths
+
+	def __iter__(self):
+		return iter(self.paths)
+
+	def __len__(self):
+		return len(self.paths)
+
+	def prewarm(self, names):
+		"""
+		Load sound effects now and keep them loaded (e.g. attack sounds used mid-battle)
+
+		Args:
+			names: Sound names, missing ones are ignored
+		"""
+		for name in names:
+			if name in self.paths and name not in self.tracks and name not in self.pinned:
+				try:
+					self.pinned[name] = self.sounds.pop(name, None) or self.load(name)
+				except pygame.error as e:
+					print(f"Error loading audio {name}: {e}")
@@ -4,6 +4,8 @@ Splash Screen - Shows GIF background for 5 seconds then fades to menu
 import pygame
 from pathlib import Path
 from settings import *
+from animated_image import AnimatedImage
+from render_queue import apply_tint
 
 # Try to import PIL for GIF support
 try:
@@ -25,16 +27,13 @@ class SplashScreen:
 		self.fade_duration = 1.0  # Fade out over 1 second
 		self.fade_alpha = 0  # Start fully visible
 		
-		# GIF animation
+		# GIF animation (streamed) and fallback frames
+		self.player = None
 		self.gif_frames = []
 		self.current_frame_index = 0
 		self.frame_duration = 0.1
 		self.frame_timer = 0.0
 		self.load_splash_gif()
-		
-		# Fade overlay
-		self.fade_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-		self.fade_surface.fill((0, 0, 0))
 	
 	def load_splash_gif(self):
 		"""Load splash GIF animation"""
@@ -48,39 +47,9 @@ class SplashScreen:
 				return
 			
 			if gif_path.exists():
-				print(f"Loading splash GIF: {gif_path}")
-				
-				# Open GIF with PIL
-				gif = Image.open(str(gif_path))
-				
-				# Extract all frames
-				frame_count = 0
-				try:
-					while True:
-						# Convert PIL image to pygame surface
-						frame = gif.convert('RGBA')
-						
-						# Scale to full screen
-						frame = frame.resize((WINDOW_WIDTH, WINDOW_HEIGHT), Image.Resampling.LANCZOS)
-						
-						# Convert to pygame surface
-						mode = frame.mode
-						size = frame.size
-						data = frame.tobytes()
-						
-						py_image = pygame.image.fromstring(data, size, mode)
-						self.gif_frames.append(py_image)
-						
-						frame_count += 1
-						gif.seek(gif.tell() + 1)
-				except EOFError:
-					pass  # End of GIF frames
-				
-				print(f"Loaded {frame_count} frames from splash GIF")
-				
-				# Set frame duration based on GIF info
-				if hasattr(gif, 'info') and 'duration' in gif.info:
-					self.frame_duration = gif.info['duration'] / 1000.0
+				# Frames are decoded on a worker just ahead of playback
+				print(f"Streaming splash GIF: {gif_path}")
+				self.player = AnimatedImage(gif_path, disk_cache=GIF_FRAME_CACHE)
 				
 			else:
 				print(f"Splash GIF not found at {gif_path}, using fallback")
@@ -111,7 +80,9 @@ class SplashScreen:
 		self.elapsed_time += dt
 		
 		# Update GIF animation
-		if self.gif_frames:
+		if self.player:
+			self.player.update(dt)
+		elif self.gif_frames:
 			self.frame_timer += dt
 			if self.frame_timer >= self.frame_duration:
 				self.frame_timer -= self.frame_duration
@@ -126,6 +97,7 @@ class SplashScreen:
 			# Check if fade is complete
 			if self.fade_alpha >= 255:
 				self.active = False
+				self.cleanup()
 				return False
 		
 		return True  # Still showing
@@ -133,15 +105,21 @@ class SplashScreen:
 	def draw(self):
 		"""Draw splash screen"""
 		# Draw GIF as full-screen background
-		if self.gif_frames:
+		if self.player and self.player.current_frame:
+			self.player.draw(self.display_surface)
+		elif self.gif_frames:
 			current_frame = self.gif_frames[self.current_frame_index]
 			self.display_surface.blit(current_frame, (0, 0))
 		
-		# Draw fade overlay if fading
-		if self.fade_alpha > 0:
-			self.fade_surface.set_alpha(self.fade_alpha)
-			self.display_surface.blit(self.fade_surface, (0, 0))
+		# Fade to black (blend fill, no-op before the fade starts)
+		apply_tint(self.display_surface, (0, 0, 0), self.fade_alpha)
 	
 	def is_complete(self):
 		"""Check if splash screen is complete"""
 		return not self.active
+	
+	def cleanup(self):
+		"""Stop GIF decoding and release its frames"""
+		if self.player:
+			self.player.cleanup()
+			self.player = None
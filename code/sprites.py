@@ -4,7 +4,7 @@ Compatible with Pygame CE 2.5.5 and Python 3.13.7
 """
 
 from settings import * 
-from random import uniform
+from rng import get_stream
 from support import draw_bar
 from timer import Timer
 
@@ -57,14 +57,14 @@ class AnimatedSprite(Sprite):
 
 # Battle sprites 
 class MonsterSprite(pygame.sprite.Sprite):
-	def __init__(self, pos, frames, groups, monster, index, pos_index, entity, apply_attack, create_monster):
+	def __init__(self, pos, frames, groups, monster, index, pos_index, entity, apply_attack, create_monster, clock=pygame.time.get_ticks):
 		# data
 		self.index = index 
 		self.pos_index = pos_index
 		self.entity = entity
 		self.monster = monster
 		self.frame_index, self.frames, self.state = 0, frames, 'idle'
-		self.animation_speed = ANIMATION_SPEED + uniform(-1, 1)
+		self.animation_speed = ANIMATION_SPEED + get_stream('cosmetics').uniform(-1, 1)
 		self.z = BATTLE_LAYERS['monster']
 		self.highlight = False
 		self.target_sprite = None
@@ -80,8 +80,8 @@ class MonsterSprite(pygame.sprite.Sprite):
 
 		# timers 
 		self.timers = {
-			'remove highlight': Timer(300, func=lambda: self.set_highlight(False)),
-			'kill': Timer(600, func=self.destroy)
+			'remove highlight': Timer(300, func=lambda: self.set_highlight(False), clock=clock),
+			'kill': Timer(600, func=self.destroy, clock=clock)
 		}
 		
 		# Next monster data
@@ -229,10 +229,10 @@ class AttackSprite(AnimatedSprite):
 		self.animate(dt)
 
 class TimedSprite(Sprite):
-	def __init__(self, pos, surf, groups, duration):
+	def __init__(self, pos, surf, groups, duration, clock=pygame.time.get_ticks):
 		super().__init__(pos, surf, groups, z=BATTLE_LAYERS['overlay'])
 		self.rect.center = pos
-		self.death_timer = Timer(duration, autostart=True, func=self.kill)
+		self.death_timer = Timer(duration, autostart=True, func=self.kill, clock=clock)
 
 	def update(self, _):
 		self.death_timer.update()
\ No newline at end of file
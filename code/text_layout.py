@@ -0,0 +1,180 @@
+"""
+Text Layout for Monster Hunter
+Compatible with Pygame CE 2.5.5 and Python 3.13.7
+Word wrapping, pagination and typewriter reveal for dialog text. Lines are
+rendered once; revealing characters only changes the area that is blitted
+"""
+
+from settings import *
+from text_render import SurfaceCache
+
+line_cache = SurfaceCache(256)
+
+def wrap_text(text, font, width):
+	"""
+	Split text into lines that fit a width
+
+	Args:
+		text (str): Text to wrap, explicit newlines start a new line
+		font (pygame.Font): Font used for measuring
+		width (int): Maximum line width in pixels
+
+	Returns:
+		list: Lines of text
+	"""
+	lines = []
+	for paragraph in text.split('\n'):
+		line = ''
+		for word in paragraph.split(' '):
+			candidate = f'{line} {word}' if line else word
+			if font.size(candidate)[0] <= width:
+				line = candidate
+				continue
+
+			if line:
+				lines.append(line)
+			# Words wider than the box are broken between characters
+			while font.size(word)[0] > width and len(word) > 1:
+				cut = len(word) - 1
+				while cut > 1 and font.size(word[:cut])[0] > width:
+					cut -= 1
+				lines.append(word[:cut])
+				word = word[cut:]
+			line = word
+		lines.append(line)
+	return lines
+
+class TextLayout:
+	"""Wrapped and paginated text with one cached surface per line"""
+
+	def __init__(self, text, font, width, max_lines=None, color=COLORS['white'], antialias=False, line_spacing=4):
+		"""
+		Lay out text
+
+		Args:
+			text (str): Text to lay out
+			font (pygame.Font): Font to render with
+			width (int): Maximum line width in pixels
+			max_lines (int): Lines per page, None for a single page
+			color: Text color
+			antialias (bool): Render with antialiasing
+			line_spacing (int): Extra pixels between lines
+		"""
+		self.font = font
+		self.lines = wrap_text(text, font, width)
+		self.line_height = font.get_linesize() + line_spacing
+
+		# Render every line once (shared with other layouts of the same text)
+		color = pygame.Color(color)
+		self.line_surfs = [line_cache.get((line, font, tuple(color), antialias),
+										  lambda line=line: font.render(line, antialias, color))
+						   for line in self.lines]
+		# Pixel width of every prefix of every line - the typewriter clip widths
+		self.prefix_widths = [[font.size(line[:length])[0] for length in range(len(line) + 1)]
+							  for line in self.lines]
+
+		per_page = max_lines or len(self.lines)
+		self.pages = [range(start, min(start + per_page, len(self.lines)))
+					  for start in range(0, len(self.lines), per_page)]
+
+	def page_length(self, page):
+		"""Number of characters on a page"""
+		return sum(len(self.lines[index]) for index in self.pages[page])
+
+	def draw(self, surface, pos, page=0, visible_chars=None):
+		"""
+		Draw a page, optionally only its first characters
+
+		Args:
+			surface: Target surface
+			pos: Top left of the text area
+			page (int): Page to draw
+			visible_chars (int): Characters to show, None for the whole page
+		"""
+		x, y = pos
+		remaining = self.page_length(page) if visible_chars is None else visible_chars
+		for index in self.pages[page]:
+			if remaining <= 0:
+				break
+			line_surf = self.line_surfs[index]
+			length = len(self.lines[index])
+			if remaining >= length:
+				surface.blit(line_surf, (x, y))
+			else:
+				# Partially revealed line: blit only the revealed part of the cached line
+				area = pygame.Rect(0, 0, self.prefix_widths[index][remaining], line_surf.get_height())
+				surface.blit(line_surf, (x, y), area)
+			remaining -= length
+			y += self.line_height
+
+class Typewriter:
+	"""Reveals a TextLayout page by page at a fixed character rate"""
+
+	def __init__(self, layout, chars_per_second=45):
+		"""
+		Initialize typewriter
+
+		Args:
+			layout (TextLayout): Text to reveal
+			chars_per_second (float): Reveal speed, 0 shows pages at once
+		"""
+		self.layout = layout
+		self.chars_per_second = chars_per_second
+		self.page = 0
+		self.revealed = 0.0
+		self.visible_chars = 0
+		if not chars_per_second:
+			self.reveal_page()
+
+	@property
+	def page_complete(self):
+		"""True when every character of the current page is visible"""
+		return self.visible_chars >= self.layout.page_length(self.page)
+
+	@property
+	def last_page(self):
+		"""True when the current page is the last one"""
+		return self.page >= len(self.layout.pages) - 1
+
+	def update(self, dt):
+		"""
+		Reveal more characters
+
+		Args:
+			dt: Time since the last update in seconds
+
+		Returns:
+			bool: True if the visible text changed
+		"""
+		if self.page_complete:
+			return False
+		self.revealed += self.chars_per_second * dt
+		visible = min(int(self.revealed), self.layout.page_length(self.page))
+		changed = visible != self.visible_chars
+		self.visible_chars = visible
+		return changed
+
+	def reveal_page(self):
+		"""Show the rest of the current page immediately"""
+		self.visible_chars = self.layout.page_length(self.page)
+		self.revealed = float(self.visible_chars)
+
+	def next_page(self):
+		"""
+		Move to the next page
+
+		Returns:
+			bool: False if there is no next page
+		"""
+		if self.last_page:
+			return False
+		self.page += 1
+		self.revealed = 0.0
+		self.visible_chars = 0
+		if not self.chars_per_second:
+			self.reveal_page()
+		return True
+
+	def draw(self, surface, pos):
+		"""Draw the revealed part of the current page"""
+		self.layout.draw(surface, pos, self.page, self.visible_chars)
@@ -0,0 +1,87 @@
+"""
+Text Rendering Cache for Monster Hunter
+Compatible with Pygame CE 2.5.5 and Python 3.13.7
+Outlined text rendered once by mask dilation and kept in an LRU cache
+"""
+
+from settings import *
+from collections import OrderedDict
+
+class SurfaceCache:
+	"""Small least-recently-used cache of surfaces"""
+
+	def __init__(self, max_entries=128):
+		"""
+		Initialize cache
+
+		Args:
+			max_entries: Number of surfaces kept before the oldest is dropped
+		"""
+		self.max_entries = max_entries
+		self.entries = OrderedDict()
+		self.hits = 0
+		self.misses = 0
+
+	def get(self, key, create):
+		"""
+		Get a cached surface or create and store it
+
+		Args:
+			key: Hashable cache key
+			create: Callable without arguments that builds the surface
+
+		Returns:
+			The cached surface (shared - do not draw on it or change its alpha)
+		"""
+		surf = self.entries.get(key)
+		if surf is not None:
+			self.entries.move_to_end(key)
+			self.hits += 1
+			return surf
+
+		self.misses += 1
+		surf = create()
+		self.entries[key] = surf
+		if len(self.entries) > self.max_entries:
+			self.entries.popitem(last=False)
+		return surf
+
+	def clear(self):
+		"""Drop all cached surfaces"""
+		self.entries.clear()
+
+outline_cache = SurfaceCache(128)
+
+def _render_outlined(text, font, text_color, outline_color, outline_width):
+	"""Render text and grow its outline from the glyph mask in one pass"""
+	text_surf = font.render(text, True, text_color)
+	if outline_width <= 0:
+		return text_surf
+
+	# Dilating the glyph mask by a filled square kernel gives every pixel
+	# within outline_width of the text - the same shape as blitting the text
+	# at each offset, without rendering it (2w + 1)^2 times
+	size = outline_width * 2 + 1
+	outline_mask = pygame.mask.from_surface(text_surf).convolve(pygame.mask.Mask((size, size), fill=True))
+	outline_surf = outline_mask.to_surface(setcolor=outline_color, unsetcolor=(0, 0, 0, 0))
+
+	# Draw the main text on top
+	outline_surf.blit(text_surf, (outline_width, outline_width))
+	return outline_surf
+
+def render_outlined_text(text, font, text_color, outline_color, outline_width=2):
+	"""
+	Render text with an outline, reusing earlier results
+
+	Args:
+		text (str): Text to render
+		font (pygame.Font): Font to use
+		text_color (tuple): RGB color for text
+		outline_color (tuple): RGB color for outline
+		outline_width (int): Width of outline in pixels
+
+	Returns:
+		pygame.Surface: Shared surface with the outlined text (copy it before changing it)
+	"""
+	key = (text, font, tuple(pygame.Color(text_color)), tuple(pygame.Color(outline_color)), outline_width)
+	return outline_cache.get(key, lambda: _render_outlined(text, font, text_color, outline_color, outline_width))
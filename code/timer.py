@@ -9,7 +9,7 @@ from pygame.time import get_ticks
 class Timer:
 	"""A timer that can trigger a callback function after a duration"""
 	
-	def __init__(self, duration, repeat=False, autostart=False, func=None):
+	def __init__(self, duration, repeat=False, autostart=False, func=None, clock=get_ticks):
 		"""
 		Initialize timer
 		
@@ -18,7 +18,10 @@ class Timer:
 			repeat: Whether timer should restart after triggering
 			autostart: Whether to start timer immediately
 			func: Callback function to call when timer completes
+			clock: Function returning the current time in milliseconds
+				(e.g. a battle's own clock so replays run at any speed)
 		"""
+		self.clock = clock
 		self.duration = duration
 		self.start_time = 0
 		self.active = False
@@ -31,7 +34,7 @@ class Timer:
 	def activate(self):
 		"""Start or restart the timer"""
 		self.active = True
-		self.start_time = get_ticks()
+		self.start_time = self.clock()
 
 	def deactivate(self):
 		"""Stop the timer and optionally restart if repeat is True"""
@@ -44,7 +47,7 @@ class Timer:
 	def update(self):
 		"""Update timer state - call this every frame"""
 		if self.active:
-			current_time = get_ticks()
+			current_time = self.clock()
 			if current_time - self.start_time >= self.duration:
 				# Timer completed - call callback if it exists
 				if self.func:
@@ -55,19 +58,19 @@ class Timer:
 	def elapsed(self):
 		"""Get elapsed time in milliseconds since timer started"""
 		if self.active:
-			return get_ticks() - self.start_time
+			return self.clock() - self.start_time
 		return 0
 	
 	@property
 	def remaining(self):
 		"""Get remaining time in milliseconds until timer triggers"""
 		if self.active:
-			return max(0, self.duration - (get_ticks() - self.start_time))
+			return max(0, self.duration - (self.clock() - self.start_time))
 		return 0
 	
 	@property
 	def progress(self):
 		"""Get progress as a value between 0.0 and 1.0"""
 		if self.active and self.duration > 0:
-			return min(1.0, (get_ticks() - self.start_time) / self.duration)
+			return min(1.0, (self.clock() - self.start_time) / self.duration)
 		return 0.0
\ No newline at end of file